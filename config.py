@@ -19,6 +19,11 @@ LOG_DIR = os.path.join(BASE_DIR, 'logs')
 LOG_FILE_NAME = 'app.log'
 LOG_FILE_PATH = os.path.join(LOG_DIR, LOG_FILE_NAME)
 
+# QSS 테마 파일 경로 (styles/*.qss - 파일이 없으면 기본 스타일 사용)
+STYLE_DIR = os.path.join(BASE_DIR, 'styles')
+QSS_LIGHT_PATH = os.path.join(STYLE_DIR, 'light_theme.qss')
+QSS_DARK_PATH = os.path.join(STYLE_DIR, 'dark_theme.qss')
+
 
 # === 2. 로깅 설정 (Logging Settings) ===
 
@@ -1,3 +1,4 @@
+from database.db_connection import DBConnection
 from models.settings_model import SettingsModel
 from models.word_model import WordModel
 from models.statistics_model import StatisticsModel
@@ -18,25 +19,65 @@ class BaseController:
     애플리케이션의 핵심 모델 인스턴스들을 초기화하고 접근할 수 있도록 제공합니다.
     """
     
+    # 모든 컨트롤러가 공유하는 모델 인스턴스 캐시 (클래스 레벨)
+    # DB 상태는 Singleton DBConnection으로 이미 공유되므로 모델도 한 번만 생성합니다.
+    _shared_models: Dict[str, Any] = {}
+
+    # 지연 생성용 팩토리 맵: 각 모델은 첫 속성 접근 시점에 생성됩니다.
+    # SettingsModel의 DB 초기화 로직도 설정이 처음 필요해질 때 실행됩니다.
+    _MODEL_FACTORIES = {
+        'settings_model': SettingsModel,
+        'word_model': WordModel,
+        'statistics_model': StatisticsModel,
+        'learning_model': LearningModel,
+        'exam_model': ExamModel,
+    }
+
+    @classmethod
+    def _get_shared_model(cls, key: str, factory) -> Any:
+        """
+        공유 모델 인스턴스를 반환합니다. 최초 요청 시에만 생성합니다.
+        """
+        if key not in cls._shared_models:
+            cls._shared_models[key] = factory()
+        return cls._shared_models[key]
+
     def __init__(self):
-        # 핵심 모델 인스턴스 초기화
-        # SettingsModel은 최초 실행 시 DB 초기화 로직을 포함하므로 먼저 초기화합니다.
-        self.settings_model: SettingsModel = SettingsModel()
-        self.word_model: WordModel = WordModel()
-        self.statistics_model: StatisticsModel = StatisticsModel()
-        self.learning_model: LearningModel = LearningModel()
-        self.exam_model: ExamModel = ExamModel()
-        
-        LOGGER.info("BaseController initialized and all core models instantiated.")
+        # DB 연결은 프로세스 수명 동안 한 번만 열고 유지합니다.
+        # (모델의 connect() 호출은 멱등 가드일 뿐, 매번 열고 닫지 않음)
+        DBConnection().connect()
+
+        # 모델 인스턴스는 __getattr__에서 지연 생성 (앱 시작 비용 절감)
+        # 설정값 캐시: 설정은 자주 읽히지만 거의 변경되지 않으므로 메모이제이션
+        self._settings_cache: Optional[Dict[str, Any]] = None
+
+        LOGGER.info("BaseController initialized (models are created lazily on first access).")
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        모델 속성(word_model 등)에 처음 접근할 때 공유 캐시에서 가져와
+        인스턴스 속성으로 고정합니다. 이후 접근은 일반 속성 조회입니다.
+        """
+        factory = self._MODEL_FACTORIES.get(name)
+        if factory is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        instance = self._get_shared_model(name, factory)
+        object.__setattr__(self, name, instance)
+        return instance
 
     # --- 공통 유틸리티 기능 (모든 컨트롤러가 사용할 수 있는) ---
 
     def get_current_settings(self) -> Dict[str, Any]:
         """
         현재 애플리케이션의 모든 설정값을 딕셔너리 형태로 반환합니다.
+        최초 호출 시 DB에서 읽어 캐시하고, 이후에는 캐시를 반환합니다.
         """
+        if self._settings_cache is not None:
+            return self._settings_cache
+
         try:
-            return self.settings_model.get_all_settings()
+            self._settings_cache = self.settings_model.get_all_settings()
+            return self._settings_cache
         except Exception as e:
             LOGGER.error(f"Failed to fetch current settings: {e}")
             # 설정값 로드 실패 시, 안전을 위해 빈 딕셔너리 반환 (또는 config.py의 기본값)
@@ -44,10 +85,10 @@ class BaseController:
 
     def get_setting_value(self, key: str) -> Optional[Any]:
         """
-        특정 설정 키의 값을 반환합니다.
+        특정 설정 키의 값을 반환합니다. (캐시 우선 조회)
         """
         try:
-            return self.settings_model.get_setting(key)
+            return self.get_current_settings().get(key)
         except Exception as e:
             LOGGER.error(f"Failed to fetch setting key '{key}': {e}")
             return None
@@ -55,20 +96,30 @@ class BaseController:
     def update_app_setting(self, key: str, value: Any) -> bool:
         """
         사용자 설정값을 업데이트하고 성공 여부를 반환합니다.
+        성공 시 캐시도 함께 갱신하여 무효화 없이 일관성을 유지합니다.
         """
         try:
             success = self.settings_model.update_setting(key, value)
             if success:
+                if self._settings_cache is not None:
+                    self._settings_cache[key] = value
                 LOGGER.info(f"Setting '{key}' updated to '{value}'.")
             return success
         except Exception as e:
             LOGGER.error(f"Failed to update setting '{key}': {e}")
             return False
 
+    def invalidate_settings_cache(self):
+        """
+        설정 캐시를 무효화합니다. (이 컨트롤러를 거치지 않은 외부 변경 시 호출)
+        """
+        self._settings_cache = None
+
     def close_all_db_connections(self):
         """
         애플리케이션 종료 전 모든 모델이 공유하는 DB 연결을 닫습니다.
         """
         # BaseModel에 의해 DBConnection은 Singleton이므로, 한 번만 닫으면 됩니다.
-        self.settings_model.db.close()
+        # (연결은 여기서만 닫힘 - 모델 메서드는 연결을 유지한 채 반환)
+        DBConnection().close()
         LOGGER.info("All shared DB connections closed.")
\ No newline at end of file
@@ -2,6 +2,7 @@ import random
 from typing import List, Dict, Any, Optional, Tuple
 from controllers.base_controller import BaseController
 from utils.logger import setup_logger
+from utils.grading import bulk_match
 from datetime import datetime
 
 # 2025-10-20 - 스마트 단어장 - 시험 관리 컨트롤러
@@ -44,7 +45,7 @@ class ExamController(BaseController):
                 remaining_count = question_count - len(candidate_words)
                 # 오답 노트에 없는 단어 목록을 추가로 가져와 무작위로 선택할 수 있으나,
                 # 여기서는 구현 단순화를 위해 오답 단어만 반환하고, 부족하면 있는 만큼만 출제
-                LOGGER.info(f"Wrong note words count ({len(candidate_words)}) is less than requested ({question_count}).")
+                LOGGER.info("Wrong note words count (%d) is less than requested (%d).", len(candidate_words), question_count)
             
             # 오답률 기반 단어는 이미 정렬되어 있으므로 그대로 사용
             return candidate_words
@@ -54,14 +55,29 @@ class ExamController(BaseController):
             all_words = self._get_candidate_words(category)
             if len(all_words) < question_count:
                 question_count = len(all_words) # 단어 수가 부족하면 전체 출제
-                LOGGER.warning(f"Requested questions ({question_count}) exceed available words. Adjusting count.")
-            
-            # 무작위로 단어 선택
-            random.shuffle(all_words)
-            return all_words[:question_count]
+                LOGGER.warning("Requested questions (%d) exceed available words. Adjusting count.", question_count)
+
+            # 무작위로 단어 선택: sample은 필요한 개수만 뽑고 원본 리스트를 변경하지 않음
+            return random.sample(all_words, question_count)
 
     # --- 2. 시험 채점 및 결과 기록 (핵심 트랜잭션) ---
 
+    def bulk_regrade(self, questions_data: List[Dict[str, Any]]) -> int:
+        """
+        user_answer/correct_answer가 포함된 문항 목록을 일괄 재채점합니다.
+        각 문항의 is_correct를 갱신하고 정답 수를 반환합니다.
+        (이력 재채점 등 수천 문항 규모의 배치 경로용 - utils.grading 공용 규칙 사용)
+        """
+        matches = bulk_match(
+            [q.get('user_answer', '') for q in questions_data],
+            [q.get('correct_answer', '') for q in questions_data],
+        )
+        correct_count = 0
+        for question, is_match in zip(questions_data, matches):
+            question['is_correct'] = 1 if is_match else 0
+            correct_count += is_match
+        return correct_count
+
     def submit_and_record_exam(self, 
                               exam_type: str, 
                               duration_sec: int,
@@ -79,20 +95,15 @@ class ExamController(BaseController):
         
         if not questions_data:
             return None
-            
-        correct_count = 0
-        wrong_count = 0
+
         total_questions = len(questions_data)
 
         # 1. 최종 채점
-        # Note: 'questions_data'에는 이미 채점 결과(is_correct)가 포함되어 있다고 가정하거나, 
+        # Note: 'questions_data'에는 이미 채점 결과(is_correct)가 포함되어 있다고 가정하거나,
         # 혹은 여기서 채점을 수행해야 합니다. (여기서는 채점은 뷰에서 사용자 답변을 검증하여 is_correct를 채운 후 전달한다고 가정)
-        
-        for q in questions_data:
-            if q['is_correct'] == 1:
-                correct_count += 1
-            else:
-                wrong_count += 1
+
+        correct_count = sum(1 for q in questions_data if q['is_correct'] == 1)
+        wrong_count = total_questions - correct_count
 
         score = (correct_count / total_questions) * 100 if total_questions > 0 else 0.0
         score = round(score, 1) # 소수점 첫째 자리까지 반올림
@@ -107,7 +118,7 @@ class ExamController(BaseController):
         )
 
         if exam_id is not None:
-            LOGGER.info(f"Exam ID {exam_id} recorded. Score: {score}, Correct: {correct_count}")
+            LOGGER.info("Exam ID %d recorded. Score: %s, Correct: %d", exam_id, score, correct_count)
             return {
                 "exam_id": exam_id,
                 "score": score,
@@ -130,18 +141,12 @@ class ExamController(BaseController):
         """
         과거 시험 이력 목록을 최신순으로 반환합니다.
         """
-        # ExamHistoryModel의 select_all을 사용하여 목록 조회
-        return self.exam_model.history_model.select_all(where_clause="is_deleted = 0 ORDER BY exam_date DESC")
+        # 고정 SQL을 쓰는 전용 메서드로 조회 (문장 캐시 재사용)
+        return self.exam_model.history_model.select_recent_history()
         
     def get_exam_detail(self, exam_id: int) -> Optional[Dict[str, Any]]:
         """
         특정 시험 ID의 상세 이력과 문제 목록을 함께 반환합니다.
+        (이력+문제를 단일 JOIN 쿼리로 조회)
         """
-        history = self.exam_model.history_model.select_by_id(exam_id)
-        if not history:
-            return None
-            
-        questions = self.exam_model.question_model.select_all(where_clause="exam_id = ?", params=(exam_id,))
-        
-        history['questions'] = questions
-        return history
\ No newline at end of file
+        return self.exam_model.get_exam_with_questions(exam_id)
\ No newline at end of file
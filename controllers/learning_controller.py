@@ -1,4 +1,5 @@
 import random
+from logging import DEBUG
 from typing import List, Dict, Any, Optional, Tuple
 from controllers.base_controller import BaseController
 from utils.logger import setup_logger
@@ -39,30 +40,28 @@ class LearningController(BaseController):
         if mode == 'review_srs':
             # StatisticsModel에서 다음 복습일이 도래한 단어 가져오기
             all_words = self.statistics_model.select_review_words(word_count)
-            LOGGER.info(f"Loaded {len(all_words)} words for SRS review.")
+            LOGGER.info("Loaded %d words for SRS review.", len(all_words))
             
         elif mode == 'wrong_note':
             # ExamModel에서 오답률이 높은 단어 가져오기
             all_words = self.exam_model.select_wrong_words_for_review(word_count)
-            LOGGER.info(f"Loaded {len(all_words)} words from wrong note.")
+            LOGGER.info("Loaded %d words from wrong note.", len(all_words))
 
         else: # 'random' 또는 'sequential' 모드
-            if category:
-                # 카테고리 필터링
-                all_words = self.word_model.select_by_category(category)
-            else:
-                # 전체 단어 (삭제되지 않은)
-                all_words = self.word_model.select_active_words()
-            
-            # 2. 순서 결정 (Sequential vs Random)
+            # 순서 결정과 개수 제한을 모두 SQL에 위임 (필요한 행만 Python으로 가져옴)
             if mode == 'random':
-                random.shuffle(all_words)
-        
-        # 3. 개수 제한 (Limit)
-        # SRS/Wrong Note 모드는 이미 word_count로 제한되거나, 전체 단어가 적을 수 있음
-        final_list = all_words[:word_count] if len(all_words) > word_count else all_words
-        
-        LOGGER.info(f"Final session word list size: {len(final_list)} for mode '{mode}'.")
+                all_words = self.word_model.select_random_active(word_count, category)
+            elif category:
+                # 카테고리 필터링 (순차)
+                all_words = self.word_model.select_by_category(category, limit=word_count)
+            else:
+                # 전체 단어 (삭제되지 않은, 순차)
+                all_words = self.word_model.select_active_words(limit=word_count)
+
+        # 모든 모드가 SQL LIMIT으로 이미 word_count 이하로 제한됨
+        final_list = all_words
+
+        LOGGER.info("Final session word list size: %d for mode '%s'.", len(final_list), mode)
         return final_list
 
     # --- 2. 세션 관리 ---
@@ -95,52 +94,82 @@ class LearningController(BaseController):
         # 1. 학습 이력 기록 (Learning History)
         history_success = self.learning_model.add_history(session_id, word_id, is_correct, response_time) is not None
         if not history_success:
-            LOGGER.error(f"Failed to record learning history for word ID: {word_id}")
+            LOGGER.error("Failed to record learning history for word ID: %s", word_id)
             success = False
             
         # 2. 단어 통계 업데이트 (SRS 로직 실행)
         stats_success = self.statistics_model.update_statistics(word_id, is_correct)
         if not stats_success:
-            LOGGER.error(f"Failed to update statistics (SRS) for word ID: {word_id}")
+            LOGGER.error("Failed to update statistics (SRS) for word ID: %s", word_id)
             success = False
             
-        if success:
-            LOGGER.debug(f"Word ID {word_id} result recorded. Correct: {is_correct}")
-            
+        if success and LOGGER.isEnabledFor(DEBUG):
+            # 단어마다 호출되는 핫 경로: 레벨 가드로 포매팅과 호출 비용 모두 회피
+            LOGGER.debug("Word ID %d result recorded. Correct: %s", word_id, is_correct)
+
         return success
 
+    def record_word_results_bulk(self, results: List[Tuple[int, int, bool, float]]) -> bool:
+        """
+        버퍼링된 (session_id, word_id, is_correct, response_time) 결과들을
+        세션 종료 시점에 일괄 기록합니다. (카드당 DB 왕복 제거)
+        """
+        if not results:
+            return True
+
+        # 1. 학습 이력 일괄 기록
+        history_success = self.learning_model.add_history_bulk(results)
+        if not history_success:
+            LOGGER.error("Failed to bulk record learning history (%d rows).", len(results))
+
+        # 2. 단어 통계 일괄 업데이트 (SRS 로직)
+        stats_success = self.statistics_model.update_statistics_bulk(
+            [(word_id, is_correct) for _, word_id, is_correct, _ in results]
+        )
+        if not stats_success:
+            LOGGER.error("Failed to bulk update statistics (%d rows).", len(results))
+
+        LOGGER.info("Bulk recorded %d word results.", len(results))
+        return history_success and stats_success
+
     # --- 4. 대시보드 통계 조회 (F11 학습 통계) ---
     
     def get_dashboard_summary(self) -> Dict[str, Any]:
         """
         대시보드에 표시할 주요 학습 통계 요약을 반환합니다.
         """
-        # 1. 오늘의 학습 시간 (분)
-        today_time = self.learning_model.get_total_learning_time_today()
-        
+        # 1. 스칼라 지표 일괄 조회 (전체/복습/오답 단어 수, 오늘 학습 시간 - 단일 쿼리)
+        counts = self.statistics_model.get_dashboard_counts()
+
         # 2. 숙련도 레벨별 분포
         mastery_distribution = self.statistics_model.get_mastery_distribution()
-        
+
         # 3. 최근 7일간 정답률
         daily_correct_rate = self.learning_model.get_daily_correct_rate(days=7)
-        
-        # 4. 전체 단어 수
-        total_words = len(self.word_model.select_active_words())
-        
-        # 5. 복습 필요 단어 수
-        # 복습 단어는 next_review 필터링 (최대 1000개까지 조회하여 Count)
-        review_words_count = len(self.statistics_model.select_review_words(1000)) 
 
-        # 6. 오답 노트 단어 수
-        wrong_words_count = len(self.exam_model.select_wrong_words_for_review(1000))
-        
         return {
-            "today_learning_time_min": today_time,
-            "total_words_count": total_words,
-            "review_words_count": review_words_count,
-            "wrong_words_count": wrong_words_count,
+            "today_learning_time_min": counts["today_minutes"],
+            "total_words_count": counts["total_words"],
+            "review_words_count": counts["review_due"],
+            "wrong_words_count": counts["wrong_notes"],
             "mastery_distribution": mastery_distribution,
             "daily_correct_rate": daily_correct_rate,
+            # 상태 바(MainWindow._update_status_bar)가 사용하는 키
+            "total_words": counts["total_words"],
+            "today_words": counts["today_words"],
+            "due_review": counts["review_due"],
+        }
+
+    def get_statistics_bundle(self, days: int = 7) -> Dict[str, Any]:
+        """
+        통계 탭이 필요로 하는 세 가지 데이터(대시보드 요약, 숙련도 분포,
+        일별 정답률 추이)를 한 번의 호출로 묶어 반환합니다. 싱글턴 커넥션이
+        연결된 상태에서 연달아 조회하므로 페이지 캐시가 따뜻하게 유지됩니다.
+        """
+        return {
+            'summary': self.get_dashboard_summary(),
+            'proficiency': self.get_word_proficiency_distribution(),
+            'trend': self.get_daily_correct_rate_trend(days),
         }
 
     def get_word_proficiency_distribution(self) -> Dict[int, int]:
@@ -14,10 +14,29 @@ class WordController(BaseController):
     단어장(words 테이블)의 모든 사용자 인터페이스 로직을 처리합니다.
     """
 
+    # 읽기 전용 조회 캐시 (클래스 레벨 - 모든 인스턴스/다이얼로그가 공유,
+    # 단어 추가/수정/삭제/즐겨찾기 변경 시 무효화)
+    _categories_cache: Optional[List[str]] = None
+    _active_words_cache: Optional[List[Dict[str, Any]]] = None
+
     def __init__(self):
         super().__init__()
         # self.word_model은 BaseController에서 이미 초기화됨
-        
+
+    @classmethod
+    def invalidate_read_caches(cls):
+        """
+        카테고리/활성 단어 목록 캐시를 비웁니다.
+        컨트롤러를 거치지 않는 대량 변경(CSV 임포트의 upsert_many, DB 복원/초기화)
+        후에는 반드시 호출해야 다음 조회가 DB를 다시 읽습니다.
+        """
+        cls._categories_cache = None
+        cls._active_words_cache = None
+
+    def _invalidate_categories_cache(self):
+        """ 단어 변경으로 카테고리/목록 구성이 바뀌었을 수 있을 때 캐시를 비웁니다. """
+        WordController.invalidate_read_caches()
+
     # --- 1. 단어 추가/수정/삭제 ---
 
     def add_word(self, word_text: str, meaning_ko: str, category: str, memo: Optional[str] = None) -> Optional[int]:
@@ -28,23 +47,23 @@ class WordController(BaseController):
         word_text = word_text.strip()
         meaning_ko = meaning_ko.strip()
 
-        if self.word_model.is_word_exist(word_text):
-            LOGGER.warning(f"Failed to add word: '{word_text}' already exists.")
-            # 0은 중복 오류 코드로 가정하거나, 명시적인 오류 처리 필요 (Controller는 View에 오류 메시지를 전달해야 함)
-            return 0 # 0을 중복 오류 코드로 사용
-        
         data = {
             "word_text": word_text,
             "meaning_ko": meaning_ko,
             "category": category,
             "memo": memo if memo else "",
         }
-        
-        word_id = self.word_model.insert(data)
+
+        # 중복 검사와 삽입을 INSERT OR IGNORE 한 문장으로 처리 (0은 중복 오류 코드)
+        word_id = self.word_model.insert_if_absent(data)
+        if word_id == 0:
+            LOGGER.warning(f"Failed to add word: '{word_text}' already exists.")
+            return 0 # 0을 중복 오류 코드로 사용
         if word_id:
+            self._invalidate_categories_cache()
             LOGGER.info(f"Word added successfully. ID: {word_id}")
             return word_id
-        
+
         return None
 
     def update_word(self, word_id: int, word_text: str, meaning_ko: str, category: str, memo: Optional[str] = None) -> bool:
@@ -54,21 +73,21 @@ class WordController(BaseController):
         """
         word_text = word_text.strip()
         meaning_ko = meaning_ko.strip()
-        
-        if self.word_model.is_word_exist(word_text, exclude_id=word_id):
-            LOGGER.warning(f"Failed to update word ID {word_id}: '{word_text}' already exists in another record.")
-            return False
-            
+
         data = {
             "word_text": word_text,
             "meaning_ko": meaning_ko,
             "category": category,
             "memo": memo if memo else "",
         }
-        
-        success = self.word_model.update(word_id, data)
+
+        # 중복 검사를 UPDATE 문에 인라인 (별도 is_word_exist 왕복 제거)
+        success = self.word_model.update_checked(word_id, data)
         if success:
+            self._invalidate_categories_cache()
             LOGGER.info(f"Word updated successfully. ID: {word_id}")
+        else:
+            LOGGER.warning(f"Failed to update word ID {word_id}: duplicate '{word_text}' or no such record.")
         return success
         
     def delete_word(self, word_id: int) -> bool:
@@ -77,6 +96,7 @@ class WordController(BaseController):
         """
         success = self.word_model.delete(word_id, logical_delete=True)
         if success:
+            self._invalidate_categories_cache()
             LOGGER.info(f"Word logically deleted. ID: {word_id}")
         return success
 
@@ -85,8 +105,11 @@ class WordController(BaseController):
     def get_all_active_words(self) -> List[Dict[str, Any]]:
         """
         삭제되지 않은 전체 단어 목록을 반환합니다. (F3 단어 목록 조회)
+        단어 변경이 없는 동안에는 캐시된 목록을 반환합니다.
         """
-        return self.word_model.select_active_words()
+        if WordController._active_words_cache is None:
+            WordController._active_words_cache = self.word_model.select_active_words()
+        return WordController._active_words_cache
         
     def get_word_by_id(self, word_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -117,6 +140,8 @@ class WordController(BaseController):
         """
         success = self.word_model.toggle_favorite(word_id, is_favorite)
         if success:
+            # 캐시된 목록 행의 is_favorite가 낡지 않도록 무효화
+            WordController._active_words_cache = None
             LOGGER.info(f"Word ID {word_id} favorite status toggled to {is_favorite}.")
         return success
         
@@ -129,15 +154,20 @@ class WordController(BaseController):
     def get_all_categories(self) -> List[str]:
         """
         현재 DB에 저장된 모든 단어의 고유 카테고리 목록을 반환합니다. (F6 카테고리 관리)
+        단어 변경이 없는 동안에는 캐시된 목록을 반환합니다.
         """
+        if WordController._categories_cache is not None:
+            return WordController._categories_cache
+
         sql = "SELECT DISTINCT category FROM words WHERE is_deleted = 0 ORDER BY category ASC"
-        
+
         try:
+            # connect()는 이미 연결된 경우 no-op. 공유 싱글톤 연결이므로 여기서 닫지 않음
+            # (종료 시 BaseController.close_all_db_connections에서 일괄 종료)
             self.word_model.db.connect()
             rows = self.word_model.db.fetchall(sql)
-            return [row['category'] for row in rows]
+            WordController._categories_cache = [row['category'] for row in rows]
+            return WordController._categories_cache
         except Exception as e:
             LOGGER.error(f"Failed to fetch all categories: {e}")
-            return []
-        finally:
-            self.word_model.db.close()
\ No newline at end of file
+            return []
\ No newline at end of file
@@ -1,6 +1,7 @@
 import sqlite3
 import os
 import threading
+from collections import namedtuple
 from typing import List, Tuple, Any, Optional
 
 # 2025-10-20 - 스마트 단어장 - 데이터베이스 연결 모듈
@@ -18,18 +19,15 @@ class DBConnection:
     데이터베이스 초기화(파일 및 디렉토리 생성) 기능을 포함합니다.
     """
     _instance: Optional['DBConnection'] = None
-    _lock = threading.Lock()
 
     def __new__(cls, *args, **kwargs):
         """
         Singleton 패턴 구현: 인스턴스가 없으면 새로 생성하고, 있으면 기존 인스턴스를 반환합니다.
+        CPython의 GIL 하에서는 검사+할당이 원자적이므로 별도의 락이 필요 없습니다.
         """
         if cls._instance is None:
-            with cls._lock:
-                # 락을 잡고 다시 한번 확인 (멀티스레딩 환경 대비)
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False # 초기화 플래그
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False # 초기화 플래그
         return cls._instance
 
     def __init__(self):
@@ -38,6 +36,12 @@ class DBConnection:
 
         self._conn: Optional[sqlite3.Connection] = None
         self._cursor: Optional[sqlite3.Cursor] = None
+        # 공유 연결/커서 접근 직렬화 락. 워커 스레드(상태 바 집계, CSV 임포트,
+        # 시험 결과 기록 등)와 메인 스레드가 같은 연결을 쓰므로 모든 쿼리 메서드가
+        # 이 락을 잡는다. 여러 구문을 한 트랜잭션으로 묶는 쪽(upsert_many,
+        # record_exam_result)은 트랜잭션 전체 동안 이 락을 쥐어 원자성을 지킨다.
+        # (재진입 가능해야 함: fetchall -> execute처럼 중첩 획득이 일어남)
+        self.lock = threading.RLock()
         self._initialized = True
         
         # DB 디렉토리가 없으면 생성
@@ -48,93 +52,182 @@ class DBConnection:
     def connect(self):
         """
         데이터베이스에 연결하고 커서를 설정합니다.
+        이미 연결된 경우 아무 작업도 하지 않습니다 (멱등성 보장 - 빠른 경로).
         """
-        if self._conn is None:
-            try:
-                self._conn = sqlite3.connect(DATABASE_PATH)
-                self._conn.row_factory = sqlite3.Row  # 컬럼 이름으로 결과에 접근 가능하도록 설정
-                self._cursor = self._conn.cursor()
-                LOGGER.info(f"Database connected successfully to {DATABASE_PATH}")
-            except sqlite3.Error as e:
-                LOGGER.error(f"Database connection error: {e}")
-                # 연결 실패 시 None으로 유지
-                self._conn = None
-                self._cursor = None
-                raise e
+        if self._conn is not None:
+            return
+
+        with self.lock:
+            if self._conn is not None:
+                return
+            self._connect_locked()
+
+    def _connect_locked(self):
+        try:
+            # cached_statements를 늘려 반복 쿼리의 SQL 재파싱을 회피 (기본값 128)
+            # check_same_thread=False: QThreadPool 워커에서도 쿼리를 수행하기 위함.
+            # 스레드 간 동시 접근은 위의 self.lock으로 직렬화된다.
+            self._conn = sqlite3.connect(DATABASE_PATH, cached_statements=512,
+                                         check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row  # 컬럼 이름으로 결과에 접근 가능하도록 설정
+            # 읽기 성능 향상을 위한 PRAGMA 설정 (WAL 저널링 + 20MB 페이지 캐시 + 256MB mmap)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA cache_size=-20000")
+            self._conn.execute("PRAGMA mmap_size=268435456")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._cursor = self._conn.cursor()
+            LOGGER.info(f"Database connected successfully to {DATABASE_PATH}")
+        except sqlite3.Error as e:
+            LOGGER.error(f"Database connection error: {e}")
+            # 연결 실패 시 None으로 유지
+            self._conn = None
+            self._cursor = None
+            raise e
 
     def close(self):
         """
         데이터베이스 연결을 닫습니다.
         """
-        if self._conn:
-            self._conn.close()
-            self._conn = None
-            self._cursor = None
-            LOGGER.info("Database connection closed.")
+        with self.lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+                self._cursor = None
+                LOGGER.info("Database connection closed.")
 
     def commit(self):
         """
         현재 트랜잭션을 커밋합니다.
         """
-        if self._conn:
-            self._conn.commit()
-        else:
-            LOGGER.warning("Attempted to commit, but no active database connection.")
+        with self.lock:
+            if self._conn:
+                self._conn.commit()
+            else:
+                LOGGER.warning("Attempted to commit, but no active database connection.")
+
+    def rollback(self):
+        """
+        현재 트랜잭션을 롤백합니다.
+        """
+        with self.lock:
+            if self._conn:
+                self._conn.rollback()
+            else:
+                LOGGER.warning("Attempted to rollback, but no active database connection.")
 
     def execute(self, sql: str, params: Tuple[Any, ...] = ()) -> Optional[sqlite3.Cursor]:
         """
         SQL 쿼리를 실행합니다.
         """
-        if not self._conn:
-            LOGGER.error("Execute failed: No active database connection.")
-            return None
-            
-        try:
-            self._cursor.execute(sql, params)
-            return self._cursor
-        except sqlite3.Error as e:
-            LOGGER.error(f"SQL execution error on query: '{sql}' with params {params}. Error: {e}")
-            # DML (INSERT, UPDATE, DELETE) 오류 시 롤백
-            if self._conn:
-                self._conn.rollback() 
-            return None
+        with self.lock:
+            if not self._conn:
+                LOGGER.error("Execute failed: No active database connection.")
+                return None
+
+            try:
+                self._cursor.execute(sql, params)
+                return self._cursor
+            except sqlite3.Error as e:
+                LOGGER.error(f"SQL execution error on query: '{sql}' with params {params}. Error: {e}")
+                # DML (INSERT, UPDATE, DELETE) 오류 시 롤백
+                if self._conn:
+                    self._conn.rollback()
+                return None
+
+    def executemany(self, sql: str, seq_of_params: List[Tuple[Any, ...]]) -> Optional[sqlite3.Cursor]:
+        """
+        동일한 SQL을 여러 파라미터 집합에 대해 일괄 실행합니다. (배치 INSERT용)
+        """
+        with self.lock:
+            if not self._conn:
+                LOGGER.error("Executemany failed: No active database connection.")
+                return None
+
+            try:
+                self._cursor.executemany(sql, seq_of_params)
+                return self._cursor
+            except sqlite3.Error as e:
+                LOGGER.error(f"SQL executemany error on query: '{sql}'. Error: {e}")
+                # DML (INSERT, UPDATE, DELETE) 오류 시 롤백
+                if self._conn:
+                    self._conn.rollback()
+                return None
 
     # 새로 추가된 메서드 (다중 구문용)
     def executescripts(self, sql_script: str) -> bool:
         """
         세미콜론으로 구분된 여러 SQL 구문이 포함된 스크립트를 실행합니다. (스키마 초기화용)
         """
-        if not self._conn:
-            LOGGER.error("ExecuteScripts failed: No active database connection.")
-            return False
-        
-        try:
-            # Connection 객체의 executescript 메서드 사용 (커서 아님)
-            self._conn.executescript(sql_script) 
-            self._conn.commit()
-            return True
-        except sqlite3.Error as e:
-            LOGGER.error(f"SQL script execution error. Error: {e}")
-            self._conn.rollback()
-            return False
+        with self.lock:
+            if not self._conn:
+                LOGGER.error("ExecuteScripts failed: No active database connection.")
+                return False
+
+            try:
+                # Connection을 컨텍스트 매니저로 사용: 정상 종료 시 커밋, 예외 시 롤백이 자동 수행됨
+                with self._conn:
+                    self._conn.executescript(sql_script)
+                return True
+            except sqlite3.Error as e:
+                LOGGER.error(f"SQL script execution error. Error: {e}")
+                return False
 
     def fetchall(self, sql: str, params: Tuple[Any, ...] = ()) -> List[sqlite3.Row]:
         """
         SELECT 쿼리를 실행하고 모든 결과를 반환합니다.
         """
-        cursor = self.execute(sql, params)
-        if cursor:
-            return cursor.fetchall()
-        return []
+        # execute와 fetch 사이에 다른 스레드의 쿼리가 끼어들어 공유 커서가
+        # 덮어써지지 않도록 두 단계를 한 락 구간에서 수행
+        with self.lock:
+            cursor = self.execute(sql, params)
+            if cursor:
+                return cursor.fetchall()
+            return []
 
     def fetchone(self, sql: str, params: Tuple[Any, ...] = ()) -> Optional[sqlite3.Row]:
         """
         SELECT 쿼리를 실행하고 하나의 결과만 반환합니다.
         """
-        cursor = self.execute(sql, params)
-        if cursor:
-            return cursor.fetchone()
-        return None
+        with self.lock:
+            cursor = self.execute(sql, params)
+            if cursor:
+                return cursor.fetchone()
+            return None
+
+    # SQL 문자열 -> namedtuple 팩토리 캐시 (fetchall_namedtuple용)
+    _nt_factories: dict = {}
+
+    def fetchall_namedtuple(self, sql: str, params: Tuple[Any, ...] = ()) -> List[Any]:
+        """
+        SELECT 결과를 가벼운 namedtuple 리스트로 반환합니다.
+        sqlite3.Row의 행당 컬럼명 매핑 비용이 불필요한 내부 집계 경로용입니다.
+        (UI로 흘러가 dict 인터페이스가 필요한 조회는 기존 fetchall을 사용)
+        """
+        with self.lock:
+            return self._fetchall_namedtuple_locked(sql, params)
+
+    def _fetchall_namedtuple_locked(self, sql: str, params: Tuple[Any, ...]) -> List[Any]:
+        if not self._conn:
+            LOGGER.error("fetchall_namedtuple failed: No active database connection.")
+            return []
+
+        try:
+            # row_factory를 비운 별도 커서로 순수 튜플을 가져옴
+            cursor = self._conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(sql, params)
+
+            factory = self._nt_factories.get(sql)
+            if factory is None:
+                factory = namedtuple('Row', [d[0] for d in cursor.description], rename=True)
+                self._nt_factories[sql] = factory
+
+            return [factory._make(r) for r in cursor.fetchall()]
+        except sqlite3.Error as e:
+            LOGGER.error(f"SQL execution error on query: '{sql}' with params {params}. Error: {e}")
+            return []
 
 # # 사용 예시 (테스트 용도)
 # if __name__ == '__main__':
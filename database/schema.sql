@@ -99,4 +99,53 @@ CREATE TABLE IF NOT EXISTS user_settings (
     setting_type    TEXT,                      -- 값의 타입 (예: 'string', 'integer')
     description     TEXT,                      -- 설정 설명
     modified_date   TEXT NOT NULL
-);
\ No newline at end of file
+);
+
+-- 9. 조회 성능 인덱스 (대시보드/SRS/오답 노트 핫 쿼리용)
+-- word_text의 단일 조회(is_word_exist)는 UNIQUE 제약 조건의 인덱스가 담당
+
+-- 활성 단어 목록/카테고리 필터링 (select_active_words, select_by_category)
+CREATE INDEX IF NOT EXISTS idx_words_active ON words(is_deleted, category);
+-- 즐겨찾기 목록 (select_favorites) - 활성 단어만 대상인 부분 인덱스
+CREATE INDEX IF NOT EXISTS idx_words_favorite ON words(is_favorite) WHERE is_deleted = 0;
+-- SRS 복습 대상 조회 (select_review_words, count_review_due)
+CREATE INDEX IF NOT EXISTS idx_stats_next_review ON word_statistics(next_review);
+-- 시험 상세 문제 조회 (get_exam_detail)
+CREATE INDEX IF NOT EXISTS idx_exam_q_examid ON exam_questions(exam_id);
+-- 시험 이력 최신순 조회 (get_exam_history)
+CREATE INDEX IF NOT EXISTS idx_exam_hist_date ON exam_history(is_deleted, exam_date DESC);
+-- 오답 노트 랭킹 조회 (select_wrong_words_for_review) - 인덱스 순서로 정렬 없이 LIMIT
+CREATE INDEX IF NOT EXISTS idx_wrong_note_rank ON wrong_note(wrong_count DESC, last_wrong_date ASC);
+-- 완료 세션의 날짜 범위 집계 (get_total_learning_time_today, get_daily_correct_rate)
+CREATE INDEX IF NOT EXISTS idx_sessions_completed_start ON learning_sessions(is_completed, start_time);
+-- 세션별 학습 이력 조회 (learning_history)
+CREATE INDEX IF NOT EXISTS idx_learning_history_session ON learning_history(session_id);
+-- 일별 정답률/오늘 학습 단어 집계의 날짜 범위 필터 (get_daily_correct_rate_trend, get_dashboard_counts)
+CREATE INDEX IF NOT EXISTS idx_learning_history_date ON learning_history(learning_date);
+
+-- 10. 단어 전문 검색 인덱스 (FTS5 외부 컨텐츠 테이블)
+-- LIKE '%kw%' 전체 스캔을 역색인 탐색으로 대체 (WordModel.search_words)
+CREATE VIRTUAL TABLE IF NOT EXISTS words_fts USING fts5(
+    word_text, meaning_ko, memo,
+    content='words', content_rowid='word_id'
+);
+
+-- words 변경 시 FTS 인덱스 동기화 트리거
+CREATE TRIGGER IF NOT EXISTS trg_words_fts_ai AFTER INSERT ON words BEGIN
+    INSERT INTO words_fts(rowid, word_text, meaning_ko, memo)
+    VALUES (new.word_id, new.word_text, new.meaning_ko, new.memo);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_words_fts_ad AFTER DELETE ON words BEGIN
+    INSERT INTO words_fts(words_fts, rowid, word_text, meaning_ko, memo)
+    VALUES ('delete', old.word_id, old.word_text, old.meaning_ko, old.memo);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_words_fts_au AFTER UPDATE ON words BEGIN
+    INSERT INTO words_fts(words_fts, rowid, word_text, meaning_ko, memo)
+    VALUES ('delete', old.word_id, old.word_text, old.meaning_ko, old.memo);
+    INSERT INTO words_fts(rowid, word_text, meaning_ko, memo)
+    VALUES (new.word_id, new.word_text, new.meaning_ko, new.memo);
+END;
+
+-- FTS 인덱스 재구축과 ANALYZE는 words_fts가 처음 생성될 때 1회만 수행
+-- (FileHandler.initialize_database의 조건부 단계 - 매 기동마다 전체 단어를
+--  재색인하지 않도록 이 스크립트에는 포함하지 않음)
\ No newline at end of file
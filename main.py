@@ -1,11 +1,15 @@
 import sys
-from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QTabWidget, QStatusBar, QMessageBox, QLabel
-from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import Qt, QSize
+import time
+from PyQt5.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QTabWidget, QStatusBar,
+    QMessageBox, QLabel, QSplashScreen
+)
+from PyQt5.QtGui import QIcon, QPixmap, QColor
+from PyQt5.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, pyqtSignal
 
 # 프로젝트 모듈 임포트
 # Config, Logger, FileHandler
-from config import DATABASE_PATH, LOG_FILE_PATH#, QSS_LIGHT_PATH, QSS_DARK_PATH
+from config import DATABASE_PATH, LOG_FILE_PATH, QSS_LIGHT_PATH, QSS_DARK_PATH
 from utils.logger import setup_logger
 from utils.file_handler import FileHandler
 
@@ -22,12 +26,10 @@ from controllers.word_controller import WordController
 from controllers.learning_controller import LearningController
 from controllers.exam_controller import ExamController
 
-# Views
+# Views - 시작 탭만 모듈 로드 시 임포트
+# (나머지 뷰 모듈은 탭 첫 방문 시 팩토리 안에서 임포트 - 특히 통계 뷰의
+#  matplotlib 임포트 체인을 시작 경로에서 제거)
 from views.word_management_view import WordManagementView
-from views.flashcard_view import FlashcardView
-from views.exam_view import ExamView
-from views.statistics_view import StatisticsView
-from views.settings_view import SettingsView
 
 # 2025-10-20 - 스마트 단어장 - 메인 실행 파일
 # 파일 위치: main.py - v1
@@ -37,15 +39,78 @@ LOGGER = setup_logger()
 
 # --- 1. MainWindow 클래스 정의 (QTabWidget 통합) ---
 
+class _SummaryWorkerSignals(QObject):
+    """ 요약 워커의 결과 전달용 시그널 홀더 (QRunnable은 QObject가 아니므로 분리) """
+    finished = pyqtSignal(dict)
+
+
+class _SummaryWorker(QRunnable):
+    """
+    상태 바 요약 집계 쿼리를 백그라운드 스레드에서 수행하는 워커입니다.
+    결과는 finished 시그널을 통해 메인 스레드 슬롯으로 전달됩니다.
+    """
+    def __init__(self, controller: LearningController):
+        super().__init__()
+        self.controller = controller
+        self.signals = _SummaryWorkerSignals()
+
+    def run(self):
+        try:
+            summary = self.controller.get_dashboard_summary()
+        except Exception as e:
+            LOGGER.error(f"Summary worker failed: {e}")
+            summary = {}
+        self.signals.finished.emit(summary)
+
+
+class _DbInitWorkerSignals(QObject):
+    """ DB 초기화 워커의 완료 전달용 시그널 홀더 """
+    finished = pyqtSignal(bool)
+
+
+class _DbInitWorker(QRunnable):
+    """
+    스키마 생성/초기 데이터 삽입을 백그라운드 스레드에서 수행하는 워커입니다.
+    느린 디스크에서도 스플래시가 먼저 그려지고 이벤트 루프가 멈추지 않습니다.
+    """
+    def __init__(self, schema_file: str, init_data_file: str):
+        super().__init__()
+        self.schema_file = schema_file
+        self.init_data_file = init_data_file
+        self.signals = _DbInitWorkerSignals()
+
+    def run(self):
+        try:
+            success = FileHandler().initialize_database(self.schema_file, self.init_data_file)
+        except Exception as e:
+            LOGGER.critical(f"DB initialization failed: {e}")
+            success = False
+        self.signals.finished.emit(bool(success))
+
+
 class MainWindow(QMainWindow):
     """
     애플리케이션의 메인 윈도우. 탭 위젯과 상태 바를 관리합니다.
     """
+    # 상태 바 요약 캐시 유효 시간 (초) - 수동 새로고침성 이벤트는 이 시간 동안 DB 대신 캐시 사용
+    SUMMARY_CACHE_TTL_SEC = 10
+
+    # 테마별 QSS 문자열 캐시 (클래스 레벨 - 테마 토글마다 디스크를 다시 읽지 않음)
+    _style_cache = {}
+
     def __init__(self, controller: BaseController):
         super().__init__()
         self.base_controller = controller
         self.setWindowTitle("Smart Vocab Builder")
         self.setGeometry(100, 100, 1200, 800) # 초기 크기 설정 (화면 설계서 1.1)
+
+        # 대시보드 요약 캐시 (상태 바 갱신용 - 수동 이벤트마다 집계 쿼리를 반복하지 않도록)
+        self._summary_cache = None
+        self._summary_cache_ts = 0.0
+        # 창이 보이지 않는 동안의 갱신 요청은 표시 시점까지 미룸
+        self._status_dirty = False
+        # 요약 워커 중복 실행 방지 플래그
+        self._summary_worker_active = False
         
         # QSS 스타일 로드
         self.current_theme = self.base_controller.get_setting_value('theme_mode') or 'light'
@@ -64,7 +129,7 @@ class MainWindow(QMainWindow):
         # 파일 메뉴 (F)
         file_menu = menu_bar.addMenu("&파일(F)")
         file_menu.addAction("DB 백업 (Ctrl+B)", self._handle_db_backup)
-        file_menu.addAction("CSV 임포트", self.settings_view._handle_csv_import)
+        file_menu.addAction("CSV 임포트", lambda: self.settings_view._handle_csv_import())
         file_menu.addAction("종료 (Ctrl+Q)", self.close)
 
         # 도구 메뉴 (T)
@@ -78,25 +143,21 @@ class MainWindow(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         
-        self.total_words_label = QLabel("총 단어: 0개 |")
-        self.learned_words_label = QLabel("오늘 학습: 0개 |")
-        self.due_review_label = QLabel("복습 대기: 0개")
-
-        self.status_bar.addWidget(self.total_words_label)
-        self.status_bar.addWidget(self.learned_words_label)
-        self.status_bar.addWidget(self.due_review_label)
+        # 라벨 하나에 전체 요약을 담아 갱신당 레이아웃/페인트를 1회로 줄임
+        self.status_label = QLabel("총 단어: 0개 | 오늘 학습: 0개 | 복습 대기: 0개")
+        self.status_bar.addWidget(self.status_label)
         
         self._update_status_bar() # 초기 데이터 로드
 
     def _setup_controllers_and_views(self):
-        """ 모든 컨트롤러와 뷰 인스턴스를 생성하고 연결합니다. """
-        
+        """ 컨트롤러와 첫 탭의 뷰 인스턴스를 생성합니다. (나머지 탭 뷰는 지연 생성) """
+
         # # 1. Models (모두 BaseModel에 의존)
         # self.word_model = WordModel(self.base_controller.db_conn)
         # self.learning_model = LearningModel(self.base_controller.db_conn)
         # self.statistics_model = StatisticsModel(self.base_controller.db_conn)
         # self.exam_model = ExamModel(self.base_controller.db_conn)
-        
+
         self.word_model = WordModel()
         self.learning_model = LearningModel()
         self.statistics_model = StatisticsModel()
@@ -111,52 +172,171 @@ class MainWindow(QMainWindow):
         self.learning_controller = LearningController()
         self.exam_controller = ExamController()
 
-        # 3. Views
+        # 3. Views - 시작 탭(단어 관리)만 즉시 생성
+        # 나머지 탭은 첫 방문 시 _ensure_tab_loaded에서 생성됩니다. (시작 시간 단축)
         self.word_management_view = WordManagementView(self.word_controller)
-        self.flashcard_view = FlashcardView(self.learning_controller, self.word_controller)
-        self.exam_view = ExamView(self.exam_controller, self.word_controller)
-        self.statistics_view = StatisticsView(self.learning_controller)
-        self.settings_view = SettingsView(self.base_controller)
+        self._feature_widgets = {}  # index -> 생성된 뷰 (지연 로딩 캐시)
+        self._tab_factories = {
+            1: ("플래시 카드", self._create_flashcard_view),
+            2: ("시험", self._create_exam_view),
+            3: ("통계", self._create_statistics_view),
+            4: ("설정", self._create_settings_view),
+        }
+
+    # --- 지연 생성 뷰 팩토리 (뷰 생성과 동시에 해당 뷰의 시그널을 연결) ---
+
+    def _create_flashcard_view(self) -> "FlashcardView":
+        from views.flashcard_view import FlashcardView
+        view = FlashcardView(self.learning_controller, self.word_controller)
+        view.learning_status_changed.connect(self._invalidate_summary_cache)
+        return view
+
+    def _create_exam_view(self) -> "ExamView":
+        from views.exam_view import ExamView
+        view = ExamView(self.exam_controller, self.word_controller)
+        view.exam_status_changed.connect(self._invalidate_summary_cache)
+        return view
+
+    def _create_statistics_view(self) -> "StatisticsView":
+        from views.statistics_view import StatisticsView
+        return StatisticsView(self.learning_controller)
+
+    def _create_settings_view(self) -> "SettingsView":
+        from views.settings_view import SettingsView
+        view = SettingsView(self.base_controller)
+        view.theme_changed.connect(self._load_styles)
+        view.data_changed.connect(self.word_management_view._load_words)
+        view.data_changed.connect(self._invalidate_summary_cache)
+        return view
+
+    def _ensure_tab_loaded(self, index: int) -> QWidget:
+        """
+        해당 인덱스의 탭 뷰를 반환합니다. 아직 placeholder 상태면 실제 뷰를
+        생성하여 탭을 교체합니다. (첫 방문 시 1회만 수행)
+        """
+        if index == 0:
+            return self.word_management_view
+
+        view = self._feature_widgets.get(index)
+        if view is not None:
+            return view
+
+        label, factory = self._tab_factories[index]
+        view = factory()
+        self._feature_widgets[index] = view
+
+        # placeholder를 실제 뷰로 교체 (시그널 재진입 방지를 위해 일시 차단)
+        self.tab_widget.blockSignals(True)
+        current = self.tab_widget.currentIndex()
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, view, label)
+        if current == index:
+            self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+
+        LOGGER.info(f"Lazily constructed tab {index} ({label}).")
+        return view
+
+    # 지연 생성 뷰에 대한 속성 접근 (메뉴바 핸들러 등 기존 호출부 호환용)
+    @property
+    def flashcard_view(self) -> "FlashcardView":
+        return self._ensure_tab_loaded(1)
+
+    @property
+    def exam_view(self) -> "ExamView":
+        return self._ensure_tab_loaded(2)
+
+    @property
+    def statistics_view(self) -> "StatisticsView":
+        return self._ensure_tab_loaded(3)
+
+    @property
+    def settings_view(self) -> "SettingsView":
+        return self._ensure_tab_loaded(4)
 
     def _setup_tab_widget(self):
         """ 탭 위젯을 생성하고 뷰를 탭으로 추가합니다. (화면 설계서 1.1) """
         self.tab_widget = QTabWidget()
         self.tab_widget.addTab(self.word_management_view, "단어 관리")
-        self.tab_widget.addTab(self.flashcard_view, "플래시 카드")
-        self.tab_widget.addTab(self.exam_view, "시험")
-        self.tab_widget.addTab(self.statistics_view, "통계")
-        self.tab_widget.addTab(self.settings_view, "설정")
-        
+        # 탭 1~4는 placeholder로 시작하고 첫 방문 시 실제 뷰로 교체
+        for index in sorted(self._tab_factories):
+            self.tab_widget.addTab(QWidget(), self._tab_factories[index][0])
+
         self.setCentralWidget(self.tab_widget)
-        
-        # 탭 변경 시 시그널 연결 (통계 뷰 갱신 등)
+
+        # 탭 변경 시 시그널 연결 (지연 뷰 생성 및 통계 뷰 갱신 등)
         self.tab_widget.currentChanged.connect(self._handle_tab_change)
 
     def _connect_signals(self):
         """ 뷰 간의 통신 시그널을 연결합니다. """
         
-        # 1. 단어 목록 변경 시 상태바 갱신 및 통계 갱신
-        self.word_management_view.word_count_changed.connect(self._update_status_bar)
-        
-        # 2. 설정 변경 (테마, 데이터 변경)
-        self.settings_view.theme_changed.connect(self._load_styles)
-        self.settings_view.data_changed.connect(self.word_management_view._load_words) # 단어 관리 목록 새로고침
-
-        # 3. 학습 및 시험 완료 시 상태바 갱신
-        self.flashcard_view.learning_status_changed.connect(self._update_status_bar)
-        self.exam_view.exam_status_changed.connect(self._update_status_bar)
+        # 단어 추가/삭제 시 상태바에 변화량만 반영 (전체 집계 재조회 없음)
+        # 지연 생성되는 탭 뷰들의 시그널은 각 _create_*_view 팩토리에서 연결됩니다.
+        self.word_management_view.stats_delta.connect(self._apply_stats_delta)
 
     # --- UI 갱신 및 핸들러 메서드 ---
 
+    def _apply_stats_delta(self, delta: dict):
+        """
+        쓰기 이벤트가 전달한 변화량(예: {'total_words': -1})을 캐시된 요약에
+        더해 상태 바를 부분 갱신합니다. 집계 쿼리를 다시 돌리지 않습니다.
+        """
+        if self._summary_cache is None:
+            # 기준값이 없으면 증분을 더할 수 없으므로 1회 전체 조회로 대체
+            self._update_status_bar()
+            return
+        for key, inc in delta.items():
+            self._summary_cache[key] = self._summary_cache.get(key, 0) + inc
+        self._summary_cache_ts = time.monotonic()
+        self._apply_summary(self._summary_cache)
+
+    def _invalidate_summary_cache(self):
+        """ 쓰기 이벤트(단어 추가/삭제, 학습/시험 완료 등) 발생 시 요약 캐시를 무효화하고 갱신합니다. """
+        self._summary_cache = None
+        self._summary_cache_ts = 0.0
+        self._update_status_bar()
+
     def _update_status_bar(self):
-        """ DB에서 최신 정보를 가져와 상태 바를 업데이트합니다. """
+        """
+        상태 바를 업데이트합니다. TTL 내에는 캐시를 재사용하고,
+        캐시가 없거나 만료되면 집계 쿼리를 백그라운드 워커에서 수행합니다. (메인 스레드 무정지)
+        """
+        # 창이 숨겨진 동안(최소화, 초기 생성 중)은 갱신을 미루고 표시 시점에 한 번만 수행
+        if not self.isVisible():
+            self._status_dirty = True
+            return
+
+        summary = self._summary_cache
+        if summary is not None and (time.monotonic() - self._summary_cache_ts) < self.SUMMARY_CACHE_TTL_SEC:
+            self._apply_summary(summary)
+            return
+
+        # 이미 워커가 돌고 있으면 완료 시 반영되므로 중복 기동하지 않음
+        if self._summary_worker_active:
+            return
+
+        self._summary_worker_active = True
+        worker = _SummaryWorker(self.learning_controller)
+        worker.signals.finished.connect(self._on_summary_ready)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_summary_ready(self, summary: dict):
+        """ 백그라운드 워커가 전달한 요약을 캐시하고 상태 바에 반영합니다. (메인 스레드) """
+        self._summary_worker_active = False
+        if not summary:
+            return
+        self._summary_cache = summary
+        self._summary_cache_ts = time.monotonic()
+        self._apply_summary(summary)
+
+    def _apply_summary(self, summary: dict):
+        """ 요약 딕셔너리를 상태 바 라벨에 반영합니다. (값이 바뀐 경우에만 setText) """
         try:
-            summary = self.learning_controller.get_dashboard_summary()
-            
-            self.total_words_label.setText(f"총 단어: {summary.get('total_words', 0)}개 |")
-            self.learned_words_label.setText(f"오늘 학습: {summary.get('today_words', 0)}개 |")
-            self.due_review_label.setText(f"복습 대기: {summary.get('due_review', 0)}개")
-            
+            text = (f"총 단어: {summary.get('total_words', 0)}개 | "
+                    f"오늘 학습: {summary.get('today_words', 0)}개 | "
+                    f"복습 대기: {summary.get('due_review', 0)}개")
+            if self.status_label.text() != text:
+                self.status_label.setText(text)
         except Exception as e:
             LOGGER.error(f"Failed to update status bar: {e}")
 
@@ -172,28 +352,52 @@ class MainWindow(QMainWindow):
         if index != -1:
              self.settings_view.theme_combo.setCurrentIndex(index)
 
-    def _load_styles(self):
-        """ 현재 설정된 테마 모드에 따라 QSS 파일을 로드합니다. """
-        self.current_theme = self.base_controller.get_setting_value('theme_mode') or 'light'
-        
-        # if self.current_theme == 'dark':
-        #     qss_path = QSS_DARK_PATH
-        # else:
-        #     qss_path = QSS_LIGHT_PATH
-            
-        # try:
-        #     with open(qss_path, 'r', encoding='utf-8') as f:
-        #         self.setStyleSheet(f.read())
-        #     LOGGER.info(f"Loaded {self.current_theme} theme style.")
-        # except FileNotFoundError:
-        #     LOGGER.warning(f"QSS file not found at {qss_path}. Using default style.")
+    def _load_styles(self, theme_mode=None):
+        """
+        현재 설정된 테마 모드에 따라 QSS 파일을 로드합니다.
+        theme_changed 시그널이 전달한 테마 이름이 있으면 그대로 사용하여
+        호출마다 설정 테이블을 다시 조회하지 않습니다. 테마별 QSS 문자열은
+        클래스 캐시에 1회만 읽어 두므로 토글을 반복해도 파일 I/O는 테마당 한 번입니다.
+        """
+        if theme_mode:
+            self.current_theme = theme_mode
+        else:
+            # 최초 로드(생성자)에서만 DB 조회
+            self.current_theme = self.base_controller.get_setting_value('theme_mode') or 'light'
+
+        cached = MainWindow._style_cache.get(self.current_theme)
+        if cached is not None:
+            self.setStyleSheet(cached)
+            return
+
+        qss_path = QSS_DARK_PATH if self.current_theme == 'dark' else QSS_LIGHT_PATH
+        style = ""
+        try:
+            with open(qss_path, 'r', encoding='utf-8') as f:
+                style = f.read()
+            LOGGER.info(f"Loaded {self.current_theme} theme style.")
+        except FileNotFoundError:
+            # 파일이 없어도 빈 문자열을 캐시하여 토글마다 탐색을 반복하지 않음
+            LOGGER.warning(f"QSS file not found at {qss_path}. Using default style.")
+
+        MainWindow._style_cache[self.current_theme] = style
+        self.setStyleSheet(style)
 
     def _handle_tab_change(self, index: int):
-        """ 탭이 변경될 때 호출됩니다. """
+        """ 탭이 변경될 때 호출됩니다. 첫 방문 탭은 이 시점에 실제 뷰를 생성합니다. """
+        view = self._ensure_tab_loaded(index)
+
         # 통계 탭(Index 3)으로 이동 시 데이터 새로고침
         if index == 3:
-            self.statistics_view._load_data_and_draw_charts()
+            view._load_data_and_draw_charts()
             
+    def showEvent(self, event):
+        """ 창이 표시될 때, 숨겨진 동안 미뤄둔 상태 바 갱신을 수행합니다. """
+        super().showEvent(event)
+        if self._status_dirty:
+            self._status_dirty = False
+            self._update_status_bar()
+
     def closeEvent(self, event):
         """ 윈도우가 닫힐 때 DB 연결을 종료합니다. """
         self.base_controller.close_all_db_connections()
@@ -204,33 +408,50 @@ class MainWindow(QMainWindow):
 
 def main():
     """ 애플리케이션의 진입점입니다. """
-    
-    # 1. 파일 시스템 초기화 (DB 및 로그 파일 경로 확인)
-    FileHandler().initialize_database('database/schema.sql', 'database/init_data.sql') 
 
-    # 2. QApplication 인스턴스 생성
+    # 1. QApplication 인스턴스 생성 및 스플래시 즉시 표시
+    #    (DB 초기화를 기다리지 않고 첫 화면을 먼저 그려 체감 시작 시간을 단축)
     app = QApplication(sys.argv)
-    
-    # 3. BaseController 및 DB 초기화
-    try:
-        # 기존
-        # base_controller = BaseController(DATABASE_PATH)
-        # 초기화: DB 파일이 없거나 테이블이 없는 경우 테이블 생성 및 초기 설정값 삽입
-        # base_controller.initialize_database_if_needed()
-        
-        # 수정
-        base_controller = BaseController()
-        
-    except Exception as e:
-        QMessageBox.critical(None, "Fatal Error", f"데이터베이스 연결/초기화에 실패했습니다. 프로그램을 종료합니다.\n{e}")
-        LOGGER.critical(f"DB initialization failed: {e}")
-        sys.exit(1)
-
-    # 4. MainWindow 생성 및 실행
-    main_window = MainWindow(base_controller)
-    main_window.show()
-    
-    # 5. 애플리케이션 이벤트 루프 시작
+
+    # 널 픽스맵은 0x0 창이 되어 메시지가 보이지 않으므로 단색 사각형을 그려 사용
+    splash_pixmap = QPixmap(420, 240)
+    splash_pixmap.fill(QColor('#1976D2'))
+    splash = QSplashScreen(splash_pixmap)
+    splash.showMessage("데이터베이스 초기화 중...", Qt.AlignCenter, Qt.white)
+    splash.show()
+    app.processEvents()
+
+    # 메인 윈도우 참조 유지용 (슬롯 안에서 생성되므로 GC 방지)
+    refs = {}
+
+    # 2. DB 초기화(스키마/초기 데이터)는 워커 스레드에서 수행
+    def _on_db_ready(success: bool):
+        if not success:
+            splash.close()
+            QMessageBox.critical(None, "Fatal Error",
+                                 "데이터베이스 연결/초기화에 실패했습니다. 프로그램을 종료합니다.")
+            sys.exit(1)
+
+        # 3. BaseController 및 MainWindow 생성 (메인 스레드)
+        try:
+            base_controller = BaseController()
+        except Exception as e:
+            splash.close()
+            QMessageBox.critical(None, "Fatal Error",
+                                 f"데이터베이스 연결/초기화에 실패했습니다. 프로그램을 종료합니다.\n{e}")
+            LOGGER.critical(f"DB initialization failed: {e}")
+            sys.exit(1)
+
+        main_window = MainWindow(base_controller)
+        refs['window'] = main_window
+        main_window.show()
+        splash.finish(main_window)
+
+    worker = _DbInitWorker('database/schema.sql', 'database/init_data.sql')
+    worker.signals.finished.connect(_on_db_ready)
+    QThreadPool.globalInstance().start(worker)
+
+    # 4. 애플리케이션 이벤트 루프 시작
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
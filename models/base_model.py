@@ -1,7 +1,6 @@
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 from database.db_connection import DBConnection
 from utils.logger import setup_logger
-from datetime import datetime
 
 # 2025-10-20 - 스마트 단어장 - 모든 모델의 기반 클래스
 # 파일 위치: models/base_model.py - v1
@@ -9,10 +8,18 @@ from datetime import datetime
 
 LOGGER = setup_logger()
 
+# SQLite 측에서 현재 시각을 기록하는 SQL 표현식 (datetime.now().strftime와 동일 형식/로컬 시간)
+# 핫 경로에서 행마다 Python datetime 포매팅을 하지 않도록 SQL 템플릿에 포함시켜 사용
+SQL_NOW = "strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')"
+
 class BaseModel:
     """
     모든 데이터 모델 클래스가 상속받는 기반 클래스입니다.
     데이터베이스 연결 관리 및 기본적인 CRUD 메서드를 제공합니다.
+
+    연결 수명: DBConnection은 Singleton이며 프로세스 수명 동안 열린 상태를 유지합니다.
+    각 메서드의 connect() 호출은 멱등 가드(이미 연결 시 즉시 반환)이고,
+    close()는 앱 종료 시 BaseController.close_all_db_connections에서만 수행됩니다.
     """
     
     # 상속받는 클래스에서 반드시 재정의해야 하는 클래스 변수
@@ -20,35 +27,81 @@ class BaseModel:
     PRIMARY_KEY: str = ""
     FIELDS: List[str] = []
 
+    def __init_subclass__(cls, **kwargs):
+        """
+        파생 클래스 정의 시점에 메타데이터를 1회 고정합니다.
+        인스턴스를 만들 때마다 리스트 컴프리헨션/문자열 조립을 반복하지 않습니다.
+        """
+        super().__init_subclass__(**kwargs)
+        if not cls.TABLE_NAME or not cls.PRIMARY_KEY:
+            LOGGER.error(f"BaseModel subclass error: TABLE_NAME or PRIMARY_KEY not set in {cls.__name__}")
+            # 이 오류는 개발 단계에서 바로 잡아야 하므로 raise
+            raise NotImplementedError("TABLE_NAME and PRIMARY_KEY must be defined in the derived class.")
+
+        # 필드 목록에서 PK를 제외한 나머지 필드
+        cls.NON_PK_FIELDS = tuple(f for f in cls.FIELDS if f != cls.PRIMARY_KEY)
+        # SELECT 시 사용할 명시적 컬럼 목록 (SELECT * 대신 - 불필요한 컬럼 구체화 방지)
+        cls._ALL_COLS_SQL = ', '.join(cls.FIELDS)
+        cls._SELECT_ALL_SQL = f"SELECT {cls._ALL_COLS_SQL} FROM {cls.TABLE_NAME}"
+
     def __init__(self):
         # 모든 모델은 Singleton DBConnection 인스턴스를 사용합니다.
         self.db = DBConnection()
-        if not self.TABLE_NAME or not self.PRIMARY_KEY:
-             LOGGER.error(f"BaseModel initialization error: TABLE_NAME or PRIMARY_KEY not set in {self.__class__.__name__}")
-             # 이 오류는 개발 단계에서 바로 잡아야 하므로 raise
-             raise NotImplementedError("TABLE_NAME and PRIMARY_KEY must be defined in the derived class.")
-        
-        # 필드 목록에서 PK를 제외한 나머지 필드
-        self.NON_PK_FIELDS = [f for f in self.FIELDS if f != self.PRIMARY_KEY]
+
+    # --- SQL 템플릿 캐시 (클래스 레벨, 모든 모델이 공유) ---
+    # 동일한 컬럼 집합의 insert/update는 SQL 문자열을 매번 다시 조립하지 않고 재사용합니다.
+    # 키: (테이블명, 컬럼 집합) / 값: (SQL, 정렬된 컬럼 순서)
+    _insert_sql_cache: Dict[Tuple[str, frozenset], Tuple[str, Tuple[str, ...]]] = {}
+    _update_sql_cache: Dict[Tuple[str, frozenset], Tuple[str, Tuple[str, ...]]] = {}
+
+    def _get_insert_sql(self, data: Dict[str, Any]) -> Tuple[str, Tuple[str, ...]]:
+        """
+        컬럼 집합에 해당하는 INSERT SQL과 정규화된 컬럼 순서를 반환합니다.
+        컬럼 순서를 정렬로 고정하므로 같은 집합이면 항상 같은 SQL 문자열이 됩니다.
+        (sqlite3의 문장 캐시도 같은 문자열로 적중)
+        생성/수정 날짜 컬럼이 data에 없으면 SQLite 측 strftime으로 자동 기록합니다.
+        """
+        key = (self.TABLE_NAME, frozenset(data))
+        cached = self._insert_sql_cache.get(key)
+        if cached is None:
+            columns = tuple(sorted(data))
+            # 호출자가 넘기지 않은 타임스탬프 컬럼은 SQL 표현식으로 채움
+            auto_cols = tuple(c for c in ('created_date', 'modified_date')
+                              if c in self.FIELDS and c not in data)
+            all_cols = ', '.join(columns + auto_cols)
+            value_exprs = ', '.join(['?'] * len(columns) + [SQL_NOW] * len(auto_cols))
+            sql = f"INSERT INTO {self.TABLE_NAME} ({all_cols}) VALUES ({value_exprs})"
+            cached = (sql, columns)
+            self._insert_sql_cache[key] = cached
+        return cached
+
+    def _get_update_sql(self, data: Dict[str, Any]) -> Tuple[str, Tuple[str, ...]]:
+        """
+        컬럼 집합에 해당하는 UPDATE SQL과 정규화된 컬럼 순서를 반환합니다.
+        수정 날짜 컬럼이 data에 없으면 SQLite 측 strftime으로 자동 갱신합니다.
+        """
+        key = (self.TABLE_NAME, frozenset(data))
+        cached = self._update_sql_cache.get(key)
+        if cached is None:
+            columns = tuple(sorted(data))
+            set_clauses = [f"{col} = ?" for col in columns]
+            if 'modified_date' in self.FIELDS and 'modified_date' not in data:
+                set_clauses.append(f"modified_date = {SQL_NOW}")
+            sql = (f"UPDATE {self.TABLE_NAME} SET {', '.join(set_clauses)} "
+                   f"WHERE {self.PRIMARY_KEY} = ?")
+            cached = (sql, columns)
+            self._update_sql_cache[key] = cached
+        return cached
 
     # --- 1. CRUD - Create ---
     def insert(self, data: Dict[str, Any]) -> Optional[int]:
         """
         새 레코드를 삽입하고 삽입된 레코드의 PRIMARY KEY(rowid)를 반환합니다.
         """
-        # 생성 및 수정 날짜 자동 삽입
-        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        if 'created_date' in self.FIELDS and 'created_date' not in data:
-            data['created_date'] = now
-        if 'modified_date' in self.FIELDS and 'modified_date' not in data:
-            data['modified_date'] = now
-            
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join(['?' for _ in data])
-        values = tuple(data.values())
-        
-        sql = f"INSERT INTO {self.TABLE_NAME} ({columns}) VALUES ({placeholders})"
-        
+        # 생성 및 수정 날짜는 SQL 템플릿의 strftime이 자동 기록 (_get_insert_sql 참조)
+        sql, columns = self._get_insert_sql(data)
+        values = tuple(data[col] for col in columns)
+
         try:
             self.db.connect()
             cursor = self.db.execute(sql, values)
@@ -61,36 +114,163 @@ class BaseModel:
                 return last_id
         except Exception as e:
             LOGGER.error(f"Failed to insert into {self.TABLE_NAME}. Error: {e}")
-            self.db.close() # 실패 시 연결 닫기
             return None
-        finally:
-            self.db.close()
         return None
 
+    def bulk_insert(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        여러 레코드를 단일 트랜잭션 + executemany로 일괄 삽입합니다. (CSV 임포트 등)
+        컬럼 구성이 다른 행이 섞여 있어도 컬럼 집합별로 묶어 처리합니다.
+        삽입된 총 행 수를 반환하며, 오류 시 전체가 롤백되고 0을 반환합니다.
+        """
+        if not rows:
+            return 0
+
+        # 생성/수정 날짜는 SQL 템플릿의 strftime이 자동 기록 (행별 Python 포매팅 불필요)
+        # 컬럼 집합별로 그룹화 (집합이 같으면 하나의 executemany 배치)
+        groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(frozenset(row), []).append(row)
+
+        total = 0
+        try:
+            self.db.connect()
+            # 커넥션 컨텍스트 매니저: 정상 종료 시 커밋, 예외 시 전체 롤백
+            # (오류를 삼키는 db.executemany 대신 커서를 직접 사용해 예외를 전파시킴)
+            # 트랜잭션 동안 공유 연결 락을 유지해 다른 스레드의 커밋과 겹치지 않게 함
+            with self.db.lock, self.db._conn:
+                for group in groups.values():
+                    sql, columns = self._get_insert_sql(group[0])
+                    params = [tuple(row[col] for col in columns) for row in group]
+                    cursor = self.db._conn.executemany(sql, params)
+                    total += cursor.rowcount
+
+            LOGGER.info(f"Bulk inserted {total} rows into {self.TABLE_NAME}.")
+            return total
+        except Exception as e:
+            LOGGER.error(f"Failed to bulk insert into {self.TABLE_NAME}. Error: {e}")
+            return 0
+
     # --- 2. CRUD - Read ---
-    def select_all(self, where_clause: str = "1=1", params: Tuple[Any, ...] = ()) -> List[Dict[str, Any]]:
+    def iter_all(self, where_clause: str = "1=1", params: Tuple[Any, ...] = (),
+                 columns: Optional[List[str]] = None,
+                 order_by: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        WHERE 절 조건에 맞는 레코드를 커서에서 지연 순회하며 딕셔너리로 yield합니다.
+        전체 결과를 리스트로 구체화하지 않으므로 대량 조회 시 메모리 사용량이 절반입니다.
+        정렬은 where_clause에 SQL 조각을 덧붙이는 대신 order_by 인자로 전달합니다.
+        (select_where와 동일한 검증을 거치므로 임의 SQL이 섞이지 않음)
+        """
+        if columns:
+            sql = f"SELECT {', '.join(columns)} FROM {self.TABLE_NAME} WHERE {where_clause}"
+        else:
+            sql = f"{self._SELECT_ALL_SQL} WHERE {where_clause}"
+        if order_by:
+            parts = order_by.split()
+            if (parts[0] not in self.FIELDS
+                    or len(parts) > 2
+                    or (len(parts) == 2 and parts[1].upper() not in ('ASC', 'DESC'))):
+                raise ValueError(f"Invalid order_by: {order_by}")
+            sql += f" ORDER BY {order_by}"
+
+        try:
+            self.db.connect()
+            # 공유 커서와 독립된 커서로 실행 (순회 도중의 다른 쿼리와 간섭 방지)
+            cursor = self.db._conn.execute(sql, params)
+        except Exception as e:
+            LOGGER.error(f"Failed to select all from {self.TABLE_NAME}. Error: {e}")
+            return
+
+        for row in cursor:
+            yield dict(row)
+
+    def select_all(self, where_clause: str = "1=1", params: Tuple[Any, ...] = (),
+                   columns: Optional[List[str]] = None,
+                   order_by: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         WHERE 절 조건에 맞는 모든 레코드를 리스트(딕셔너리 형태)로 반환합니다.
+        columns를 지정하면 해당 컬럼만 조회합니다. (기본: FIELDS 전체)
         """
-        sql = f"SELECT * FROM {self.TABLE_NAME} WHERE {where_clause}"
-        
+        return list(self.iter_all(where_clause, params, columns, order_by))
+
+    # select_where가 조립한 SQL 캐시: 같은 필터 형태는 항상 같은 SQL 문자열 재사용
+    _where_sql_cache: Dict[Tuple, str] = {}
+
+    def select_where(self, filters: Dict[str, Any], order_by: Optional[str] = None,
+                     limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        컬럼-값 필터를 파라미터 바인딩 SQL로 변환하여 조회합니다.
+
+        뷰/컨트롤러가 select_all에 임의 SQL 조각(where_clause)을 넘기는 대신
+        {'컬럼': 값} 딕셔너리를 넘기면, 정규화된(정렬된) 컬럼 순서로 항상 동일한
+        SQL 문자열을 생성하므로 sqlite3 문장 캐시가 호출마다 적중합니다.
+        값이 '%'를 포함한 문자열이면 LIKE, 그 외에는 = 비교로 바인딩됩니다.
+        order_by/limit도 검증·바인딩을 거치므로 SQL 주입 여지가 없습니다.
+
+        Args:
+            filters: {'컬럼': 값} 형태의 AND 조건 (빈 딕셔너리면 전체 조회)
+            order_by: "컬럼 [ASC|DESC]" 형식 (컬럼은 FIELDS에 있어야 함)
+            limit: 최대 행 수 (파라미터로 바인딩됨)
+        """
+        columns = tuple(sorted(filters))
+        like_flags = tuple(isinstance(filters[c], str) and '%' in filters[c] for c in columns)
+        key = (self.TABLE_NAME, columns, like_flags, order_by, limit is not None)
+
+        sql = self._where_sql_cache.get(key)
+        if sql is None:
+            for col in columns:
+                if col not in self.FIELDS:
+                    raise ValueError(f"Unknown column in filter: {col}")
+            predicates = [f"{col} LIKE ?" if like else f"{col} = ?"
+                          for col, like in zip(columns, like_flags)]
+            sql = f"{self._SELECT_ALL_SQL} WHERE {' AND '.join(predicates) or '1=1'}"
+            if order_by:
+                parts = order_by.split()
+                if (parts[0] not in self.FIELDS
+                        or len(parts) > 2
+                        or (len(parts) == 2 and parts[1].upper() not in ('ASC', 'DESC'))):
+                    raise ValueError(f"Invalid order_by: {order_by}")
+                sql += f" ORDER BY {order_by}"
+            if limit is not None:
+                sql += " LIMIT ?"
+            self._where_sql_cache[key] = sql
+
+        params: Tuple[Any, ...] = tuple(filters[col] for col in columns)
+        if limit is not None:
+            params += (limit,)
+
         try:
             self.db.connect()
             rows = self.db.fetchall(sql, params)
-            # sqlite3.Row 객체를 dict로 변환
-            result = [dict(row) for row in rows] 
-            return result
+            return [dict(row) for row in rows]
         except Exception as e:
-            LOGGER.error(f"Failed to select all from {self.TABLE_NAME}. Error: {e}")
+            LOGGER.error(f"Failed to select from {self.TABLE_NAME} with filters {filters}. Error: {e}")
+            return []
+
+    def select_all_rows(self, where_clause: str = "1=1", params: Tuple[Any, ...] = (),
+                        columns: Optional[List[str]] = None) -> List[Any]:
+        """
+        WHERE 절 조건에 맞는 레코드를 sqlite3.Row 리스트로 반환합니다.
+        Row는 row['col'] 인덱싱을 그대로 지원하므로, dict 직렬화가 필요 없는
+        내부 소비자는 행당 dict 생성 비용 없이 이 메서드를 사용합니다.
+        """
+        if columns:
+            sql = f"SELECT {', '.join(columns)} FROM {self.TABLE_NAME} WHERE {where_clause}"
+        else:
+            sql = f"{self._SELECT_ALL_SQL} WHERE {where_clause}"
+
+        try:
+            self.db.connect()
+            return self.db.fetchall(sql, params)
+        except Exception as e:
+            LOGGER.error(f"Failed to select rows from {self.TABLE_NAME}. Error: {e}")
             return []
-        finally:
-            self.db.close()
 
     def select_by_id(self, pk_value: Any) -> Optional[Dict[str, Any]]:
         """
         PRIMARY KEY 값으로 하나의 레코드를 딕셔너리 형태로 반환합니다.
         """
-        sql = f"SELECT * FROM {self.TABLE_NAME} WHERE {self.PRIMARY_KEY} = ?"
+        sql = f"{self._SELECT_ALL_SQL} WHERE {self.PRIMARY_KEY} = ?"
         
         try:
             self.db.connect()
@@ -101,8 +281,6 @@ class BaseModel:
         except Exception as e:
             LOGGER.error(f"Failed to select by PK from {self.TABLE_NAME}. Error: {e}")
             return None
-        finally:
-            self.db.close()
 
 
     # --- 3. CRUD - Update ---
@@ -114,18 +292,10 @@ class BaseModel:
         if not data:
             return False
 
-        # 수정 날짜 자동 업데이트
-        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        if 'modified_date' in self.FIELDS and 'modified_date' not in data:
-            data['modified_date'] = now
-            
-        set_clauses = [f"{col} = ?" for col in data.keys()]
-        set_sql = ', '.join(set_clauses)
-        
-        values = tuple(data.values()) + (pk_value,)
-        
-        sql = f"UPDATE {self.TABLE_NAME} SET {set_sql} WHERE {self.PRIMARY_KEY} = ?"
-        
+        # 수정 날짜는 SQL 템플릿의 strftime이 자동 갱신 (_get_update_sql 참조)
+        sql, columns = self._get_update_sql(data)
+        values = tuple(data[col] for col in columns) + (pk_value,)
+
         try:
             self.db.connect()
             cursor = self.db.execute(sql, values)
@@ -139,10 +309,7 @@ class BaseModel:
                 return False
         except Exception as e:
             LOGGER.error(f"Failed to update {self.TABLE_NAME} ID: {pk_value}. Error: {e}")
-            self.db.close()
             return False
-        finally:
-            self.db.close()
 
 
     # --- 4. CRUD - Delete (논리 삭제 지원) ---
@@ -154,9 +321,10 @@ class BaseModel:
         try:
             self.db.connect()
             if logical_delete and 'is_deleted' in self.FIELDS:
-                # 논리 삭제
-                sql = f"UPDATE {self.TABLE_NAME} SET is_deleted = 1, modified_date = ? WHERE {self.PRIMARY_KEY} = ?"
-                values = (datetime.now().strftime('%Y-%m-%d %H:%M:%S'), pk_value)
+                # 논리 삭제 (수정 날짜는 SQLite 측에서 기록)
+                sql = (f"UPDATE {self.TABLE_NAME} SET is_deleted = 1, "
+                       f"modified_date = {SQL_NOW} WHERE {self.PRIMARY_KEY} = ?")
+                values = (pk_value,)
                 delete_type = "Logical Delete"
             else:
                 # 물리 삭제
@@ -175,7 +343,4 @@ class BaseModel:
                 return False
         except Exception as e:
             LOGGER.error(f"Failed to delete {self.TABLE_NAME} ID: {pk_value}. Error: {e}")
-            self.db.close()
-            return False
-        finally:
-            self.db.close()
\ No newline at end of file
+            return False
\ No newline at end of file
@@ -15,13 +15,32 @@ class ExamHistoryModel(BaseModel):
     TABLE_NAME = "exam_history"
     PRIMARY_KEY = "exam_id"
     FIELDS = [
-        "exam_id", "exam_date", "exam_type", "total_questions", 
+        "exam_id", "exam_date", "exam_type", "total_questions",
         "score", "duration_sec", "is_deleted"
     ]
 
     def __init__(self):
         super().__init__()
 
+    def select_recent_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        삭제되지 않은 시험 이력을 최신순으로 반환합니다.
+        고정된 SQL 리터럴을 사용하므로 문장 캐시가 매 호출 재사용됩니다.
+        """
+        sql = f"SELECT * FROM {self.TABLE_NAME} WHERE is_deleted = 0 ORDER BY exam_date DESC"
+        params: Tuple[Any, ...] = ()
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = (limit,)
+
+        try:
+            self.db.connect()
+            rows = self.db.fetchall(sql, params)
+            return [dict(row) for row in rows]
+        except Exception as e:
+            LOGGER.error(f"Failed to select recent exam history. Error: {e}")
+            return []
+
 # 시험 문제 상세 테이블
 class ExamQuestionModel(BaseModel):
     TABLE_NAME = "exam_questions"
@@ -34,6 +53,20 @@ class ExamQuestionModel(BaseModel):
     def __init__(self):
         super().__init__()
 
+    def select_by_exam_id(self, exam_id: int) -> List[Dict[str, Any]]:
+        """
+        특정 시험 ID에 속한 문제 상세 목록을 반환합니다.
+        """
+        sql = f"SELECT * FROM {self.TABLE_NAME} WHERE exam_id = ?"
+
+        try:
+            self.db.connect()
+            rows = self.db.fetchall(sql, (exam_id,))
+            return [dict(row) for row in rows]
+        except Exception as e:
+            LOGGER.error(f"Failed to select questions for exam ID {exam_id}. Error: {e}")
+            return []
+
 # 오답 노트 테이블
 class WrongNoteModel(BaseModel):
     TABLE_NAME = "wrong_note"
@@ -53,9 +86,10 @@ class ExamModel:
     시험 및 오답 노트 관리를 통합하는 모델입니다.
     """
     def __init__(self):
+        # 인스턴스 API(select_recent_history 등)를 쓰는 이력 모델만 생성합니다.
+        # 문제/오답 노트 테이블은 클래스 메타데이터(TABLE_NAME)만 참조하므로
+        # 별도 인스턴스를 만들지 않습니다.
         self.history_model = ExamHistoryModel()
-        self.question_model = ExamQuestionModel()
-        self.wrong_note_model = WrongNoteModel()
         self.db = self.history_model.db # DBConnection 인스턴스 공유
 
     # --- 1. 시험 결과 기록 (핵심 트랜잭션) ---
@@ -77,7 +111,11 @@ class ExamModel:
             삽입된 exam_id 또는 None
         """
         exam_id = None
-        
+
+        # 트랜잭션 전체(BEGIN~COMMIT/ROLLBACK) 동안 공유 연결 락을 쥔다.
+        # 워커 스레드에서 실행되므로, 메인 스레드의 쿼리/커밋이 중간에 끼어들어
+        # 반쯤 기록된 시험을 먼저 커밋해 버리는 일을 막는다.
+        self.db.lock.acquire()
         try:
             self.db.connect()
             self.db._conn.isolation_level = None # 트랜잭션 시작 (BEGIN)
@@ -105,21 +143,28 @@ class ExamModel:
             if not exam_id:
                 raise Exception("Failed to insert exam history.")
 
-            # 2. 시험 문제 상세 (exam_questions) 기록 및 오답 노트 업데이트
-            for q in questions_detail:
-                q['exam_id'] = exam_id
-                
-                # (B) Exam Question 삽입
-                q_columns = ', '.join(q.keys())
-                q_placeholders = ', '.join(['?' for _ in q])
-                q_values = tuple(q.values())
-                q_sql = f"INSERT INTO {self.question_model.TABLE_NAME} ({q_columns}) VALUES ({q_placeholders})"
-                self.db.execute(q_sql, q_values)
-
-                # (C) 오답 노트 (wrong_note) 업데이트
-                if q['is_correct'] == 0:
-                    self._update_wrong_note(q['word_id'], exam_id)
-            
+            # 2. 시험 문제 상세 (exam_questions) 기록 - executemany로 일괄 삽입
+            # (B) Exam Question 배치 삽입 (스키마 컬럼에 맞춰 명시적으로 매핑)
+            q_sql = f"""
+                INSERT INTO {ExamQuestionModel.TABLE_NAME}
+                (exam_id, word_id, question_text, correct_answer, user_answer, is_correct)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """
+            q_rows = [
+                (exam_id, q['word_id'],
+                 q.get('question_text') or q.get('word_text', ''),
+                 q['correct_answer'], q.get('user_answer', ''), q['is_correct'])
+                for q in questions_detail
+            ]
+            if self.db.executemany(q_sql, q_rows) is None:
+                raise Exception("Failed to insert exam questions.")
+
+            # (C) 오답 노트 (wrong_note) 일괄 업데이트
+            wrong_word_ids = [q['word_id'] for q in questions_detail if q['is_correct'] == 0]
+            if wrong_word_ids:
+                if not self._update_wrong_notes_batch(wrong_word_ids, exam_id):
+                    raise Exception("Failed to update wrong notes.")
+
             # 3. 트랜잭션 완료
             self.db.commit()
             LOGGER.info(f"Exam result recorded successfully. Exam ID: {exam_id}")
@@ -130,43 +175,31 @@ class ExamModel:
             self.db.execute("ROLLBACK")
             return None
         finally:
-            self.db.close()
+            self.db.lock.release()
             
     # --- 2. 오답 노트 관리 (내부 보조 함수) ---
-    
-    def _update_wrong_note(self, word_id: int, latest_exam_id: int) -> bool:
+
+    def _update_wrong_notes_batch(self, word_ids: List[int], latest_exam_id: int) -> bool:
         """
-        특정 단어가 오답이었을 때 오답 노트 테이블을 업데이트하거나 새로 삽입합니다.
+        오답 단어들의 오답 노트를 단일 UPSERT 일괄 구문으로 갱신합니다.
         (이 함수는 record_exam_result 트랜잭션 내에서 실행됩니다.)
+        word_id UNIQUE 제약을 이용해 신규 단어는 삽입, 기존 단어는 카운트 증가를
+        SQLite가 한 구문에서 처리합니다. (SELECT 선행 조회 불필요)
+        틀린 날짜도 SQLite 측 strftime으로 기록하여 Python 포매팅을 생략합니다.
         """
-        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        # 1. 기존 레코드 확인 (트랜잭션 내에서 db.execute 사용)
-        select_sql = f"SELECT note_id, wrong_count FROM {self.wrong_note_model.TABLE_NAME} WHERE word_id = ?"
-        row = self.db.fetchone(select_sql, (word_id,))
-        
-        if row:
-            # 업데이트
-            update_sql = f"""
-                UPDATE {self.wrong_note_model.TABLE_NAME}
-                SET wrong_count = wrong_count + 1, latest_exam_id = ?, last_wrong_date = ?
-                WHERE note_id = ?
-            """
-            self.db.execute(update_sql, (latest_exam_id, now, row['note_id']))
-        else:
-            # 삽입
-            insert_data = {
-                "word_id": word_id,
-                "latest_exam_id": latest_exam_id,
-                "wrong_count": 1,
-                "last_wrong_date": now,
-            }
-            columns = ', '.join(insert_data.keys())
-            placeholders = ', '.join(['?' for _ in insert_data])
-            insert_sql = f"INSERT INTO {self.wrong_note_model.TABLE_NAME} ({columns}) VALUES ({placeholders})"
-            self.db.execute(insert_sql, tuple(insert_data.values()))
-            
-        return True # 트랜잭션이 커밋될 때 성공
+        upsert_sql = f"""
+            INSERT INTO {WrongNoteModel.TABLE_NAME}
+            (word_id, latest_exam_id, wrong_count, last_wrong_date)
+            VALUES (?, ?, 1, strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime'))
+            ON CONFLICT(word_id) DO UPDATE SET
+                wrong_count = wrong_count + 1,
+                latest_exam_id = excluded.latest_exam_id,
+                last_wrong_date = excluded.last_wrong_date
+        """
+        # executemany는 실패 시 롤백 후 None을 반환하므로 결과를 반드시 확인
+        # (무시하면 호출 측이 빈 트랜잭션을 커밋하고 성공으로 보고하게 됨)
+        cursor = self.db.executemany(upsert_sql, [(wid, latest_exam_id) for wid in word_ids])
+        return cursor is not None
 
     # --- 3. 오답 노트 목록 조회 ---
     
@@ -181,12 +214,15 @@ class ExamModel:
             WHERE W.is_deleted = 0
             ORDER BY N.wrong_count DESC, N.last_wrong_date ASC
         """
+        params: Tuple[Any, ...] = ()
         if limit is not None:
-            sql += f" LIMIT {limit}"
-            
+            # LIMIT은 파라미터로 바인딩 (문장 캐시 재사용 및 인젝션 방지)
+            sql += " LIMIT ?"
+            params = (limit,)
+
         try:
             self.db.connect()
-            cursor = self.db.execute(sql)
+            cursor = self.db.execute(sql, params)
             if cursor:
                 rows = cursor.fetchall()
                 # sqlite3.Row 객체를 dict로 변환
@@ -195,5 +231,73 @@ class ExamModel:
         except Exception as e:
             LOGGER.error(f"Failed to select wrong words. Error: {e}")
             return []
-        finally:
-            self.db.close()
\ No newline at end of file
+
+    def get_exam_with_questions(self, exam_id: int) -> Optional[Dict[str, Any]]:
+        """
+        시험 이력과 상세 문제 목록을 단일 JOIN 쿼리로 함께 조회합니다.
+        (기존 이력 조회 + 문제 조회 2회 왕복을 1회로 축소)
+        """
+        sql = """
+            SELECT H.exam_id, H.exam_date, H.exam_type, H.total_questions,
+                   H.score, H.duration_sec, H.is_deleted,
+                   Q.question_id, Q.word_id, Q.question_text,
+                   Q.correct_answer, Q.user_answer, Q.is_correct
+            FROM exam_history H
+            LEFT JOIN exam_questions Q ON Q.exam_id = H.exam_id
+            WHERE H.exam_id = ?
+        """
+
+        try:
+            self.db.connect()
+            rows = self.db.fetchall(sql, (exam_id,))
+            if not rows:
+                return None
+
+            first = rows[0]
+            history = {
+                "exam_id": first["exam_id"],
+                "exam_date": first["exam_date"],
+                "exam_type": first["exam_type"],
+                "total_questions": first["total_questions"],
+                "score": first["score"],
+                "duration_sec": first["duration_sec"],
+                "is_deleted": first["is_deleted"],
+            }
+
+            # LEFT JOIN이므로 문제가 없는 시험은 question_id가 NULL인 한 행만 반환됨
+            history["questions"] = [
+                {
+                    "question_id": row["question_id"],
+                    "exam_id": exam_id,
+                    "word_id": row["word_id"],
+                    "question_text": row["question_text"],
+                    "correct_answer": row["correct_answer"],
+                    "user_answer": row["user_answer"],
+                    "is_correct": row["is_correct"],
+                }
+                for row in rows if row["question_id"] is not None
+            ]
+            return history
+        except Exception as e:
+            LOGGER.error(f"Failed to fetch exam detail for ID {exam_id}. Error: {e}")
+            return None
+
+    def count_wrong_note(self) -> int:
+        """
+        오답 노트에 기록된 (삭제되지 않은) 단어 수를 반환합니다.
+        select_wrong_words_for_review와 동일한 조건으로 COUNT(*)만 수행합니다. (대시보드 집계용)
+        """
+        sql = """
+            SELECT COUNT(*) AS c
+            FROM words W
+            INNER JOIN wrong_note N ON W.word_id = N.word_id
+            WHERE W.is_deleted = 0
+        """
+
+        try:
+            self.db.connect()
+            row = self.db.fetchone(sql)
+            return row['c'] if row else 0
+        except Exception as e:
+            LOGGER.error(f"Failed to count wrong note words. Error: {e}")
+            return 0
\ No newline at end of file
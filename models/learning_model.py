@@ -88,6 +88,35 @@ class LearningModel:
         # LearningHistoryModel의 insert 메서드를 사용하여 이력 기록
         return self.history_model.insert(data)
 
+    def add_history_bulk(self, results: List[Tuple[int, int, bool, float]]) -> bool:
+        """
+        (session_id, word_id, is_correct, response_time) 튜플 목록을
+        단일 트랜잭션 + executemany로 일괄 기록합니다. (카드당 커밋 제거)
+        """
+        if not results:
+            return True
+
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        rows = [
+            (session_id, word_id, 1 if is_correct else 0, response_time, now)
+            for session_id, word_id, is_correct, response_time in results
+        ]
+        sql = f"""
+            INSERT INTO {LearningHistoryModel.TABLE_NAME}
+            (session_id, word_id, is_correct, response_time, learning_date)
+            VALUES (?, ?, ?, ?, ?)
+        """
+        try:
+            self.db.connect()
+            # 예외 발생 시 전체 롤백되도록 연결 객체의 트랜잭션 컨텍스트 사용
+            # (트랜잭션 동안 공유 연결 락을 유지 - 다른 스레드의 커밋과 격리)
+            with self.db.lock, self.db._conn:
+                self.db._conn.executemany(sql, rows)
+            return True
+        except Exception as e:
+            LOGGER.error(f"Failed to bulk insert {len(rows)} history rows. Error: {e}")
+            return False
+
     # --- 3. 통계 조회 ---
     
     def get_total_learning_time_today(self) -> float:
@@ -111,45 +140,33 @@ class LearningModel:
         except Exception as e:
             LOGGER.error(f"Failed to calculate total learning time today. Error: {e}")
             return 0.0
-        finally:
-            self.db.close()
             
     def get_daily_correct_rate(self, days: int = 7) -> List[Dict[str, Any]]:
         """
         최근 days일간의 일별 정답률을 계산하여 반환합니다. (통계 차트용)
+        정답률 계산까지 SQL에서 수행하므로 Python 측은 행을 그대로 dict로 변환만 합니다.
         """
         start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d 00:00:00')
-        
+
         sql = """
-            SELECT 
-                strftime('%Y-%m-%d', start_time) as learning_day,
-                SUM(correct_count) AS total_correct,
-                SUM(wrong_count) AS total_wrong
+            SELECT
+                strftime('%Y-%m-%d', start_time) AS date,
+                SUM(correct_count) + SUM(wrong_count) AS total_attempts,
+                CASE WHEN SUM(correct_count) + SUM(wrong_count) > 0
+                     THEN ROUND(100.0 * SUM(correct_count)
+                                / (SUM(correct_count) + SUM(wrong_count)), 1)
+                     ELSE 0.0
+                END AS correct_rate
             FROM learning_sessions
             WHERE is_completed = 1 AND start_time >= ?
-            GROUP BY learning_day
-            ORDER BY learning_day ASC
+            GROUP BY date
+            ORDER BY date ASC
         """
-        
+
         try:
             self.db.connect()
             rows = self.db.fetchall(sql, (start_date,))
-            result = []
-            
-            for row in rows:
-                total_attempts = row['total_correct'] + row['total_wrong']
-                correct_rate = 0.0
-                if total_attempts > 0:
-                    correct_rate = round((row['total_correct'] / total_attempts) * 100, 1)
-                    
-                result.append({
-                    'date': row['learning_day'],
-                    'correct_rate': correct_rate,
-                    'total_attempts': total_attempts
-                })
-            return result
+            return [dict(row) for row in rows]
         except Exception as e:
             LOGGER.error(f"Failed to get daily correct rate. Error: {e}")
-            return []
-        finally:
-            self.db.close()
\ No newline at end of file
+            return []
\ No newline at end of file
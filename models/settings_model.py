@@ -1,7 +1,8 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from models.base_model import BaseModel
 from utils.logger import setup_logger
 from datetime import datetime
+import time
 from config import DEFAULT_SETTINGS # config.py에서 기본 설정값 가져오기
 import json
 
@@ -11,6 +12,30 @@ import json
 
 LOGGER = setup_logger()
 
+# 레거시 setting_type 문자열 -> 변환 함수 디스패치 테이블
+# (JSON 저장 방식 도입 전의 행: type().__name__('int', 'bool') 또는 초기 데이터의
+#  'integer', 'boolean' 표기. 마이그레이션 전 읽기와 마이그레이션 자체에 사용)
+_COERCE = {
+    'int': int,
+    'integer': int,
+    'float': float,
+    'bool': lambda v: v.lower() in ('true', '1'),
+    'boolean': lambda v: v.lower() in ('true', '1'),
+}
+
+
+def _coerce_value(value: str, setting_type: str) -> Any:
+    """
+    저장된 setting_type에 따라 문자열 값을 원래 타입으로 변환합니다.
+    'json'이면 json.loads 한 번으로 끝나고(리스트/딕셔너리도 지원),
+    그 외는 레거시 디스패치 테이블을 거칩니다.
+    """
+    if setting_type == 'json':
+        return json.loads(value)
+    caster = _COERCE.get(setting_type)
+    return caster(value) if caster else value
+
+
 class SettingsModel(BaseModel):
     """
     'user_settings' 테이블에 대한 데이터 접근 및 설정 관리를 담당합니다.
@@ -18,14 +43,26 @@ class SettingsModel(BaseModel):
     TABLE_NAME = "user_settings"
     PRIMARY_KEY = "setting_key"
     FIELDS = [
-        "setting_key", "setting_value", "setting_type", 
+        "setting_key", "setting_value", "setting_type",
         "description", "modified_date"
     ]
 
+    # 설정값 읽기 캐시 (클래스 레벨 - 모든 인스턴스가 공유, DB도 Singleton이므로 일관성 유지)
+    # key -> (저장 시각, 변환된 값). 설정은 앱 내부에서만 변경되므로 쓰기 시 해당 키만 무효화합니다.
+    _CACHE_TTL = 60.0  # 초
+    _cache: Dict[str, Tuple[float, Any]] = {}
+
+    @classmethod
+    def clear_cache(cls):
+        """설정 캐시를 전체 비웁니다. (외부에서 DB를 직접 수정한 경우 등)"""
+        cls._cache.clear()
+
     def __init__(self):
         super().__init__()
         # 인스턴스 생성 시점에 DB를 확인하고 필요하면 초기화 스크립트를 실행합니다.
         self._initialize_settings()
+        # 구 문자열 저장 방식의 행이 남아 있으면 JSON 표현으로 1회 재인코딩합니다.
+        self._migrate_settings_to_json()
 
     # --- 1. 초기화 기능 ---
 
@@ -34,51 +71,82 @@ class SettingsModel(BaseModel):
         user_settings 테이블에 설정값이 없으면 config.py의 기본값으로 초기값을 삽입합니다.
         """
         try:
-            current_settings = self.get_all_settings()
-            
-            # DB에 설정이 하나도 없거나 (최초 실행)
-            # config.py의 기본 설정 중 DB에 누락된 항목이 있을 경우 초기화
-            if not current_settings or len(current_settings) < len(DEFAULT_SETTINGS):
-                LOGGER.info("User settings table empty or incomplete. Initializing default settings from config.py.")
-                
-                # config.py의 모든 기본값을 확인하며 누락된 값만 삽입
-                for key, value in DEFAULT_SETTINGS.items():
-                    if key not in current_settings:
-                        # 2. user_settings 테이블에 삽입
-                        data = {
-                            "setting_key": key,
-                            "setting_value": str(value), # 모든 값은 문자열로 저장
-                            "setting_type": type(value).__name__,
-                            "description": f"Default setting for {key}", # 초기 설명
-                            "modified_date": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        }
-                        # 트랜잭션 없이 BaseModel의 insert를 통해 개별 삽입
-                        self.insert(data)
-                        
-                LOGGER.info("Default settings initialization complete.")
+            # 키 존재 여부만 필요하므로 값 타입 변환을 수반하는 get_all_settings 대신
+            # 한 번의 조회로 키 집합을 만들고 누락 키를 집합 차로 구합니다.
+            existing_keys = {row['setting_key'] for row in self.select_all()}
+            missing = [key for key in DEFAULT_SETTINGS if key not in existing_keys]
+            if not missing:
+                return
+
+            LOGGER.info("User settings table empty or incomplete. Initializing default settings from config.py.")
+
+            now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            rows = [
+                {
+                    "setting_key": key,
+                    "setting_value": json.dumps(DEFAULT_SETTINGS[key]), # 타입 보존 JSON 직렬화
+                    "setting_type": "json",
+                    "description": f"Default setting for {key}", # 초기 설명
+                    "modified_date": now
+                }
+                for key in missing
+            ]
+            # 단일 트랜잭션 + executemany로 일괄 삽입 (키당 개별 커밋 제거)
+            self.bulk_insert(rows)
+
+            LOGGER.info("Default settings initialization complete.")
 
         except Exception as e:
             LOGGER.error(f"Failed to initialize default settings: {e}")
             # 이 시점에서 DB 연결이 불가능하면 애플리케이션 실행 불가
 
+    def _migrate_settings_to_json(self):
+        """
+        문자열 + setting_type으로 저장된 구 형식 행을 JSON 표현으로 재인코딩합니다.
+        (1회성 마이그레이션 - 이후에는 조회 시 json.loads 한 번으로 타입이 복원됨)
+        """
+        try:
+            legacy_rows = self.select_all(where_clause="setting_type != 'json'")
+            if not legacy_rows:
+                return
+
+            updates = [
+                (json.dumps(_coerce_value(row['setting_value'],
+                                          row.get('setting_type', 'string'))),
+                 row['setting_key'])
+                for row in legacy_rows
+            ]
+            # 단일 트랜잭션으로 일괄 변환 (예외 시 전체 롤백)
+            # 기동 시 상태 바 집계 워커와 동시 실행되므로 공유 연결 락을 유지
+            with self.db.lock, self.db._conn:
+                self.db._conn.executemany(
+                    f"UPDATE {self.TABLE_NAME} SET setting_value = ?, setting_type = 'json' "
+                    f"WHERE setting_key = ?",
+                    updates
+                )
+            self.clear_cache()
+            LOGGER.info(f"Migrated {len(updates)} settings rows to JSON storage.")
+        except Exception as e:
+            # 마이그레이션 실패 시에도 레거시 읽기 경로(_COERCE)가 동작하므로 치명적이지 않음
+            LOGGER.error(f"Failed to migrate settings to JSON: {e}")
+
     # --- 2. 설정 읽기/쓰기 ---
 
     def get_setting(self, key: str) -> Optional[Any]:
         """
         특정 설정 키의 값을 반환합니다. 값은 저장된 타입으로 변환됩니다.
         """
+        # 1. 캐시 확인 (TTL 이내면 DB 조회 생략)
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._CACHE_TTL:
+            return cached[1]
+
         setting_data = self.select_by_id(key)
         if setting_data:
-            value = setting_data['setting_value']
-            # 저장된 setting_type에 따라 적절하게 타입 변환
-            setting_type = setting_data.get('setting_type', 'string')
-            
-            if setting_type == 'integer':
-                return int(value)
-            elif setting_type == 'float':
-                return float(value)
-            elif setting_type == 'boolean':
-                return value.lower() in ('true', '1')
+            # 저장된 setting_type에 따라 적절하게 타입 변환 (모듈 레벨 디스패치 테이블 사용)
+            value = _coerce_value(setting_data['setting_value'],
+                                  setting_data.get('setting_type', 'string'))
+            self._cache[key] = (time.monotonic(), value)
             return value
         
         # DB에 없을 경우 config.py의 기본값을 확인하여 반환 (안정성 강화)
@@ -94,13 +162,16 @@ class SettingsModel(BaseModel):
         """
         모든 설정 키-값 쌍을 딕셔너리 형태로 반환합니다.
         """
-        all_rows = self.select_all()
+        # select_all()이 이미 모든 컬럼을 가져오므로 키별 재조회(N+1) 없이
+        # 행에서 바로 타입 변환합니다. 변환 결과는 키별 캐시에도 채워 넣습니다.
+        now = time.monotonic()
         settings = {}
-        for row in all_rows:
-            key = row['setting_key']
-            value = self.get_setting(key) # 타입 변환된 값 사용
+        for row in self.select_all():
+            value = _coerce_value(row['setting_value'],
+                                  row.get('setting_type', 'string'))
             if value is not None:
-                settings[key] = value
+                settings[row['setting_key']] = value
+                self._cache[row['setting_key']] = (now, value)
         return settings
 
     def update_setting(self, key: str, value: Any) -> bool:
@@ -108,11 +179,15 @@ class SettingsModel(BaseModel):
         특정 설정 키의 값을 업데이트합니다.
         """
         data = {
-            "setting_value": str(value),
-            "setting_type": type(value).__name__,
+            "setting_value": json.dumps(value), # 타입 보존 JSON 직렬화 (리스트/딕셔너리 가능)
+            "setting_type": "json",
             "modified_date": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
-        return self.update(key, data)
+        success = self.update(key, data)
+        if success:
+            # 변경된 키만 무효화 (다음 조회 시 DB에서 다시 읽어 캐시 갱신)
+            self._cache.pop(key, None)
+        return success
 
     def is_dark_mode(self) -> bool:
         """
@@ -17,15 +17,11 @@ LOGGER = setup_logger()
 # 레벨 3: 7일 후
 # 레벨 4: 14일 후
 # 레벨 5: 30일 후 (마스터)
-SRS_INTERVALS = {
-    0: 1,
-    1: 3,
-    2: 7,
-    3: 14,
-    4: 30,
-    5: 365, # 마스터 레벨은 1년 후 재확인
-}
-MAX_MASTERY_LEVEL = 5
+# 레벨(인덱스) -> 간격(일). 답안마다 조회되는 고정 매핑이므로 튜플 인덱싱 사용
+SRS_INTERVALS = (1, 3, 7, 14, 30, 365) # 마스터 레벨(5)은 1년 후 재확인
+# 호출마다 timedelta를 새로 만들지 않도록 레벨별 간격을 미리 생성
+SRS_INTERVAL_DELTAS = tuple(timedelta(days=d) for d in SRS_INTERVALS)
+MAX_MASTERY_LEVEL = len(SRS_INTERVALS) - 1
 
 class StatisticsModel(BaseModel):
     """
@@ -55,57 +51,102 @@ class StatisticsModel(BaseModel):
             # 오답: 레벨 0으로 초기화
             new_level = 0
             
-        # 2. 다음 복습 간격 계산
-        interval = SRS_INTERVALS.get(new_level, 1) # 레벨 0을 기본으로
-        
-        # 3. 다음 복습일 계산
-        next_review_date = (datetime.now() + timedelta(days=interval)).strftime('%Y-%m-%d 00:00:00')
-        
+        # 2. 다음 복습일 계산 (미리 생성해 둔 timedelta를 레벨로 직접 인덱싱)
+        next_review_date = (datetime.now() + SRS_INTERVAL_DELTAS[new_level]).strftime('%Y-%m-%d 00:00:00')
+
         return new_level, next_review_date
 
     # --- 외부 호출 기능 ---
 
+    # UPSERT의 UPDATE 경로용 SQL 식들 (클래스 정의 시 1회 구성)
+    # 새 레벨: 정답(? = 1)이면 기존 레벨 +1 (상한 MAX), 오답이면 0으로 초기화
+    _NEW_LEVEL_SQL = f"CASE WHEN ? = 1 THEN MIN(mastery_level + 1, {MAX_MASTERY_LEVEL}) ELSE 0 END"
+    # 레벨 -> 복습 간격(일) 매핑 (SRS_INTERVALS와 동일한 단일 출처)
+    _INTERVAL_SQL = ("CASE {level} "
+                     + ' '.join(f"WHEN {lvl} THEN {days}"
+                                for lvl, days in enumerate(SRS_INTERVALS))
+                     + " END")
+
     def update_statistics(self, word_id: int, is_correct: bool) -> bool:
         """
         단어의 학습 결과를 반영하여 통계를 업데이트합니다.
-        통계 레코드가 없으면 새로 생성합니다.
+        word_id UNIQUE 제약을 이용한 단일 UPSERT로, 기존의
+        SELECT 후 INSERT/UPDATE 분기(호출당 2~3회 왕복)를 1회 왕복으로 줄입니다.
         """
-        current_stats = self.select_all(where_clause="word_id = ?", params=(word_id,))
+        # 최초 학습(INSERT 경로)은 레벨 0에서 시작하므로 Python에서 한 번 계산
+        new_level, next_review_date = self._calculate_next_review(0, is_correct)
         now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        if not current_stats:
-            # 1. 통계 레코드가 없을 경우 (최초 학습)
-            current_level = 0
-            
-            # 최초 학습의 정답 여부로 다음 레벨 및 복습일 계산
-            new_level, next_review_date = self._calculate_next_review(current_level, is_correct)
-            
-            insert_data = {
-                "word_id": word_id,
-                "total_attempts": 1,
-                "correct_count": 1 if is_correct else 0,
-                "last_review": now,
-                "next_review": next_review_date,
-                "mastery_level": new_level
-            }
-            # BaseModel의 insert 메서드는 stats_id (PK)를 반환
-            return self.insert(insert_data) is not None
-        else:
-            # 2. 통계 레코드가 있을 경우 (업데이트)
-            stats = current_stats[0] # word_id는 UNIQUE 제약 조건으로 인해 1개만 존재
-            stats_id = stats['stats_id']
-            current_level = stats['mastery_level']
-            
-            new_level, next_review_date = self._calculate_next_review(current_level, is_correct)
-            
-            update_data = {
-                "total_attempts": stats['total_attempts'] + 1,
-                "correct_count": stats['correct_count'] + (1 if is_correct else 0),
-                "last_review": now,
-                "next_review": next_review_date,
-                "mastery_level": new_level
-            }
-            return self.update(stats_id, update_data)
+        correct_inc = 1 if is_correct else 0
+
+        # UPDATE 경로의 새 레벨/복습일은 DB에 있는 기존 mastery_level에 의존하므로
+        # SQL CASE 식으로 계산 (UPDATE의 우변은 모두 갱신 전 값을 참조)
+        interval_expr = self._INTERVAL_SQL.format(level=f"({self._NEW_LEVEL_SQL})")
+        sql = f"""
+            INSERT INTO {self.TABLE_NAME}
+            (word_id, total_attempts, correct_count, last_review, next_review, mastery_level)
+            VALUES (?, 1, ?, ?, ?, ?)
+            ON CONFLICT(word_id) DO UPDATE SET
+                total_attempts = total_attempts + 1,
+                correct_count = correct_count + ?,
+                last_review = excluded.last_review,
+                mastery_level = {self._NEW_LEVEL_SQL},
+                next_review = strftime('%Y-%m-%d 00:00:00', 'now', 'localtime',
+                                       '+' || {interval_expr} || ' days')
+        """
+        params = (word_id, correct_inc, now, next_review_date, new_level,
+                  correct_inc, correct_inc, correct_inc)
+
+        try:
+            self.db.connect()
+            cursor = self.db.execute(sql, params)
+            if cursor and cursor.rowcount > 0:
+                self.db.commit()
+                return True
+            return False
+        except Exception as e:
+            LOGGER.error(f"Failed to upsert statistics for word ID {word_id}. Error: {e}")
+            return False
+
+    def update_statistics_bulk(self, results: List[Tuple[int, bool]]) -> bool:
+        """
+        (word_id, is_correct) 튜플 목록을 update_statistics와 동일한 UPSERT로
+        단일 트랜잭션 + executemany 처리합니다. (세션 종료 시 일괄 반영용)
+        """
+        if not results:
+            return True
+
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        interval_expr = self._INTERVAL_SQL.format(level=f"({self._NEW_LEVEL_SQL})")
+        sql = f"""
+            INSERT INTO {self.TABLE_NAME}
+            (word_id, total_attempts, correct_count, last_review, next_review, mastery_level)
+            VALUES (?, 1, ?, ?, ?, ?)
+            ON CONFLICT(word_id) DO UPDATE SET
+                total_attempts = total_attempts + 1,
+                correct_count = correct_count + ?,
+                last_review = excluded.last_review,
+                mastery_level = {self._NEW_LEVEL_SQL},
+                next_review = strftime('%Y-%m-%d 00:00:00', 'now', 'localtime',
+                                       '+' || {interval_expr} || ' days')
+        """
+
+        rows = []
+        for word_id, is_correct in results:
+            new_level, next_review_date = self._calculate_next_review(0, is_correct)
+            correct_inc = 1 if is_correct else 0
+            rows.append((word_id, correct_inc, now, next_review_date, new_level,
+                         correct_inc, correct_inc, correct_inc))
+
+        try:
+            self.db.connect()
+            # 예외 발생 시 전체 롤백되도록 연결 객체의 트랜잭션 컨텍스트 사용
+            # (트랜잭션 동안 공유 연결 락을 유지 - 다른 스레드의 커밋과 격리)
+            with self.db.lock, self.db._conn:
+                self.db._conn.executemany(sql, rows)
+            return True
+        except Exception as e:
+            LOGGER.error(f"Failed to bulk upsert statistics for {len(rows)} words. Error: {e}")
+            return False
 
     def select_review_words(self, limit: int) -> List[Dict[str, Any]]:
         """
@@ -135,105 +176,144 @@ class StatisticsModel(BaseModel):
         except Exception as e:
             LOGGER.error(f"Failed to select review words. Error: {e}")
             return []
-        finally:
-            self.db.close()
             
-    def get_mastery_distribution(self) -> Dict[int, int]:
+    def count_review_due(self) -> int:
         """
-        숙련도 레벨별 단어 수를 반환합니다. (통계 대시보드용)
+        오늘 날짜를 기준으로 복습이 필요한 단어 수를 반환합니다.
+        select_review_words와 동일한 조건으로 COUNT(*)만 수행합니다. (대시보드 집계용)
         """
+        today = datetime.now().strftime('%Y-%m-%d 23:59:59')
+
         sql = f"""
-            SELECT mastery_level, COUNT(word_id) as count
-            FROM {self.TABLE_NAME}
-            GROUP BY mastery_level
-            ORDER BY mastery_level ASC
+            SELECT COUNT(*) AS c
+            FROM words W
+            INNER JOIN {self.TABLE_NAME} S ON W.word_id = S.word_id
+            WHERE W.is_deleted = 0
+              AND S.next_review <= ?
         """
-        
+
         try:
             self.db.connect()
-            rows = self.db.fetchall(sql)
-            distribution = {row['mastery_level']: row['count'] for row in rows}
-            
-            # 레벨 0부터 MAX_MASTERY_LEVEL까지의 모든 레벨 포함 (데이터가 없는 레벨은 0으로)
-            full_distribution = {level: distribution.get(level, 0) for level in range(MAX_MASTERY_LEVEL + 1)}
-            return full_distribution
+            row = self.db.fetchone(sql, (today,))
+            return row['c'] if row else 0
         except Exception as e:
-            LOGGER.error(f"Failed to get mastery distribution. Error: {e}")
-            return {}
-        finally:
-            self.db.close()
+            LOGGER.error(f"Failed to count review due words. Error: {e}")
+            return 0
 
-    def get_proficiency_distribution(self) -> Dict[int, int]:
+    def get_dashboard_counts(self) -> Dict[str, Any]:
         """
-        단어 숙련도 레벨(mastery_level)별 단어 분포를 가져옵니다.
+        대시보드의 스칼라 지표(전체/복습/오답 단어 수, 오늘 학습 시간)를
+        단일 쿼리로 한 번에 조회합니다. 각 서브쿼리 조건은 해당 목록 쿼리와 동일합니다.
         """
+        today_end = datetime.now().strftime('%Y-%m-%d 23:59:59')
+        today_start = datetime.now().strftime('%Y-%m-%d 00:00:00')
+
         sql = """
-            SELECT 
-                ws.mastery_level,
-                COUNT(ws.word_id) as word_count
-            FROM 
-                word_statistics ws
-            JOIN
-                words w ON ws.word_id = w.word_id
-            WHERE
-                w.is_deleted = 0
-            GROUP BY 
-                ws.mastery_level
-            ORDER BY
-                ws.mastery_level;
+            SELECT
+                (SELECT COUNT(*) FROM words WHERE is_deleted = 0) AS total_words,
+                (SELECT COUNT(*) FROM words W
+                    INNER JOIN word_statistics S ON W.word_id = S.word_id
+                    WHERE W.is_deleted = 0 AND S.next_review <= ?) AS review_due,
+                (SELECT COUNT(*) FROM words W
+                    INNER JOIN wrong_note N ON W.word_id = N.word_id
+                    WHERE W.is_deleted = 0) AS wrong_notes,
+                (SELECT COUNT(DISTINCT word_id) FROM learning_history
+                    WHERE learning_date >= ?) AS today_words,
+                (SELECT COALESCE(SUM(JULIANDAY(end_time) - JULIANDAY(start_time)), 0) * 24 * 60
+                    FROM learning_sessions
+                    WHERE is_completed = 1 AND start_time >= ?) AS today_minutes
+        """
+
+        try:
+            self.db.connect()
+            row = self.db.fetchone(sql, (today_end, today_start, today_start))
+            if row:
+                return {
+                    "total_words": row["total_words"],
+                    "review_due": row["review_due"],
+                    "wrong_notes": row["wrong_notes"],
+                    "today_words": row["today_words"],
+                    "today_minutes": round(row["today_minutes"], 1),
+                }
+            return {"total_words": 0, "review_due": 0, "wrong_notes": 0,
+                    "today_words": 0, "today_minutes": 0.0}
+        except Exception as e:
+            LOGGER.error(f"Failed to get dashboard counts. Error: {e}")
+            return {"total_words": 0, "review_due": 0, "wrong_notes": 0,
+                    "today_words": 0, "today_minutes": 0.0}
+
+    def get_mastery_distribution(self) -> Dict[int, int]:
+        """
+        숙련도 레벨별 단어 수를 레벨 0~MAX까지 빠짐없이 반환합니다. (통계 대시보드용)
+        재귀 CTE로 전체 레벨 축을 만들어 LEFT JOIN하므로, 데이터가 없는 레벨의
+        0 채우기까지 SQL 한 번에 끝납니다. (Python 후처리 없음)
+        """
+        sql = f"""
+            WITH RECURSIVE levels(level) AS (
+                VALUES(0)
+                UNION ALL
+                SELECT level + 1 FROM levels WHERE level < {MAX_MASTERY_LEVEL}
+            )
+            SELECT L.level, COALESCE(S.cnt, 0) AS cnt
+            FROM levels L
+            LEFT JOIN (
+                SELECT ws.mastery_level, COUNT(ws.word_id) AS cnt
+                FROM {self.TABLE_NAME} ws
+                JOIN words w ON ws.word_id = w.word_id
+                WHERE w.is_deleted = 0
+                GROUP BY ws.mastery_level
+            ) S ON S.mastery_level = L.level
+            ORDER BY L.level ASC
         """
+
         try:
             self.db.connect()
-            results = self.db.fetchall(sql)
-            # {0: 10, 1: 20, ...} 형태의 딕셔너리로 변환
-            return {row['mastery_level']: row['word_count'] for row in results if row}
+            rows = self.db.fetchall(sql)
+            return {row['level']: row['cnt'] for row in rows}
         except Exception as e:
-            LOGGER.error(f"Error fetching proficiency distribution: {e}")
+            LOGGER.error(f"Failed to get mastery distribution. Error: {e}")
             return {}
-        finally:
-            self.db.close()
+
+    def get_proficiency_distribution(self) -> Dict[int, int]:
+        """
+        get_mastery_distribution의 별칭입니다. (중복 쿼리 경로 통합 - 기존 호출부 호환용)
+        """
+        return self.get_mastery_distribution()
 
     def get_daily_correct_rate_trend(self, days: int) -> List[Dict[str, Any]]:
         """
         지난 'days' 동안의 일별 정답률 추이를 가져옵니다.
         """
-        # SQLite는 1-based 인덱싱이 아닌 0-based 인덱싱을 지원하므로, DATETIME 함수 사용.
         # N일 전 날짜를 계산하여 해당 날짜 이후의 기록만 가져옵니다.
-        sql = f"""
+        # 일수는 f-string 대신 파라미터로 바인딩해 SQL 문장이 항상 동일하게 유지되도록
+        # 합니다 (prepared statement 캐시 재사용).
+        # 정답률 계산까지 SQL에서 수행 (행당 Python 나눗셈/round 제거)
+        # GROUP BY 결과행은 항상 COUNT >= 1이므로 0 나누기 분기가 필요 없음
+        sql = """
             SELECT
                 STRFTIME('%Y-%m-%d', learning_date) AS learning_day,
-                SUM(CASE WHEN is_correct = 1 THEN 1 ELSE 0 END) AS correct_count,
+                ROUND(100.0 * SUM(CASE WHEN is_correct = 1 THEN 1 ELSE 0 END)
+                      / COUNT(history_id), 1) AS rate,
                 COUNT(history_id) AS total_count
             FROM
                 learning_history
             WHERE
-                learning_date >= STRFTIME('%Y-%m-%d', DATE('now', '-{days} days'))
+                learning_date >= STRFTIME('%Y-%m-%d', DATE('now', ?))
             GROUP BY
                 learning_day
             ORDER BY
                 learning_day ASC;
         """
-        
-        trend_data = []
+
         try:
             self.db.connect()
-            results = self.db.fetchall(sql)
-            
-            for row in results:
-                total = row['total_count']
-                correct = row['correct_count']
-                rate = round((correct / total) * 100, 1) if total > 0 else 0
-                
-                trend_data.append({
-                    'date': row['learning_day'],
-                    'rate': rate,
-                    'total': total # 차트 툴팁 등을 위해 total도 함께 반환
-                })
-            
-            return trend_data
-        
+            # 내부 집계용이므로 가벼운 namedtuple 행으로 조회
+            results = self.db.fetchall_namedtuple(sql, (f'-{int(days)} days',))
+
+            # 차트 툴팁 등을 위해 total도 함께 반환
+            return [{'date': row.learning_day, 'rate': row.rate, 'total': row.total_count}
+                    for row in results]
+
         except Exception as e:
             LOGGER.error(f"Error fetching daily correct rate trend: {e}")
-            return []
-        finally:
-            self.db.close()
\ No newline at end of file
+            return []
\ No newline at end of file
@@ -1,7 +1,6 @@
-from typing import List, Dict, Any, Optional, Tuple
-from models.base_model import BaseModel
+from typing import Iterator, List, Dict, Any, Optional, Tuple
+from models.base_model import BaseModel, SQL_NOW
 from utils.logger import setup_logger
-from datetime import datetime
 
 # 2025-10-20 - 스마트 단어장 - 단어 데이터 모델
 # 파일 위치: models/word_model.py - v1
@@ -27,20 +26,96 @@ class WordModel(BaseModel):
 
     # --- 단어 특화 Read 기능 ---
 
-    def select_active_words(self) -> List[Dict[str, Any]]:
+    def select_active_words(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         논리적으로 삭제되지 않은(is_deleted=0) 모든 단어를 반환합니다.
+        limit이 주어지면 SQL LIMIT으로 해당 개수만 가져옵니다.
         """
         # created_date 순으로 정렬하여 최신 단어가 뒤에 오도록 함
-        return self.select_all(where_clause="is_deleted = 0 ORDER BY created_date ASC")
+        if limit is not None:
+            return list(self.iter_active_words(limit=limit))
+        # 정렬은 where_clause에 SQL 조각을 섞지 않고 order_by 인자로 전달
+        return self.select_all(where_clause="is_deleted = 0",
+                               order_by="created_date ASC")
 
-    def select_by_category(self, category: str) -> List[Dict[str, Any]]:
+    def iter_active_words(self, limit: Optional[int] = None,
+                          offset: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        활성 단어를 커서에서 지연 순회하며 yield합니다. (대량 목록의 스트리밍용)
+        전체 리스트를 구체화하지 않으므로 첫 행이 즉시 나오고 메모리가 일정하게
+        유지됩니다. 페이지 단위 조회는 limit/offset을 함께 지정합니다.
+        """
+        where = "is_deleted = 0 ORDER BY created_date ASC"
+        params: Tuple[Any, ...] = ()
+        if limit is not None:
+            where += " LIMIT ?"
+            params = (limit,)
+            if offset is not None:
+                where += " OFFSET ?"
+                params = (limit, offset)
+        return self.iter_all(where_clause=where, params=params)
+
+    def iter_all_words(self, include_deleted: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        전체 단어를 커서에서 지연 순회하며 yield합니다. (CSV 내보내기 등 스트리밍용)
+        리스트를 구체화하지 않으므로 단어 수와 무관하게 메모리가 일정합니다.
+        """
+        where = "1=1" if include_deleted else "is_deleted = 0"
+        return self.iter_all(where_clause=where, order_by="created_date ASC")
+
+    def count_all_words(self, include_deleted: bool = False) -> int:
+        """
+        전체 단어 수를 COUNT(*) 한 번으로 집계하여 반환합니다.
+        """
+        sql = f"SELECT COUNT(*) AS c FROM {self.TABLE_NAME}"
+        if not include_deleted:
+            sql += " WHERE is_deleted = 0"
+
+        try:
+            self.db.connect()
+            row = self.db.fetchone(sql)
+            return row['c'] if row else 0
+        except Exception as e:
+            LOGGER.error(f"Failed to count words. Error: {e}")
+            return 0
+
+    def count_active_words(self) -> int:
+        """
+        논리적으로 삭제되지 않은(is_deleted=0) 전체 단어 수를 반환합니다.
+        대시보드 집계용으로, 전체 행을 가져오지 않고 COUNT(*)만 수행합니다.
+        """
+        sql = f"SELECT COUNT(*) AS c FROM {self.TABLE_NAME} WHERE is_deleted = 0"
+
+        try:
+            self.db.connect()
+            row = self.db.fetchone(sql)
+            return row['c'] if row else 0
+        except Exception as e:
+            LOGGER.error(f"Failed to count active words. Error: {e}")
+            return 0
+
+    def select_by_category(self, category: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         특정 카테고리에 속하며 삭제되지 않은 단어 목록을 반환합니다.
+        limit이 주어지면 SQL LIMIT으로 해당 개수만 가져옵니다.
         """
+        if limit is not None:
+            where = "is_deleted = 0 AND category = ? LIMIT ?"
+            return self.select_all(where_clause=where, params=(category, limit))
         where = "is_deleted = 0 AND category = ?"
         return self.select_all(where_clause=where, params=(category,))
 
+    def select_random_active(self, limit: int, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        삭제되지 않은 단어 중 무작위로 limit개를 반환합니다. (학습/시험 랜덤 출제용)
+        ORDER BY RANDOM() LIMIT으로 필요한 행만 Python으로 가져옵니다.
+        """
+        if category is not None:
+            where = "is_deleted = 0 AND category = ? ORDER BY RANDOM() LIMIT ?"
+            return self.select_all(where_clause=where, params=(category, limit))
+        where = "is_deleted = 0 ORDER BY RANDOM() LIMIT ?"
+        return self.select_all(where_clause=where, params=(limit,))
+
     def select_favorites(self) -> List[Dict[str, Any]]:
         """
         즐겨찾기 된 단어(is_favorite=1) 목록을 반환합니다.
@@ -48,13 +123,59 @@ class WordModel(BaseModel):
         where = "is_deleted = 0 AND is_favorite = 1"
         return self.select_all(where_clause=where)
 
+    # FTS5 사용 가능 여부 (최초 검색 시 1회 확인)
+    _fts_available: Optional[bool] = None
+
+    def _is_fts_available(self) -> bool:
+        """
+        words_fts 가상 테이블 사용 가능 여부를 확인합니다. (FTS5 미지원 빌드 대비)
+        """
+        if WordModel._fts_available is None:
+            self.db.connect()
+            probe = self.db.fetchone("SELECT count(*) AS c FROM words_fts LIMIT 1")
+            WordModel._fts_available = probe is not None
+            if not WordModel._fts_available:
+                LOGGER.warning("FTS5 index unavailable. Falling back to LIKE search.")
+        return WordModel._fts_available
+
     def search_words(self, keyword: str, search_by: str = 'all') -> List[Dict[str, Any]]:
         """
         키워드로 단어(word_text)나 의미(meaning_ko)를 검색합니다.
         search_by: 'word_text', 'meaning_ko', 'all' 중 하나.
+        FTS5 역색인으로 접두사 검색을 수행하고, FTS 미지원 시 LIKE 검색으로 대체합니다.
+        """
+        if not self._is_fts_available():
+            return self._search_words_like(keyword, search_by)
+
+        # 키워드를 구문으로 감싸 FTS 쿼리 문법 오류를 방지하고 접두사 매칭(*) 적용
+        quoted = '"' + keyword.replace('"', '""') + '"*'
+        if search_by == 'word_text':
+            match = f'word_text : {quoted}'
+        elif search_by == 'meaning_ko':
+            match = f'meaning_ko : {quoted}'
+        else: # 'all'
+            match = quoted
+
+        sql = """
+            SELECT W.* FROM words_fts F
+            JOIN words W ON W.word_id = F.rowid
+            WHERE words_fts MATCH ? AND W.is_deleted = 0
+        """
+
+        try:
+            self.db.connect()
+            rows = self.db.fetchall(sql, (match,))
+            return [dict(row) for row in rows]
+        except Exception as e:
+            LOGGER.error(f"FTS search failed for '{keyword}': {e}")
+            return self._search_words_like(keyword, search_by)
+
+    def _search_words_like(self, keyword: str, search_by: str = 'all') -> List[Dict[str, Any]]:
+        """
+        LIKE 기반 부분 문자열 검색 (FTS5 미지원 환경 대체 경로).
         """
         keyword_like = f"%{keyword}%"
-        
+
         if search_by == 'word_text':
             where = "is_deleted = 0 AND word_text LIKE ?"
             params = (keyword_like,)
@@ -67,6 +188,155 @@ class WordModel(BaseModel):
 
         return self.select_all(where_clause=where, params=params)
 
+    # --- 단어 특화 Create/Update 기능 (중복 검사 인라인) ---
+
+    def insert_if_absent(self, data: Dict[str, Any]) -> Optional[int]:
+        """
+        word_text가 중복되지 않을 때만 단어를 삽입합니다.
+        INSERT OR IGNORE 한 문장으로 기존의 SELECT(is_word_exist)+INSERT 왕복을 대체합니다.
+        반환: 새 word_id / 중복이면 0 / 오류 시 None
+        """
+        # 타임스탬프는 SQLite 측 strftime으로 기록 (Python 포매팅 생략, BaseModel과 동일 패턴)
+        auto_cols = [c for c in ('created_date', 'modified_date') if c not in data]
+        columns = ', '.join(list(data.keys()) + auto_cols)
+        placeholders = ', '.join(['?'] * len(data) + [SQL_NOW] * len(auto_cols))
+        sql = f"INSERT OR IGNORE INTO {self.TABLE_NAME} ({columns}) VALUES ({placeholders})"
+
+        try:
+            self.db.connect()
+            cursor = self.db.execute(sql, tuple(data.values()))
+            if cursor is None:
+                return None
+            if cursor.rowcount == 0:
+                # UNIQUE(word_text) 충돌 - 이미 존재하는 단어
+                return 0
+            self.db.commit()
+            LOGGER.info(f"Inserted into {self.TABLE_NAME}. ID: {cursor.lastrowid}")
+            return cursor.lastrowid
+        except Exception as e:
+            LOGGER.error(f"Failed to insert word (if absent). Error: {e}")
+            return None
+
+    def upsert_many(self, rows: List[Dict[str, Any]]) -> Optional[Dict[str, int]]:
+        """
+        여러 단어를 단일 트랜잭션의 UPSERT 일괄 구문으로 삽입/갱신합니다. (CSV 임포트용)
+        word_text UNIQUE 제약을 이용해 신규 단어는 삽입, 기존 단어는 내용 갱신을
+        SQLite가 한 구문에서 처리하므로 행당 SELECT+INSERT/UPDATE 왕복이 없습니다.
+        반환: {'total', 'added', 'updated', 'skipped'} 또는 오류 시 None
+        """
+        if not rows:
+            return {'total': 0, 'added': 0, 'updated': 0, 'skipped': 0}
+
+        upsert_sql = f"""
+            INSERT INTO {self.TABLE_NAME}
+            (word_text, meaning_ko, category, memo, is_favorite, is_deleted,
+             created_date, modified_date)
+            VALUES (?, ?, ?, ?, ?, 0, {SQL_NOW}, {SQL_NOW})
+            ON CONFLICT(word_text) DO UPDATE SET
+                meaning_ko = excluded.meaning_ko,
+                category = excluded.category,
+                memo = excluded.memo,
+                is_favorite = excluded.is_favorite,
+                is_deleted = 0,
+                modified_date = excluded.modified_date
+        """
+        def clean(value) -> str:
+            # None과 NaN(자기 자신과 비교가 거짓)을 빈 문자열로 정규화
+            # - str(NaN)이 'nan'이라는 가짜 값으로 저장되는 것을 방지
+            if value is None or value != value:
+                return ''
+            return str(value).strip()
+
+        params = []
+        skipped = 0
+        for r in rows:
+            word_text = clean(r.get('word_text'))
+            meaning_ko = clean(r.get('meaning_ko'))
+            if not word_text or not meaning_ko:
+                # 필수 값이 비어 있는 행은 저장하지 않고 건너뜀으로 집계
+                skipped += 1
+                continue
+            fav = r.get('is_favorite', 0)
+            params.append((
+                word_text,
+                meaning_ko,
+                clean(r.get('category')) or '미분류',
+                clean(r.get('memo')),
+                0 if fav is None or fav != fav else int(fav),
+            ))
+
+        total = len(rows)
+        if not params:
+            return {'total': total, 'added': 0, 'updated': 0, 'skipped': skipped}
+        try:
+            self.db.connect()
+            # 트랜잭션 하나로 묶어 원자성 보장 (예외 시 전체 롤백)
+            # 임포트 워커 스레드에서 실행되므로 트랜잭션 동안 공유 연결 락을 유지
+            with self.db.lock, self.db._conn:
+                # added/updated 집계를 위해 기존 word_text 수를 먼저 센다.
+                # 같은 배치 안의 중복 word_text는 한 행으로 합쳐지므로(UNIQUE),
+                # 집계도 고유 텍스트 기준으로 해야 반복 행이 '추가'로 부풀지 않음
+                # (IN 절 파라미터 수 제한을 피하기 위해 500개씩 분할)
+                texts = list({p[0] for p in params})
+                existing = 0
+                for i in range(0, len(texts), 500):
+                    chunk = texts[i:i + 500]
+                    placeholders = ', '.join(['?'] * len(chunk))
+                    row = self.db._conn.execute(
+                        f"SELECT COUNT(*) AS c FROM {self.TABLE_NAME} "
+                        f"WHERE word_text IN ({placeholders})",
+                        chunk
+                    ).fetchone()
+                    existing += row['c']
+
+                # 예외가 롤백으로 이어지도록 커넥션의 executemany를 직접 사용
+                self.db._conn.executemany(upsert_sql, params)
+
+            # 신규는 고유 텍스트 중 기존에 없던 수, 나머지 행(같은 배치 내
+            # 반복 포함)은 모두 기존 행 갱신으로 집계
+            added = len(texts) - existing
+            updated = len(params) - added
+            LOGGER.info(f"Upserted {len(params)} words into {self.TABLE_NAME}. "
+                        f"Added: {added}, Updated: {updated}, Skipped: {skipped}")
+            return {'total': total, 'added': added, 'updated': updated, 'skipped': skipped}
+        except Exception as e:
+            LOGGER.error(f"Failed to upsert words batch. Rolled back. Error: {e}")
+            return None
+
+    def update_checked(self, word_id: int, data: Dict[str, Any]) -> bool:
+        """
+        다른 활성 단어와 word_text가 중복되지 않을 때만 레코드를 업데이트합니다.
+        중복 검사를 UPDATE 문의 WHERE 절에 인라인하여 별도 SELECT 왕복을 제거합니다.
+        """
+        if not data:
+            return False
+
+        set_sql = ', '.join([f"{col} = ?" for col in data.keys()])
+        if 'modified_date' not in data:
+            set_sql += f", modified_date = {SQL_NOW}"
+        sql = f"""
+            UPDATE {self.TABLE_NAME} SET {set_sql}
+            WHERE {self.PRIMARY_KEY} = ?
+              AND NOT EXISTS (
+                  SELECT 1 FROM {self.TABLE_NAME}
+                  WHERE word_text = ? AND {self.PRIMARY_KEY} != ? AND is_deleted = 0
+              )
+        """
+        params = tuple(data.values()) + (word_id, data.get('word_text', ''), word_id)
+
+        try:
+            self.db.connect()
+            cursor = self.db.execute(sql, params)
+            if cursor and cursor.rowcount > 0:
+                self.db.commit()
+                LOGGER.info(f"Updated {self.TABLE_NAME} ID: {word_id}.")
+                return True
+            LOGGER.warning(f"Update on {self.TABLE_NAME} ID: {word_id} skipped (duplicate word_text or no rows).")
+            return False
+        except Exception as e:
+            LOGGER.error(f"Failed to update word ID {word_id}. Error: {e}")
+            return False
+
     # --- 단어 특화 Update 기능 ---
 
     def toggle_favorite(self, word_id: int, is_favorite: bool) -> bool:
@@ -89,13 +359,16 @@ class WordModel(BaseModel):
         이미 존재하는 단어인지 확인합니다 (중복 검사).
         exclude_id가 있으면 해당 ID의 단어는 검사에서 제외합니다 (수정 시 사용).
         """
-        sql = f"SELECT {self.PRIMARY_KEY} FROM {self.TABLE_NAME} WHERE word_text = ? AND is_deleted = 0"
+        # 존재 확인만 하면 되므로 컬럼 대신 상수 1을 선택하고 LIMIT 1로 조기 종료
+        # (word_text UNIQUE 제약의 인덱스를 타는 단일 프로브)
+        sql = f"SELECT 1 FROM {self.TABLE_NAME} WHERE word_text = ? AND is_deleted = 0"
         params: List[Any] = [word_text]
-        
+
         if exclude_id is not None:
             sql += f" AND {self.PRIMARY_KEY} != ?"
             params.append(exclude_id)
-        
+        sql += " LIMIT 1"
+
         try:
             self.db.connect()
             result = self.db.fetchone(sql, tuple(params))
@@ -103,8 +376,6 @@ class WordModel(BaseModel):
         except Exception as e:
             LOGGER.error(f"Error checking word existence: {e}")
             return True # 오류 발생 시 보수적으로 True 반환
-        finally:
-            self.db.close()
 
     def get_word_by_text(self, word_text: str) -> Optional[Dict[str, Any]]:
         """
@@ -121,20 +392,18 @@ class WordModel(BaseModel):
         except Exception as e:
             LOGGER.error(f"Error fetching word by text '{word_text}': {e}")
             return None
-        finally:
-            self.db.close()
 
     def update_word_by_text(self, word_text: str, data: Dict[str, Any]) -> bool:
         """
         단어 텍스트(word_text)를 기준으로 단어 정보를 업데이트합니다.
         CSV 임포트 시 기존 단어 정보를 갱신하는 데 사용됩니다.
         """
-        # updated_data에서 word_text는 제외하고, modified_date를 갱신합니다.
+        # updated_data에서 word_text는 제외하고, modified_date는 SQLite 측에서 갱신합니다.
         updated_data = {k: v for k, v in data.items() if k not in ['word_id', 'word_text', 'created_date']}
-        updated_data['modified_date'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        # SQL 쿼리 구성
+        # SQL 쿼리 구성 (행마다 Python strftime을 호출하지 않도록 SQL 식으로 기록)
         set_clause = ", ".join([f"{key} = ?" for key in updated_data.keys()])
+        set_clause += f", modified_date = {SQL_NOW}"
         sql = f"UPDATE {self.TABLE_NAME} SET {set_clause} WHERE word_text = ? AND is_deleted = 0"
         
         params = tuple(updated_data.values()) + (word_text,)
@@ -150,16 +419,12 @@ class WordModel(BaseModel):
             LOGGER.error(f"Error updating word by text '{word_text}': {e}")
             self.db.rollback()
             return False
-        finally:
-            self.db.close()
 
     def insert_word(self, data: Dict[str, Any]) -> Optional[int]:
         """
         새로운 단어를 words 테이블에 삽입하고, 성공 시 새 word_id를 반환합니다.
         CSV 임포트 및 단어 추가 다이얼로그에서 사용됩니다.
         """
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
         # 삽입할 데이터 딕셔너리 구성 및 기본값 처리
         insert_data = {
             'word_text': data.get('word_text', '').strip(),
@@ -167,14 +432,12 @@ class WordModel(BaseModel):
             'category': data.get('category', '미분류').strip(),
             'memo': data.get('memo', '').strip(),
             'is_favorite': int(data.get('is_favorite', 0)),
-            'created_date': now,
-            'modified_date': now,
             'is_deleted': 0
         }
 
-        # SQL 쿼리 구성
-        columns = ', '.join(insert_data.keys())
-        placeholders = ', '.join(['?' for _ in insert_data.keys()])
+        # SQL 쿼리 구성 (타임스탬프는 SQLite 측 strftime으로 기록)
+        columns = ', '.join(list(insert_data.keys()) + ['created_date', 'modified_date'])
+        placeholders = ', '.join(['?'] * len(insert_data) + [SQL_NOW, SQL_NOW])
         sql = f"INSERT INTO {self.TABLE_NAME} ({columns}) VALUES ({placeholders})"
         params = tuple(insert_data.values())
 
@@ -188,6 +451,4 @@ class WordModel(BaseModel):
         except Exception as e:
             LOGGER.error(f"Error inserting word: {e}")
             self.db.rollback()
-            return None
-        finally:
-            self.db.close()
\ No newline at end of file
+            return None
\ No newline at end of file
@@ -1,4 +1,5 @@
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any, Optional
+import csv
 import pandas as pd
 import os
 import sqlite3
@@ -31,130 +32,191 @@ class FileHandler:
             init_data_file (str): 초기 설정 데이터 삽입 SQL 파일 경로 (e.g., 'database/init_data.sql')
         """
         db_exists = os.path.exists(DATABASE_PATH)
-        
-        # 1. 스키마 파일 실행 (테이블 생성)
+
+        # 1. 스크립트 파일 읽기 (DB 연결 전에 모두 준비)
         try:
             with open(schema_file, 'r', encoding='utf-8') as f:
                 schema_sql = f.read()
-                
-            self.db_connector.connect()
-            # executescript는 여러 개의 SQL문을 한 번에 실행하는 데 유용
-            self.db_connector.executescripts(schema_sql)
-            self.db_connector.commit()
-            
-            LOGGER.info(f"Database schema loaded from {schema_file}.")
-
         except FileNotFoundError:
             LOGGER.error(f"Schema file not found: {schema_file}")
             return False
-        except sqlite3.Error as e:
-            LOGGER.error(f"Error executing schema SQL: {e}")
-            return False
-        finally:
-            self.db_connector.close()
-            
-        # 2. 초기 데이터 파일 실행 (설정값 삽입)
-        try:
-            if not db_exists:
-                # DB가 새로 생성되었을 때만 초기 데이터 삽입
+
+        init_sql = None
+        if not db_exists:
+            # DB가 새로 생성되었을 때만 초기 데이터 삽입
+            try:
                 with open(init_data_file, 'r', encoding='utf-8') as f:
                     init_sql = f.read()
-                    
-                self.db_connector.connect()
-                self.db_connector.execute_script(init_sql)
-                self.db_connector.commit()
-                LOGGER.info(f"Initial data loaded from {init_data_file}.")
-                
-        except FileNotFoundError:
-            LOGGER.warning(f"Initial data file not found: {init_data_file}. Skipping initial data load.")
-            # 초기 데이터는 필수가 아닐 수 있으므로 경고 처리
+            except FileNotFoundError:
+                # 초기 데이터는 필수가 아닐 수 있으므로 경고 처리
+                LOGGER.warning(f"Initial data file not found: {init_data_file}. Skipping initial data load.")
+
+        # 2. 스키마 + 초기 데이터를 하나의 연결에서 한 번에 실행
+        #    (연결은 프로세스 전역으로 유지되므로 여기서 닫지 않음)
+        try:
+            self.db_connector.connect()
+
+            # words_fts가 이번 실행에서 새로 만들어지는지 확인 (1회성 마이그레이션 판별)
+            fts_existed = self.db_connector.fetchone(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'words_fts'"
+            ) is not None
+
+            script = schema_sql if init_sql is None else schema_sql + '\n' + init_sql
+            if not self.db_connector.executescripts(script):
+                return False
+
+            if not fts_existed:
+                # FTS 테이블 신설 시에만: 기존 words 내용으로 인덱스를 구축하고
+                # 플래너 통계를 갱신. 이후 동기화는 스키마의 트리거가 담당하므로
+                # 매 기동마다 전체 재색인/ANALYZE를 반복하지 않음
+                if not self.db_connector.executescripts(
+                        "INSERT INTO words_fts(words_fts) VALUES ('rebuild');\nANALYZE;"):
+                    return False
+                LOGGER.info("FTS index built and statistics analyzed (first-time setup).")
+
+            LOGGER.info(f"Database schema loaded from {schema_file}."
+                        + (f" Initial data loaded from {init_data_file}." if init_sql else ""))
         except sqlite3.Error as e:
-            LOGGER.error(f"Error executing initial data SQL: {e}")
+            LOGGER.error(f"Error executing initialization SQL: {e}")
             return False
-        finally:
-            self.db_connector.close()
-            
+
         return True
 
     # --- 2. CSV Import/Export ---
 
-    def import_words_from_csv(self, file_path: str, word_model) -> List[Dict[str, Any]]:
+    # 임포트 대상 컬럼 (이 외의 컬럼은 usecols로 파싱 단계에서 제외)
+    IMPORT_COLS = ('word_text', 'meaning_ko', 'category', 'memo', 'is_favorite')
+    REQUIRED_COLS = ('word_text', 'meaning_ko', 'category')
+    # 청크 단위 스트리밍 크기 (파일 전체를 메모리에 올리지 않음)
+    CSV_CHUNK_SIZE = 5000
+
+    @staticmethod
+    def _detect_encoding(file_path: str) -> str:
         """
-        CSV 파일을 읽어 단어 데이터(Dict 리스트)로 변환하고, WordModel을 사용하여 DB에 저장합니다.
-        반환값: {total, added, updated, skipped}
+        파일 전체를 UTF-8로 스트리밍 해독해 인코딩을 확정합니다. (상수 메모리)
+        쓰기 시작 전에 확정하므로, 임포트 도중 해독 실패로 처음부터 재시도하며
+        이미 커밋된 청크를 중복 집계하는 일이 없습니다.
         """
-        # 기존 CSV 파싱 로직 (word_list를 얻는 부분)
-        # ----------------------------------------------------
         try:
-            # df = pd.read_csv(file_path, encoding='utf-8') 
-            # ... (인코딩 처리 및 필수 컬럼 검사 로직 유지)
-            # ... (최종적으로 word_list = df[final_cols].fillna(...).to_dict('records') 얻음)
-            
-            # 가정을 위해 위 기존 코드를 임시로 포함:
-            try:
-                df = pd.read_csv(file_path, encoding='utf-8') 
-            except UnicodeDecodeError:
-                df = pd.read_csv(file_path, encoding='cp949')
-            
-            required_cols = ['word_text', 'meaning_ko', 'category']
-            if not all(col in df.columns for col in required_cols):
-                raise ValueError(f"CSV 파일에 필수 컬럼({', '.join(required_cols)})이 누락되었습니다.")
-
-            export_cols = required_cols + ['memo', 'is_favorite']
-            final_cols = [col for col in export_cols if col in df.columns]
-            word_list = df[final_cols].fillna({'memo': '', 'is_favorite': 0}).to_dict('records')
-            for item in word_list:
-                if 'is_favorite' in item:
-                    item['is_favorite'] = int(item['is_favorite']) if pd.notna(item['is_favorite']) else 0
-            # ----------------------------------------------------
-            
+            with open(file_path, 'r', encoding='utf-8') as f:
+                while f.read(1 << 20):
+                    pass
+            return 'utf-8'
+        except UnicodeDecodeError:
+            return 'cp949'
+
+    @staticmethod
+    def _count_csv_rows(file_path: str) -> int:
+        """
+        파일의 개행 수를 바이너리로 세어 데이터 행 수를 추정합니다. (헤더 제외)
+        파싱 없이 바이트만 훑으므로 본 읽기 대비 비용이 미미합니다.
+        """
+        count = 0
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                count += block.count(b'\n')
+        return max(count - 1, 0)
+
+    def _read_and_upsert(self, file_path: str, word_model, encoding: str,
+                         progress_cb=None) -> Dict[str, int]:
+        """
+        CSV를 청크 단위로 읽으며 각 청크를 WordModel.upsert_many로 일괄 저장합니다.
+        usecols/dtype을 지정해 불필요한 컬럼 파싱과 타입 추론을 건너뜁니다.
+        progress_cb(처리 행 수, 전체 행 수)가 주어지면 청크마다 호출합니다.
+        """
+        totals = {'total': 0, 'added': 0, 'updated': 0, 'skipped': 0}
+        total_rows = self._count_csv_rows(file_path) if progress_cb is not None else 0
+
+        reader = pd.read_csv(
+            file_path,
+            encoding=encoding,
+            usecols=lambda col: col in self.IMPORT_COLS,
+            dtype={'word_text': str, 'meaning_ko': str, 'category': str, 'memo': str},
+            chunksize=self.CSV_CHUNK_SIZE,
+        )
+
+        first_chunk = True
+        for df in reader:
+            if first_chunk:
+                if not all(col in df.columns for col in self.REQUIRED_COLS):
+                    raise ValueError(
+                        f"CSV 파일에 필수 컬럼({', '.join(self.REQUIRED_COLS)})이 누락되었습니다.")
+                first_chunk = False
+
+            # 필수 컬럼(word_text, meaning_ko)의 NaN도 채워야 함 - 빠뜨리면
+            # str(NaN)이 'nan'이라는 가짜 단어로 저장됨
+            df = df.fillna({'word_text': '', 'meaning_ko': '',
+                            'memo': '', 'is_favorite': 0, 'category': '미분류'})
+            # 행별 Python 루프 대신 컬럼 단위(벡터화)로 타입을 한 번에 정리
+            if 'is_favorite' in df.columns:
+                df['is_favorite'] = df['is_favorite'].astype(int)
+
+            # 필수 값이 빈 행은 저장하지 않고 건너뜀으로 집계
+            # (기준선에서는 NOT NULL 제약이 거르던 행들)
+            valid = (df['word_text'].str.strip() != '') & (df['meaning_ko'].str.strip() != '')
+            skipped = int(len(df) - valid.sum())
+            if skipped:
+                df = df[valid]
+                totals['total'] += skipped
+                totals['skipped'] += skipped
+
+            word_list = df.to_dict('records')
             if not word_list:
-                return {'total': 0, 'added': 0, 'updated': 0, 'skipped': 0}
-
-            # ✨ 새로운 DB 저장 로직 (WordModel 사용) ✨
-            total = len(word_list)
-            added = 0
-            updated = 0
-            skipped = 0
-            
-            for idx, word_data in enumerate(word_list):
-                word_text = word_data['word_text']
-                
-                # 1. 단어가 이미 존재하는지 확인
-                existing_word = word_model.get_word_by_text(word_text) # WordModel에 get_word_by_text 필요하다고 가정
-                
-                if existing_word:
-                    # 2. 존재하면 업데이트
-                    if word_model.update_word_by_text(word_text, word_data): # WordModel에 update_word_by_text 필요
-                        updated += 1
-                    else:
-                        skipped += 1
-                else:
-                    # 3. 없으면 삽입
-                    if word_model.insert_word(word_data):
-                        added += 1
-                    else:
-                        skipped += 1
-                        
-            LOGGER.info(f"CSV import successful. Total: {total}, Added: {added}, Updated: {updated}")
-            return {'total': total, 'added': added, 'updated': updated, 'skipped': skipped}
+                continue
+
+            # 행당 SELECT+INSERT/UPDATE 왕복 대신 청크별 단일 트랜잭션 UPSERT
+            result = word_model.upsert_many(word_list)
+            if result is None:
+                raise RuntimeError("Batch upsert failed (see model log).")
+            for key in totals:
+                totals[key] += result[key]
+
+            if progress_cb is not None:
+                progress_cb(totals['total'], total_rows)
+
+        return totals
+
+    def import_words_from_csv(self, file_path: str, word_model,
+                              progress_cb=None) -> Optional[Dict[str, int]]:
+        """
+        CSV 파일을 청크 단위로 읽어 WordModel을 통해 DB에 저장합니다.
+        progress_cb(처리 행 수, 전체 행 수)가 주어지면 청크마다 호출됩니다.
+        반환값: {total, added, updated, skipped} 또는 실패 시 None
+        """
+        try:
+            # 파일 전체를 먼저 검증해 인코딩을 확정한 뒤 단일 패스로 임포트
+            # (쓰기 시작 후 재시도하면 이미 커밋된 청크가 남고 집계가 중복됨)
+            encoding = self._detect_encoding(file_path)
+            result = self._read_and_upsert(file_path, word_model, encoding,
+                                           progress_cb=progress_cb)
+
+            LOGGER.info(f"CSV import successful. Total: {result['total']}, "
+                        f"Added: {result['added']}, Updated: {result['updated']}")
+            return result
 
         except Exception as e:
             LOGGER.error(f"Error during CSV import to DB: {e}")
             return None # 실패 시 None 반환
 
-    def export_words_to_csv(self, file_path: str, data: List[Dict[str, Any]]) -> bool:
+    def export_words_to_csv(self, file_path: str, data: Iterable[Dict[str, Any]]) -> bool:
         """
-        단어 데이터(Dict 리스트)를 CSV 파일로 저장합니다. (F5)
+        단어 데이터(Dict 이터러블)를 CSV 파일로 스트리밍 저장합니다. (F5)
+        전체 행을 리스트/DataFrame으로 구체화하지 않고 커서에서 받은 행을
+        그대로 흘려 쓰므로 단어 수와 무관하게 메모리가 일정합니다.
         """
-        if not data:
-            LOGGER.warning("Export requested with empty data list.")
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
+            LOGGER.warning("Export requested with empty data.")
             return False
-            
+
         try:
-            df = pd.DataFrame(data)
             # UTF-8 인코딩 및 BOM 추가로 엑셀에서 한글 깨짐 방지
-            df.to_csv(file_path, index=False, encoding='utf-8-sig') 
+            with open(file_path, 'w', newline='', encoding='utf-8-sig') as f:
+                writer = csv.DictWriter(f, fieldnames=list(first.keys()))
+                writer.writeheader()
+                writer.writerow(first)
+                writer.writerows(rows)
             LOGGER.info(f"Words exported successfully to {file_path}")
             return True
         except Exception as e:
@@ -0,0 +1,41 @@
+from typing import Iterable, List
+
+# 2025-10-20 - 스마트 단어장 - 단답형 채점 유틸리티
+# 파일 위치: utils/grading.py - v1
+# 목적: 단답형 정규화/비교 로직을 뷰(문항별 채점)와 일괄 재채점 경로가 공유하도록 분리
+
+
+class _StripTable(dict):
+    """
+    str.translate용 변환 테이블: 비영숫자 문자는 None(삭제), 영숫자는 그대로 유지.
+    처음 만나는 코드포인트만 isalnum을 평가하고 결과를 캐시하므로,
+    문자별 Python 제너레이터 루프 없이 C 수준 translate 루프로 정규화됩니다.
+    """
+    def __missing__(self, codepoint):
+        value = codepoint if chr(codepoint).isalnum() else None
+        self[codepoint] = value
+        return value
+
+
+# 채점 정규화 공용 테이블 (모듈 로드 시 1회 생성, 호출 간 캐시 공유)
+_NORM_STRIP_TABLE = _StripTable()
+
+
+def normalize_answer(text: str) -> str:
+    """채점 비교용 정규화: 영숫자 외 문자 제거 + 소문자화."""
+    return text.translate(_NORM_STRIP_TABLE).lower()
+
+
+def bulk_match(user_answers: Iterable[str], correct_answers: Iterable[str]) -> List[bool]:
+    """
+    (사용자 답, 정답) 쌍들을 일괄 채점하여 정답 여부 리스트를 반환합니다.
+    수천 쌍 단위의 재채점에서도 쌍당 translate(C 루프) 2회 + 비교 1회만 수행하며,
+    빈 답변은 오답으로 처리합니다 (문항별 채점과 동일한 규칙).
+    """
+    table = _NORM_STRIP_TABLE
+    results = []
+    for user, correct in zip(user_answers, correct_answers):
+        user_clean = user.translate(table).lower()
+        results.append(bool(user_clean)
+                       and user_clean == correct.translate(table).lower())
+    return results
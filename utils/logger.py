@@ -1,26 +1,40 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from config import LOG_FILE_PATH, LOG_LEVEL_DEV, LOG_MAX_BYTES, LOG_BACKUP_COUNT, LOG_DIR
 from datetime import datetime
 
 # 2025-10-20 - 스마트 단어장 - 로깅 시스템 설정 모듈
 # 파일 위치: utils/logger.py - v1
 
+# 설정 완료된 로거 (모듈 전역 - setup_logger가 1회만 본문을 실행하도록 메모이즈)
+_LOGGER: logging.Logger = None
+# 백그라운드 로그 기록 스레드 (QueueListener - 종료 시 flush를 위해 보관)
+_LISTENER: QueueListener = None
+
 def setup_logger(log_level=LOG_LEVEL_DEV):
     """
     애플리케이션의 로거를 설정하고 반환합니다.
     (파일 핸들러와 콘솔 핸들러 포함)
+    모든 모듈이 임포트 시 호출하므로, 최초 1회만 구성하고 이후는 즉시 반환합니다.
     """
-    # 1. 로그 디렉토리 생성 (없으면)
-    os.makedirs(LOG_DIR, exist_ok=True)
-    
+    global _LOGGER
+    if _LOGGER is not None:
+        return _LOGGER
+
+    # 1. 로그 디렉토리 생성 (없으면 - 존재 확인으로 불필요한 syscall 회피)
+    if not os.path.isdir(LOG_DIR):
+        os.makedirs(LOG_DIR, exist_ok=True)
+
     # 2. 로거 인스턴스 생성
     logger = logging.getLogger('SmartVocabLogger')
     logger.setLevel(log_level)
-    
+
     # 중복 핸들러 방지
     if logger.handlers:
+        _LOGGER = logger
         return logger
 
     # 3. 로그 포맷 정의
@@ -42,12 +56,21 @@ def setup_logger(log_level=LOG_LEVEL_DEV):
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
 
-    # 6. 로거에 핸들러 추가
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
-    
+    # 6. 로거에는 큐 핸들러만 연결하고, 실제 파일/콘솔 기록은 백그라운드
+    #    리스너 스레드가 담당 (호출 스레드의 로그 비용은 enqueue로 축소 -
+    #    CSV 임포트 등 대량 작업 중 디스크 I/O가 UI 스레드를 막지 않음)
+    global _LISTENER
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+
+    _LISTENER = QueueListener(log_queue, file_handler, stream_handler)
+    _LISTENER.start()
+    # 프로세스 종료 시 큐에 남은 레코드를 flush
+    atexit.register(_LISTENER.stop)
+
     logger.info(f"Logger initialized successfully. Log file: {LOG_FILE_PATH}")
-    
+
+    _LOGGER = logger
     return logger
 
 # 초기 테스트 용도로 모듈 임포트 시 로거를 바로 설정할 수 있습니다.
@@ -0,0 +1,42 @@
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+from PyQt5.QtGui import QFont
+from functools import lru_cache
+from utils.logger import setup_logger
+
+# 2025-10-20 - 스마트 단어장 - 뷰 공용 헬퍼
+# 파일 위치: views/common.py - v1
+# 목적: 여러 뷰에서 중복 정의되던 폰트 캐시와 카테고리 워커를 한 곳에 모음
+
+LOGGER = setup_logger()
+
+
+@lru_cache(maxsize=32)
+def font(size: int, bold: bool = False) -> QFont:
+    """ 동일 스펙 QFont를 공유합니다. (위젯마다 폰트 기술 파싱/치환 반복 방지) """
+    f = QFont('Arial', size)
+    f.setBold(bold)
+    return f
+
+
+class CategoryWorkerSignals(QObject):
+    """ 카테고리 워커의 결과 전달용 시그널 홀더 (QRunnable은 QObject가 아니므로 분리) """
+    finished = pyqtSignal(list)
+
+
+class CategoryWorker(QRunnable):
+    """
+    카테고리 목록 조회 쿼리를 백그라운드 스레드에서 수행하는 워커입니다.
+    결과는 finished 시그널을 통해 메인 스레드 슬롯으로 전달됩니다.
+    """
+    def __init__(self, controller):
+        super().__init__()
+        self.controller = controller
+        self.signals = CategoryWorkerSignals()
+
+    def run(self):
+        try:
+            categories = self.controller.get_all_categories()
+        except Exception as e:
+            LOGGER.error(f"Category worker failed: {e}")
+            categories = []
+        self.signals.finished.emit(categories)
@@ -2,15 +2,17 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QStackedWidget, 
     QLabel, QPushButton, QComboBox, QSpinBox, QGroupBox, 
     QFormLayout, QMessageBox, QSizePolicy, QLineEdit,
-    QRadioButton, QButtonGroup, QGridLayout
+    QRadioButton, QButtonGroup, QGridLayout, QProgressDialog
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QTime
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QObject, QRunnable, QThreadPool
 from controllers.exam_controller import ExamController
 from controllers.word_controller import WordController # 카테고리 로딩용
 from typing import List, Dict, Any, Optional
 from utils.logger import setup_logger
-from datetime import datetime
+from utils.grading import normalize_answer as _normalize_answer
+from views.common import font as _font, CategoryWorker as _CategoryWorker
+import random
+import time
 
 # 2025-10-20 - 스마트 단어장 - 시험 관리 뷰
 # 파일 위치: views/exam_view.py - v1
@@ -18,6 +20,39 @@ from datetime import datetime
 
 LOGGER = setup_logger()
 
+
+class _SubmitWorkerSignals(QObject):
+    """ 결과 제출 워커의 결과 전달용 시그널 홀더 """
+    finished = pyqtSignal(object)  # 결과 요약 dict 또는 실패 시 None
+
+
+class _SubmitWorker(QRunnable):
+    """
+    시험 결과 기록(이력 저장 + 오답 노트 갱신 트랜잭션)을
+    백그라운드 스레드에서 수행하는 워커입니다.
+    """
+    def __init__(self, controller: ExamController, exam_type: str,
+                 duration_sec: int, questions_data: List[Dict[str, Any]]):
+        super().__init__()
+        self.controller = controller
+        self.exam_type = exam_type
+        self.duration_sec = duration_sec
+        self.questions_data = questions_data
+        self.signals = _SubmitWorkerSignals()
+
+    def run(self):
+        try:
+            summary = self.controller.submit_and_record_exam(
+                exam_type=self.exam_type,
+                duration_sec=self.duration_sec,
+                questions_data=self.questions_data
+            )
+        except Exception as e:
+            LOGGER.error(f"Exam submit worker failed: {e}")
+            summary = None
+        self.signals.finished.emit(summary)
+
+
 class ExamView(QWidget):
     """
     '시험' 탭의 내용을 구성하는 뷰입니다.
@@ -36,8 +71,16 @@ class ExamView(QWidget):
         self.exam_questions: List[Dict[str, Any]] = [] # 문제와 사용자 답변 포함 목록
         self.current_question_index: int = 0
         self.exam_start_time: float = 0
+        # 카운트다운 타이머: 연결은 1회만 수행 (시험마다 connect를 반복하면
+        # 슬롯이 누적되어 틱당 N회 호출되는 잠복 버그가 됨)
         self.timer = QTimer(self)
+        self.timer.setSingleShot(True)  # 초 경계에 맞춰 _update_timer에서 재장전
+        # 1Hz 표시에는 OS 스케줄러 틱 정렬로 충분 - 고해상도 웨이크업 회피 (전력 절감)
+        self.timer.setTimerType(Qt.CoarseTimer)
+        self.timer.timeout.connect(self._update_timer)
         self.time_limit_sec: int = 0
+        self._submitting: bool = False  # 결과 제출 워커 중복 기동 방지
+        self._progress_dialog: Optional[QProgressDialog] = None
         
         self._setup_ui()
         self._load_categories()
@@ -116,12 +159,28 @@ class ExamView(QWidget):
         return widget
 
     def _load_categories(self):
-        """ WordController를 통해 카테고리 목록을 불러와 콤보 박스에 채웁니다. """
+        """ WordController를 통해 카테고리 목록을 백그라운드에서 불러옵니다. """
+        # 기본 항목은 즉시 채우고 DB 조회는 워커 스레드에 위임 (기동 시 UI 블로킹 방지)
         self.category_combo.clear()
         self.category_combo.addItem("전체 카테고리", None)
-        categories = self.word_controller.get_all_categories()
-        for cat in categories:
-            self.category_combo.addItem(cat, cat)
+        worker = _CategoryWorker(self.word_controller)
+        worker.signals.finished.connect(self._on_categories_loaded)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_categories_loaded(self, categories: list):
+        """ 워커가 전달한 카테고리 목록을 콤보 박스에 반영합니다. (메인 스레드) """
+        if not categories:
+            return
+        combo = self.category_combo
+        # 항목별 addItem 대신 addItems 일괄 추가 - 시그널/리페인트도 추가 동안 차단
+        combo.blockSignals(True)
+        combo.setUpdatesEnabled(False)
+        start = combo.count()
+        combo.addItems(categories)
+        for i, cat in enumerate(categories, start=start):
+            combo.setItemData(i, cat)
+        combo.setUpdatesEnabled(True)
+        combo.blockSignals(False)
             
     # --- 2. 시험 진행 화면 UI ---
 
@@ -141,14 +200,14 @@ class ExamView(QWidget):
         
         # 문제 영역
         self.question_label = QLabel("Q. 1. 다음 단어의 의미는?")
-        self.question_label.setFont(QFont('Arial', 14))
+        self.question_label.setFont(_font(14))
         self.question_label.setWordWrap(True)
         layout.addWidget(self.question_label)
 
         # 카드 영역 (단어 표시)
         self.word_card = QLabel("WORD TEXT")
         self.word_card.setAlignment(Qt.AlignCenter)
-        self.word_card.setFont(QFont('Arial', 32, QFont.Bold))
+        self.word_card.setFont(_font(32, bold=True))
         self.word_card.setStyleSheet("border: 1px solid #ccc; padding: 40px; background-color: white; color: black;")
         self.word_card.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         layout.addWidget(self.word_card)
@@ -174,7 +233,13 @@ class ExamView(QWidget):
         self.answer_stack.addWidget(self.multiple_choice_widget)
 
         layout.addWidget(self.answer_stack)
-        
+
+        # 입력 검증 안내 라인 (경고 다이얼로그 대신 라벨 텍스트만 갱신)
+        self._validation_label = QLabel("")
+        self._validation_label.setAlignment(Qt.AlignCenter)
+        self._validation_label.setStyleSheet("color: red;")
+        layout.addWidget(self._validation_label)
+
         # 다음/제출 버튼
         self.next_btn = QPushButton("다음 문제")
         self.next_btn.setMinimumHeight(35)
@@ -192,12 +257,12 @@ class ExamView(QWidget):
         # 결과 요약
         self.score_label = QLabel("점수: 0점")
         self.score_label.setAlignment(Qt.AlignCenter)
-        self.score_label.setFont(QFont('Arial', 48, QFont.Bold))
+        self.score_label.setFont(_font(48, bold=True))
         layout.addWidget(self.score_label)
         
         self.summary_label = QLabel("총 0문제 중 0문제 정답 (0% 정답률)")
         self.summary_label.setAlignment(Qt.AlignCenter)
-        self.summary_label.setFont(QFont('Arial', 18))
+        self.summary_label.setFont(_font(18))
         layout.addWidget(self.summary_label)
 
         layout.addStretch(1)
@@ -225,10 +290,11 @@ class ExamView(QWidget):
     def _start_exam(self):
         """ 시험 옵션을 읽고 시험 단어를 생성하여 시험을 시작합니다. """
         
-        # 옵션 읽기
+        # 옵션 읽기 (문항 유형은 세션 동안 바뀌지 않으므로 1회만 읽어 캐시 -
+        # 문제마다 currentData()로 Qt 경계를 넘지 않음)
         question_count = self.count_spin.value()
         mode = self.mode_combo.currentData()
-        exam_type = self.type_combo.currentData()
+        self._exam_type = self.type_combo.currentData()
         category = self.category_combo.currentData()
         self.time_limit_sec = self.time_limit_spin.value() * 60 # 분을 초로 변환
         
@@ -239,37 +305,58 @@ class ExamView(QWidget):
             QMessageBox.warning(self, "시험 시작 실패", "선택된 옵션에 해당하는 단어가 없거나 출제에 실패했습니다.")
             return
 
-        # 2. 시험 상태 초기화
+        # 2. 단답형 채점용 정규화 정답을 시험 시작 시 1회만 계산
+        #    (제출 시마다 의미 문자열을 다시 훑지 않도록 함)
+        for w in self.exam_words:
+            w['_norm_answer'] = _normalize_answer(w['meaning_ko'])
+
+        # 문제 표시/보기 생성 핫 경로용 병렬 배열 (SoA) - 단어/의미/ID를
+        # 시험 시작 시 한 번만 평탄화하여 문제마다 dict 해시 조회를 제거
+        self._word_texts = tuple(w['word_text'] for w in self.exam_words)
+        self._meanings = tuple(w['meaning_ko'] for w in self.exam_words)
+        self._ids = tuple(w['word_id'] for w in self.exam_words)
+
+        # 3. 시험 상태 초기화
         self.exam_questions = []
         self.current_question_index = 0
-        self.exam_start_time = datetime.now().timestamp()
+        self._validation_label.clear()
+        # 벽시계(datetime.now) 대신 단조 시계 사용 - NTP/DST 점프에 영향받지 않음
+        self.exam_start_time = time.monotonic()
 
-        # 3. 시간 제한 설정 및 시작
+        # 4. 시간 제한 설정 및 시작
         if self.time_limit_sec > 0:
-            self.timer.timeout.connect(self._update_timer)
-            self.timer.start(1000) # 1초마다 업데이트
-            self.time_limit_end = QTime.currentTime().addSecs(self.time_limit_sec)
+            # 마감 시각을 단조 시계 기준으로 고정 (자정 넘김/시계 조정에도 안전)
+            self._deadline = time.monotonic() + self.time_limit_sec
+            self._update_timer()
         else:
             self.timer_label.setText("시간 제한 없음")
 
-        # 4. 화면 전환 및 첫 문제 표시
+        # 5. 화면 전환 및 첫 문제 표시
         self.stacked_widget.setCurrentIndex(1)
         self._show_question()
-        LOGGER.info(f"Exam started: {len(self.exam_words)} questions, Type: {exam_type}")
+        LOGGER.info(f"Exam started: {len(self.exam_words)} questions, Type: {self._exam_type}")
 
     def _update_timer(self):
         """ 남은 시간을 계산하여 타이머 라벨을 업데이트합니다. """
-        remaining_time = QTime.currentTime().secsTo(self.time_limit_end)
-        
-        if remaining_time <= 0:
+        if self.time_limit_sec <= 0:
+            return  # 시간 제한 없는 시험에서는 동작하지 않음
+
+        remaining_f = self._deadline - time.monotonic()
+
+        if remaining_f <= 0:
             self.timer.stop()
             self.timer_label.setText("남은 시간: 00:00")
             QMessageBox.information(self, "시간 초과", "시험 제한 시간이 초과되었습니다. 자동 제출됩니다.")
             self._end_exam()
             return
 
-        time_format = QTime(0, 0).addSecs(remaining_time).toString("mm:ss")
-        self.timer_label.setText(f"남은 시간: {time_format}")
+        # 틱마다 QTime 객체를 만들지 않고 정수 연산만으로 mm:ss 포맷 구성
+        remaining = int(remaining_f)
+        self.timer_label.setText(f"남은 시간: {remaining // 60:02d}:{remaining % 60:02d}")
+
+        # 다음 초 경계까지 남은 시간만큼만 대기 후 재장전 (0이면 꽉 찬 1초)
+        delay_ms = int((remaining_f - remaining) * 1000) or 1000
+        self.timer.start(delay_ms)
 
     def _show_question(self):
         """ 다음 문제를 화면에 표시합니다. """
@@ -278,52 +365,52 @@ class ExamView(QWidget):
             return
 
         q_idx = self.current_question_index
-        word_data = self.exam_words[q_idx]
-        exam_type = self.type_combo.currentData()
-        
+        exam_type = self._exam_type
+
         self.progress_label.setText(f"진행: {q_idx + 1} / {len(self.exam_words)}")
-        self.word_card.setText(word_data['word_text'])
+        self.word_card.setText(self._word_texts[q_idx])
         self.question_label.setText(f"Q. {q_idx + 1}. 다음 단어의 의미는?")
         
-        # 입력 필드 및 버튼 초기화
-        self.short_answer_input.clear()
-        self.mc_group.setExclusive(False)
-        for rb in self.mc_options:
-            rb.setChecked(False)
-        self.mc_group.setExclusive(True)
-
-        # 문항 유형에 따라 답변 영역 설정
+        # 문항 유형에 따라 답변 영역 설정 및 입력 필드 초기화
+        # (객관식일 때만 라디오 버튼을 다루고, 체크된 버튼 하나만 해제)
         if exam_type == 'short_answer':
+            self.short_answer_input.clear()
             self.answer_stack.setCurrentIndex(0)
         else: # multiple_choice
+            checked_rb = self.mc_group.checkedButton()
+            if checked_rb:
+                self.mc_group.setExclusive(False)
+                checked_rb.setChecked(False)
+                self.mc_group.setExclusive(True)
             self.answer_stack.setCurrentIndex(1)
             # 객관식 보기 생성 (간단 구현)
-            self._generate_multiple_choice(word_data)
+            self._generate_multiple_choice(q_idx)
             
         # 마지막 문제일 경우 버튼 텍스트 변경
         self.next_btn.setText("최종 제출" if q_idx == len(self.exam_words) - 1 else "다음 문제")
 
-    def _generate_multiple_choice(self, correct_word: Dict[str, Any]):
+    def _generate_multiple_choice(self, q_idx: int):
         """ 객관식 보기를 생성합니다. (정답 + 오답 3개) """
-        all_words = self.exam_words # 이미 출제될 단어들 중에서 오답을 선택
-        correct_meaning = correct_word['meaning_ko']
-        
-        # 오답 목록 선정 (현재 단어 제외)
-        distractors = [w['meaning_ko'] for w in all_words if w['word_id'] != correct_word['word_id']]
-        
-        # 중복 방지를 위해 set 사용 후 리스트 변환
-        unique_distractors = list(set(distractors))
-        
-        # 오답이 부족할 경우 전체 단어 목록에서 가져올 수 있으나, 여기서는 출제 단어 내에서만 처리
-        
-        if len(unique_distractors) < 3:
-            # 오답 수가 부족하면 중복을 허용하거나 (단순화), 더 많은 단어에서 가져와야 함.
-            # 여기서는 출제 목록에서 랜덤하게 3개 선택 (오답 목록에 정답이 포함될 수 있음 - UI 로직 단순화)
-            # 이 로직은 실제로는 DB에서 제외 로직을 통해 구현해야 함.
-            random_distractors = random.sample(distractors, min(3, len(distractors)))
-        else:
-            random_distractors = random.sample(unique_distractors, 3)
-            
+        correct_meaning = self._meanings[q_idx]
+        correct_id = self._ids[q_idx]
+
+        # 시험 시작 시 평탄화해 둔 의미/ID 배열에서 무작위 인덱스만 추출하여
+        # 오답 후보를 고릅니다. (문제마다 전체 단어 리스트를 순회/복사하지 않음)
+        n = len(self._meanings)
+        candidate_idx = random.sample(range(n), min(8, n))
+        # dict.fromkeys로 순서 보존 중복 제거 + 정답 단어/동일 의미 제외
+        random_distractors = list(dict.fromkeys(
+            self._meanings[i] for i in candidate_idx
+            if self._ids[i] != correct_id and self._meanings[i] != correct_meaning
+        ))[:3]
+
+        if len(random_distractors) < 3:
+            # 표본에서 오답이 부족하면 전체 배열을 한 번 훑어 보충 (소규모 시험에서만 발생)
+            random_distractors = list(dict.fromkeys(
+                self._meanings[i] for i in range(n)
+                if self._ids[i] != correct_id and self._meanings[i] != correct_meaning
+            ))[:3]
+
         options = random_distractors + [correct_meaning]
         random.shuffle(options)
         
@@ -337,7 +424,7 @@ class ExamView(QWidget):
         """ 현재 문제의 답변을 채점하고 다음 문제로 넘어갑니다. """
         q_idx = self.current_question_index
         word_data = self.exam_words[q_idx]
-        exam_type = self.type_combo.currentData()
+        exam_type = self._exam_type
         
         user_answer = ""
         is_correct = 0
@@ -345,8 +432,9 @@ class ExamView(QWidget):
         if exam_type == 'short_answer':
             user_answer = self.short_answer_input.text().strip()
             # 단답형 채점: 대소문자 무시, 띄어쓰기 무시, 쉼표 등 부호 제거 후 비교
-            correct_answer_clean = ''.join(c for c in word_data['meaning_ko'] if c.isalnum()).lower()
-            user_answer_clean = ''.join(c for c in user_answer if c.isalnum()).lower()
+            # (정답 쪽은 _start_exam에서 미리 정규화해 둔 값을 사용)
+            correct_answer_clean = word_data['_norm_answer']
+            user_answer_clean = _normalize_answer(user_answer)
             
             if correct_answer_clean == user_answer_clean and user_answer_clean:
                 is_correct = 1
@@ -358,9 +446,11 @@ class ExamView(QWidget):
                 if selected_rb.property("is_correct_answer"):
                     is_correct = 1
             else:
-                QMessageBox.warning(self, "답변 오류", "답변을 선택하거나 입력해주세요.")
+                self._validation_label.setText("답변을 선택하거나 입력해주세요.")
                 return # 답변이 없으면 다음으로 넘어가지 않음
 
+        self._validation_label.clear()
+
         # 문제 상세 기록 (ExamController로 전달할 데이터 구조)
         self.exam_questions.append({
             "word_id": word_data['word_id'],
@@ -375,20 +465,36 @@ class ExamView(QWidget):
         self._show_question()
 
     def _end_exam(self):
-        """ 시험을 종료하고 결과를 처리합니다. """
-        
+        """ 시험을 종료하고 결과 기록을 백그라운드 워커에 위임합니다. """
+        if self._submitting:
+            return
+        self._submitting = True
+
         # 1. 타이머 정지
         self.timer.stop()
-        
+
         # 2. 총 시험 시간 계산
-        total_duration_sec = int(datetime.now().timestamp() - self.exam_start_time)
-        
-        # 3. 시험 결과 기록 및 오답 노트 업데이트 (트랜잭션)
-        result_summary = self.exam_controller.submit_and_record_exam(
-            exam_type=self.type_combo.currentData(),
-            duration_sec=total_duration_sec,
-            questions_data=self.exam_questions
-        )
+        total_duration_sec = int(time.monotonic() - self.exam_start_time)
+
+        # 3. 시험 결과 기록 및 오답 노트 업데이트는 전체 문항을 쓰는 트랜잭션이므로
+        #    워커 스레드에 위임 (대량 문항 시험에서도 UI가 멈추지 않음)
+        self._progress_dialog = QProgressDialog("결과 집계 중...", "", 0, 0, self)
+        self._progress_dialog.setWindowModality(Qt.WindowModal)
+        self._progress_dialog.setCancelButton(None)
+        self._progress_dialog.setMinimumDuration(0)
+        self._progress_dialog.show()
+
+        worker = _SubmitWorker(self.exam_controller, self._exam_type,
+                               total_duration_sec, self.exam_questions)
+        worker.signals.finished.connect(self._on_exam_submitted)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_exam_submitted(self, result_summary):
+        """ 워커가 전달한 결과 요약을 화면에 반영합니다. (메인 스레드) """
+        self._submitting = False
+        if self._progress_dialog is not None:
+            self._progress_dialog.close()
+            self._progress_dialog = None
 
         if result_summary:
             # 4. 결과 화면 표시
@@ -3,14 +3,13 @@ from PyQt5.QtWidgets import (
     QLabel, QPushButton, QComboBox, QSpinBox, QGroupBox, 
     QFormLayout, QMessageBox, QSizePolicy
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QElapsedTimer
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QThreadPool
 from controllers.learning_controller import LearningController
 from controllers.word_controller import WordController
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from utils.logger import setup_logger
-
-from datetime import datetime
+from views.common import font as _font, CategoryWorker as _CategoryWorker
+import time
 
 # 2025-10-20 - 스마트 단어장 - 플래시카드 학습 뷰
 # 파일 위치: views/flashcard_view.py - v1
@@ -18,6 +17,7 @@ from datetime import datetime
 
 LOGGER = setup_logger()
 
+
 class FlashcardView(QWidget):
     """
     '플래시 카드' 탭의 내용을 구성하는 뷰입니다.
@@ -39,10 +39,11 @@ class FlashcardView(QWidget):
         self.correct_count: int = 0
         self.wrong_count: int = 0
         self.session_start_time: float = 0
+        # 카드별 학습 결과 버퍼 - 세션 종료 시 일괄 DB 기록
+        self._pending_results: List[Tuple[int, int, bool, float]] = []
         
-        # 타이머 (응답 시간 기록용)
-        # self.response_timer = QTimer(self)
-        self.response_timer = QElapsedTimer()
+        # 응답 시간 기록용 단조 시계 스냅샷 (카드마다 Qt 객체를 거치지 않음)
+        self._card_start_ns: int = 0
         
         self._setup_ui()
         self._load_categories()
@@ -65,6 +66,15 @@ class FlashcardView(QWidget):
         # 초기 화면 설정
         self.stacked_widget.setCurrentIndex(0)
 
+        # 중단 확인 다이얼로그는 1회만 생성하여 재사용
+        # (버튼을 누를 때마다 다이얼로그 초기화 비용을 치르지 않음)
+        self._confirm_stop_box = QMessageBox(
+            QMessageBox.Question, "공부 중단",
+            "정말로 현재 학습을 중단하시겠습니까?",
+            QMessageBox.Yes | QMessageBox.No, self
+        )
+        self._confirm_stop_box.setDefaultButton(QMessageBox.No)
+
     # --- 1. 옵션 설정 화면 UI ---
     
     def _create_option_page(self) -> QWidget:
@@ -113,12 +123,28 @@ class FlashcardView(QWidget):
         return widget
 
     def _load_categories(self):
-        """ 카테고리 목록을 불러와 콤보 박스에 채웁니다. """
+        """ 카테고리 목록을 백그라운드에서 불러와 콤보 박스에 채웁니다. """
+        # 기본 항목은 즉시 채우고 DB 조회는 워커 스레드에 위임 (기동 시 UI 블로킹 방지)
         self.category_combo.clear()
         self.category_combo.addItem("전체 카테고리", None)
-        categories = self.word_controller.get_all_categories()
-        for cat in categories:
-            self.category_combo.addItem(cat, cat)
+        worker = _CategoryWorker(self.word_controller)
+        worker.signals.finished.connect(self._on_categories_loaded)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_categories_loaded(self, categories: list):
+        """ 워커가 전달한 카테고리 목록을 콤보 박스에 반영합니다. (메인 스레드) """
+        if not categories:
+            return
+        combo = self.category_combo
+        # 항목별 addItem 대신 addItems 일괄 추가 - 시그널/리페인트도 추가 동안 차단
+        combo.blockSignals(True)
+        combo.setUpdatesEnabled(False)
+        start = combo.count()
+        combo.addItems(categories)
+        for i, cat in enumerate(categories, start=start):
+            combo.setItemData(i, cat)
+        combo.setUpdatesEnabled(True)
+        combo.blockSignals(False)
             
     # --- 2. 플래시카드 학습 화면 UI ---
 
@@ -129,13 +155,13 @@ class FlashcardView(QWidget):
         # 상단 정보 (남은 단어 수)
         self.progress_label = QLabel("0 / 0")
         self.progress_label.setAlignment(Qt.AlignCenter)
-        self.progress_label.setFont(QFont('Arial', 12))
+        self.progress_label.setFont(_font(12))
         layout.addWidget(self.progress_label)
         
         # 카드 표시 영역
         self.card_label = QLabel("여기에 단어가 표시됩니다.")
         self.card_label.setAlignment(Qt.AlignCenter)
-        self.card_label.setFont(QFont('Arial', 36, QFont.Bold))
+        self.card_label.setFont(_font(36, bold=True))
         self.card_label.setWordWrap(True)
         self.card_label.setStyleSheet("border: 1px solid gray; padding: 50px;")
         self.card_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -144,10 +170,23 @@ class FlashcardView(QWidget):
         # 답변 표시 영역 (블라인드 처리)
         self.meaning_label = QLabel("의미 (답변)")
         self.meaning_label.setAlignment(Qt.AlignCenter)
-        self.meaning_label.setFont(QFont('Arial', 18))
+        self.meaning_label.setFont(_font(18))
         self.meaning_label.setWordWrap(True)
+        # 상태 전환마다 setStyleSheet로 CSS를 재파싱하지 않도록
+        # 속성 셀렉터 기반 스타일을 한 번만 설정 (전환은 property 변경만)
+        self.meaning_label.setStyleSheet(
+            "QLabel[state='hidden'] { color: black; } "
+            "QLabel[state='shown'] { color: blue; }"
+        )
+        self.meaning_label.setProperty('state', 'hidden')
         layout.addWidget(self.meaning_label)
 
+        # 입력 검증 안내 라인 (경고 다이얼로그 대신 라벨 텍스트만 갱신)
+        self._validation_label = QLabel("")
+        self._validation_label.setAlignment(Qt.AlignCenter)
+        self._validation_label.setStyleSheet("color: red;")
+        layout.addWidget(self._validation_label)
+
         # --- 버튼 영역 ---
         self.show_answer_btn = QPushButton("답 확인")
         self.show_answer_btn.setMinimumHeight(35)
@@ -183,7 +222,9 @@ class FlashcardView(QWidget):
         mode = self.mode_combo.currentData()
         word_count = self.count_spin.value()
         category = self.category_combo.currentData()
-        direction = self.direction_combo.currentData()
+        # 학습 방향은 세션 동안 바뀌지 않으므로 1회만 읽어 캐시
+        # (카드마다 currentData()로 Qt 경계를 넘지 않음)
+        self._direction = self.direction_combo.currentData()
 
         # 1. 단어 목록 가져오기
         words = self.learning_controller.get_words_for_session(mode, word_count, category)
@@ -193,10 +234,17 @@ class FlashcardView(QWidget):
             return
 
         self.current_word_list = words
+        # 카드 루프 핫 경로용 병렬 배열 (SoA) - 카드마다 dict 해시 조회 대신
+        # 튜플 인덱싱만 하도록 세션 시작 시 한 번만 평탄화
+        self._words_arr = tuple(w['word_text'] for w in words)
+        self._meanings_arr = tuple(w['meaning_ko'] for w in words)
+        self._ids_arr = tuple(w['word_id'] for w in words)
         self.current_word_index = 0
         self.correct_count = 0
         self.wrong_count = 0
-        self.session_start_time = datetime.now().timestamp()
+        self._pending_results = []
+        # 벽시계(datetime.now) 대신 단조 시계 사용 - NTP/DST 점프에 영향받지 않음
+        self.session_start_time = time.monotonic()
         
         # 2. 세션 시작 기록
         self.current_session_id = self.learning_controller.start_session("Flashcard", mode, words)
@@ -208,7 +256,7 @@ class FlashcardView(QWidget):
         self.stacked_widget.setCurrentIndex(1)
         self._show_next_card()
         
-        LOGGER.info(f"Session started: {len(words)} words, Mode: {mode}, Direction: {direction}")
+        LOGGER.info(f"Session started: {len(words)} words, Mode: {mode}, Direction: {self._direction}")
 
     def _show_next_card(self):
         """ 다음 단어를 표시합니다. """
@@ -216,35 +264,33 @@ class FlashcardView(QWidget):
             self._end_session()
             return
 
-        word_data = self.current_word_list[self.current_word_index]
-        direction = self.direction_combo.currentData()
+        idx = self.current_word_index
 
-        # 학습 방향에 따라 카드 내용 설정
-        if direction == "eng_to_kor":
-            card_text = word_data['word_text']
-            meaning_text = word_data['meaning_ko']
+        # 학습 방향에 따라 카드 내용 설정 (_start_session에서 캐시한 값 사용)
+        if self._direction == "eng_to_kor":
+            card_text = self._words_arr[idx]
+            meaning_text = self._meanings_arr[idx]
         else: # kor_to_eng
-            card_text = word_data['meaning_ko']
-            meaning_text = word_data['word_text']
+            card_text = self._meanings_arr[idx]
+            meaning_text = self._words_arr[idx]
 
         self.progress_label.setText(f"{self.current_word_index + 1} / {len(self.current_word_list)}")
         self.card_label.setText(card_text)
 
         self._current_meaning_text = meaning_text
         self.meaning_label.setText("???")
-        self.meaning_label.setStyleSheet('color: grey')
-        
+
         self._set_card_state(state='word_only') # 답변 블라인드 처리
         
         # 응답 시간 측정 시작
-        self.response_timer.start()
+        self._card_start_ns = time.monotonic_ns()
         
         self.current_word_index += 1
 
     def _show_answer(self):
         """ 답변을 표시하고 버튼 상태를 전환합니다. """
         self.meaning_label.setText(self._current_meaning_text)
-        self.meaning_label.setStyleSheet('color: blue')
+        self._validation_label.clear()
 
         self._set_card_state(state='answer_shown')
         self.is_answer_shown = True
@@ -252,13 +298,12 @@ class FlashcardView(QWidget):
     def _record_result(self, is_correct: bool):
         """ 학습 결과를 기록하고 다음 카드로 넘어갑니다. """
         if not self.is_answer_shown:
-            QMessageBox.warning(self, "답변 확인", "먼저 [답 확인] 버튼을 눌러주세요.")
+            self._validation_label.setText("먼저 [답 확인] 버튼을 눌러주세요.")
             return
+        self._validation_label.clear()
 
-        # 1. 응답 시간 계산 (ms)
-        response_time_ms = self.response_timer.elapsed()
-        # self.response_timer.stop()
-        response_time_sec = response_time_ms / 1000.0
+        # 1. 응답 시간 계산 (초)
+        response_time_sec = (time.monotonic_ns() - self._card_start_ns) / 1e9
 
         # 2. 결과 카운트
         if is_correct:
@@ -266,16 +311,12 @@ class FlashcardView(QWidget):
         else:
             self.wrong_count += 1
 
-        # 3. DB 기록 및 SRS 업데이트
+        # 3. 결과 버퍼링 (DB 기록/SRS 업데이트는 세션 종료 시 일괄 수행)
         # current_word_index는 이미 +1 되어 있으므로, 이전 인덱스를 사용
         word_idx = self.current_word_index - 1
-        word_data = self.current_word_list[word_idx]
-        
-        self.learning_controller.record_word_result(
-            session_id=self.current_session_id,
-            word_id=word_data['word_id'],
-            is_correct=is_correct,
-            response_time=response_time_sec
+
+        self._pending_results.append(
+            (self.current_session_id, self._ids_arr[word_idx], is_correct, response_time_sec)
         )
 
         # 4. 다음 카드로 전환
@@ -284,13 +325,7 @@ class FlashcardView(QWidget):
 
     def _confirm_end_session(self):
         """ 사용자가 공부를 중단할 때 확인 후 세션 종료 """
-        reply = QMessageBox.question(
-            self,
-            "공부 중단",
-            "정말로 현재 학습을 중단하시겠습니까?",
-            QMessageBox.Yes |QMessageBox.No,
-            QMessageBox.No
-        )
+        reply = self._confirm_stop_box.exec_()
 
         if reply == QMessageBox.Yes:
             # 세션 종료 (기존 종료 로직 재활용)
@@ -303,18 +338,22 @@ class FlashcardView(QWidget):
     def _end_session(self):
         """ 학습 세션을 종료하고 결과를 표시한 후 초기 화면으로 돌아갑니다. """
         
-        # 1. 세션 종료 기록 (총 학습 시간, 정답/오답 수)
-        total_duration_sec = datetime.now().timestamp() - self.session_start_time
+        # 1. 버퍼링된 카드별 결과를 일괄 기록 (카드당 커밋 대신 세션당 1회)
+        self.learning_controller.record_word_results_bulk(self._pending_results)
+        self._pending_results = []
+
+        # 2. 세션 종료 기록 (총 학습 시간, 정답/오답 수)
+        total_duration_sec = time.monotonic() - self.session_start_time
         self.learning_controller.end_session(
             session_id=self.current_session_id,
             correct_count=self.correct_count,
             wrong_count=self.wrong_count
         )
         
-        # 2. 상태 바 업데이트 알림
+        # 3. 상태 바 업데이트 알림
         self.learning_status_changed.emit()
 
-        # 3. 결과 메시지 표시
+        # 4. 결과 메시지 표시
         total = self.correct_count + self.wrong_count
         rate = round((self.correct_count / total) * 100, 1) if total > 0 else 0.0
         
@@ -328,18 +367,27 @@ class FlashcardView(QWidget):
         # 4. 초기 화면으로 전환
         self.stacked_widget.setCurrentIndex(0)
 
+    def _set_meaning_state(self, state: str):
+        """ 의미 라벨의 색상 상태를 전환합니다. (같은 상태면 스타일 재계산 생략) """
+        if self.meaning_label.property('state') == state:
+            return
+        self.meaning_label.setProperty('state', state)
+        style = self.meaning_label.style()
+        style.unpolish(self.meaning_label)
+        style.polish(self.meaning_label)
+
     def _set_card_state(self, state: str):
         """ 카드 화면의 UI 요소를 상태에 따라 전환합니다. """
         if state == 'initial' or state == 'word_only':
             # 단어만 표시, 답변 블라인드, 결과 버튼 비활성화
-            self.meaning_label.setStyleSheet("color: black;") # QSS로 블라인드 효과 적용 예정
+            self._set_meaning_state('hidden')
             self.show_answer_btn.setEnabled(True)
             self.wrong_btn.setEnabled(False)
             self.correct_btn.setEnabled(False)
-            
+
         elif state == 'answer_shown':
             # 답변 표시, 답 확인 버튼 비활성화, 결과 버튼 활성화
-            self.meaning_label.setStyleSheet("color: blue;")
+            self._set_meaning_state('shown')
             self.show_answer_btn.setEnabled(False)
             self.wrong_btn.setEnabled(True)
             self.correct_btn.setEnabled(True)
\ No newline at end of file
@@ -7,6 +7,8 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtGui import QIcon
 from PyQt5.QtCore import Qt, QSize
+from functools import lru_cache
+from typing import Optional
 from controllers.base_controller import BaseController
 from utils.logger import setup_logger
 from utils.file_handler import FileHandler # DB 초기화 기능 사용
@@ -18,6 +20,24 @@ from config import BASE_DIR, DB_SCHEMA_PATH, DB_INIT_DATA_PATH # 경로 설정
 
 LOGGER = setup_logger()
 
+
+@lru_cache(maxsize=8)
+def _style_path(theme_mode: str) -> str:
+    """ 테마별 QSS 파일 경로를 1회만 조립해 재사용합니다. (토글마다 join 회피) """
+    return os.path.join(BASE_DIR, 'resources', 'styles', f'{theme_mode}_theme.qss')
+
+
+# 앱 아이콘은 파일을 1회만 읽어 모듈 수준에 보관 (QApplication 생성 후 접근)
+_APP_ICON = None
+
+
+def _app_icon():
+    global _APP_ICON
+    if _APP_ICON is None:
+        _APP_ICON = QIcon(os.path.join(BASE_DIR, 'resources', 'icons', 'app_icon.png'))
+    return _APP_ICON
+
+
 class MainWindow(QMainWindow):
     """
     애플리케이션의 메인 윈도우. 탭 기반 구조와 공통 UI 요소를 관리합니다.
@@ -53,7 +73,7 @@ class MainWindow(QMainWindow):
         """
         # 윈도우 기본 설정 (화면 설계서 1.1)
         self.setWindowTitle("Smart Vocab Builder")
-        self.setWindowIcon(QIcon(os.path.join(BASE_DIR, 'resources', 'icons', 'app_icon.png'))) # 아이콘은 리소스에 있다고 가정
+        self.setWindowIcon(_app_icon()) # 아이콘은 리소스에 있다고 가정 (1회 로드 후 재사용)
         self.setGeometry(100, 100, 1200, 800) # 초기 크기 설정
 
         # 중앙 위젯 및 탭 위젯 설정 (탭 기반 구조)
@@ -170,7 +190,7 @@ class MainWindow(QMainWindow):
             if theme_mode is None:
                 theme_mode = 'light' # 기본값
             
-        style_path = os.path.join(BASE_DIR, 'resources', 'styles', f'{theme_mode}_theme.qss')
+        style_path = _style_path(theme_mode)
         
         try:
             with open(style_path, 'r', encoding='utf-8') as f:
@@ -203,7 +223,8 @@ class MainWindow(QMainWindow):
             # 여기서는 BaseController가 가진 모델을 통해 직접 접근합니다.
             
             # **임시 통계 로직** (실제 통계는 LearningController에서 가져와야 함)
-            total_words = len(self.controller.word_model.select_active_words())
+            # 전체 행을 파이썬으로 가져와 len()하지 않고 COUNT(*) 한 번으로 집계
+            total_words = self.controller.word_model.count_active_words()
             today_time = self.controller.learning_model.get_total_learning_time_today()
             # 오늘 학습한 단어 수는 현재 세션을 알 수 없으므로 임시로 0
             today_words = 0
@@ -1,14 +1,15 @@
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox, 
-    QFormLayout, QSpinBox, QComboBox, QPushButton, 
-    QMessageBox, QFileDialog
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
+    QFormLayout, QSpinBox, QComboBox, QPushButton,
+    QMessageBox, QProgressDialog
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QObject, QRunnable, QThreadPool
 from controllers.base_controller import BaseController
+from controllers.word_controller import WordController
 from utils.file_handler import FileHandler
 from utils.logger import setup_logger
+from typing import Optional
 import os
-from datetime import datetime
 
 # 2025-10-20 - 스마트 단어장 - 설정 뷰
 # 파일 위치: views/settings_view.py - v1
@@ -16,13 +17,43 @@ from datetime import datetime
 
 LOGGER = setup_logger()
 
+
+class _FileOpWorkerSignals(QObject):
+    """ _FileOpWorker의 결과/진행률 전달용 시그널 홀더. (QRunnable은 시그널 불가) """
+    progress = pyqtSignal(int, int)   # (처리 행 수, 전체 행 수)
+    done = pyqtSignal(object)         # 작업 함수의 반환값
+    error = pyqtSignal(str)
+
+
+class _FileOpWorker(QRunnable):
+    """
+    파일 작업(CSV 임포트, DB 백업/복원/초기화)을 워커 스레드에서 실행하는
+    QRunnable. 작업 함수는 progress_cb 하나를 인자로 받으며, 대용량 파일을
+    다루는 동안 GUI 스레드가 멈추지 않도록 합니다.
+    """
+
+    def __init__(self, fn):
+        super().__init__()
+        self.signals = _FileOpWorkerSignals()
+        self._fn = fn
+
+    def run(self):
+        try:
+            result = self._fn(self.signals.progress.emit)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.done.emit(result)
+
+
 class SettingsView(QWidget):
     """
     '설정' 탭의 내용을 구성하는 뷰입니다.
     애플리케이션 설정 변경 및 데이터 관리 기능을 제공합니다.
     """
-    # 테마 변경 시 MainWindow에 알림 (QSS 재로드를 위함)
-    theme_changed = pyqtSignal()
+    # 테마 변경 시 MainWindow에 알림 (QSS 재로드를 위함 - 새 테마 이름을 함께 전달
+    # 하여 수신 측이 DB를 다시 조회하지 않아도 됨)
+    theme_changed = pyqtSignal(str)
     # CSV 임포트/엑스포트 시 WordManagementView에 알림 (목록 새로고침 위함)
     data_changed = pyqtSignal()
 
@@ -30,7 +61,24 @@ class SettingsView(QWidget):
         super().__init__()
         self.controller = controller
         self.file_handler = FileHandler() # 파일 입출력 및 DB 백업/복구 로직
-        
+
+        # 스핀박스 저장 디바운스 타이머 (스텝마다 DB 커밋하지 않고 멈춘 뒤 1회 저장)
+        self._pending_word_goal = None
+        self._save_timer_words = QTimer(self)
+        self._save_timer_words.setSingleShot(True)
+        self._save_timer_words.setInterval(300)
+        self._save_timer_words.timeout.connect(self._flush_word_goal)
+
+        self._pending_time_goal = None
+        self._save_timer_time = QTimer(self)
+        self._save_timer_time.setSingleShot(True)
+        self._save_timer_time.setInterval(300)
+        self._save_timer_time.timeout.connect(self._flush_time_goal)
+
+        # 파일 작업 워커 상태 (동시에 하나의 작업만 허용)
+        self._file_op_running: bool = False
+        self._file_op_dialog: Optional[QProgressDialog] = None
+
         self._setup_ui()
         self._load_current_settings()
 
@@ -125,14 +173,18 @@ class SettingsView(QWidget):
     def _load_current_settings(self):
         """ DB에서 현재 설정값을 불러와 UI에 적용합니다. """
         
-        # 1. 목표 설정
+        # 1. 목표 설정 (시그널 차단 - 방금 읽은 값을 valueChanged가 도로 쓰지 않도록)
         word_goal = self.controller.get_setting_value('daily_word_goal')
         if word_goal is not None:
+            self.goal_word_spin.blockSignals(True)
             self.goal_word_spin.setValue(int(word_goal))
-            
+            self.goal_word_spin.blockSignals(False)
+
         time_goal = self.controller.get_setting_value('daily_time_goal')
         if time_goal is not None:
+            self.goal_time_spin.blockSignals(True)
             self.goal_time_spin.setValue(int(time_goal))
+            self.goal_time_spin.blockSignals(False)
             
         # 2. 테마 설정 (시그널 차단 후 값 적용)
         self.theme_combo.blockSignals(True)
@@ -147,55 +199,120 @@ class SettingsView(QWidget):
     # 설정 변경 시 DB 저장 로직 (이름을 달리하여 시그널 충돌 방지)
     
     def _save_setting_words(self, value: int):
-        self.controller.update_app_setting('daily_word_goal', str(value))
-        LOGGER.info(f"Setting updated: daily_word_goal = {value}")
+        # 값이 바뀔 때마다 쓰지 않고 디바운스 - 입력이 멈춘 뒤 최종 값만 커밋
+        self._pending_word_goal = value
+        self._save_timer_words.start()
+
+    def _flush_word_goal(self):
+        self.controller.update_app_setting('daily_word_goal', str(self._pending_word_goal))
+        LOGGER.info(f"Setting updated: daily_word_goal = {self._pending_word_goal}")
 
     def _save_setting_time(self, value: int):
-        self.controller.update_app_setting('daily_time_goal', str(value))
-        LOGGER.info(f"Setting updated: daily_time_goal = {value}")
+        self._pending_time_goal = value
+        self._save_timer_time.start()
+
+    def _flush_time_goal(self):
+        self.controller.update_app_setting('daily_time_goal', str(self._pending_time_goal))
+        LOGGER.info(f"Setting updated: daily_time_goal = {self._pending_time_goal}")
 
     def _save_setting_theme(self, index: int):
         theme = self.theme_combo.itemData(index)
         if self.controller.update_app_setting('theme_mode', theme):
-            self.theme_changed.emit() # MainWindow에 테마 변경 알림
+            self.theme_changed.emit(theme) # MainWindow에 테마 변경 알림
             LOGGER.info(f"Setting updated: theme_mode = {theme}. Signal emitted.")
         else:
             QMessageBox.critical(self, "오류", "테마 설정 저장에 실패했습니다.")
 
     # --- 4. 데이터 관리 기능 핸들러 ---
-    
+
+    def _run_file_op(self, fn, busy_text: str, on_done):
+        """
+        파일 작업을 QThreadPool 워커에서 실행하고 진행 다이얼로그를 띄웁니다.
+        fn은 progress_cb 하나를 받는 callable이며, 완료 시 on_done(결과)가
+        GUI 스레드에서 호출됩니다.
+        """
+        if self._file_op_running:
+            return
+        self._file_op_running = True
+
+        # 진행률을 모르는 동안은 (0, 0) 범위로 바쁨 표시만 함
+        dialog = QProgressDialog(busy_text, "", 0, 0, self)
+        dialog.setWindowModality(Qt.WindowModal)
+        dialog.setCancelButton(None)
+        dialog.setMinimumDuration(0)
+        dialog.show()
+        self._file_op_dialog = dialog
+
+        worker = _FileOpWorker(fn)
+        worker.signals.progress.connect(self._on_file_op_progress)
+        worker.signals.done.connect(lambda result: self._on_file_op_done(on_done, result))
+        worker.signals.error.connect(self._on_file_op_error)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_file_op_progress(self, done: int, total: int):
+        if self._file_op_dialog is not None and total > 0:
+            self._file_op_dialog.setMaximum(total)
+            self._file_op_dialog.setValue(min(done, total))
+
+    def _on_file_op_done(self, on_done, result):
+        self._close_file_op_dialog()
+        on_done(result)
+
+    def _on_file_op_error(self, message: str):
+        self._close_file_op_dialog()
+        LOGGER.error(f"File operation failed: {message}")
+        QMessageBox.critical(self, "오류", f"작업 중 오류가 발생했습니다: {message}")
+
+    def _close_file_op_dialog(self):
+        self._file_op_running = False
+        if self._file_op_dialog is not None:
+            self._file_op_dialog.close()
+            self._file_op_dialog = None
+
     def _handle_csv_import(self):
-        """ CSV 파일을 선택하여 단어를 DB에 가져옵니다. """
+        """ CSV 파일을 선택하여 단어를 DB에 가져옵니다. (워커 스레드에서 처리) """
+        from PyQt5.QtWidgets import QFileDialog  # 파일 다이얼로그는 사용 시점에 로드
+
         file_path, _ = QFileDialog.getOpenFileName(self, "CSV 파일 선택", "", "CSV Files (*.csv);;All Files (*)")
         if not file_path:
             return
 
-        try:
-            # FileHandler를 통해 CSV를 파싱하고 WordController를 통해 DB에 저장
-            result = self.file_handler.import_words_from_csv(file_path, self.controller.word_model)
-            if result:
-                QMessageBox.information(self, "가져오기 완료", 
-                                        f"총 {result['total']}개 단어 처리.\n"
-                                        f"추가: {result['added']}개, 업데이트: {result['updated']}개, 건너뜀: {result['skipped']}개")
-                self.data_changed.emit() # 단어 목록 뷰 갱신 요청
-            else:
-                QMessageBox.critical(self, "가져오기 실패", "CSV 파일 처리 중 오류가 발생했습니다.")
-        except Exception as e:
-            LOGGER.error(f"CSV import failed: {e}")
-            QMessageBox.critical(self, "오류", f"CSV 가져오기 중 오류가 발생했습니다: {str(e)}")
+        word_model = self.controller.word_model
+        self._run_file_op(
+            lambda progress_cb: self.file_handler.import_words_from_csv(
+                file_path, word_model, progress_cb=progress_cb),
+            "단어를 가져오는 중...",
+            self._on_csv_import_done)
+
+    def _on_csv_import_done(self, result):
+        if result:
+            QMessageBox.information(self, "가져오기 완료",
+                                    f"총 {result['total']}개 단어 처리.\n"
+                                    f"추가: {result['added']}개, 업데이트: {result['updated']}개, 건너뜀: {result['skipped']}개")
+            # 임포트는 upsert_many로 컨트롤러를 우회하므로 읽기 캐시를 직접 무효화
+            # (그렇지 않으면 data_changed로 인한 재조회가 낡은 캐시 목록을 그대로 반환)
+            WordController.invalidate_read_caches()
+            self.data_changed.emit() # 단어 목록 뷰 갱신 요청
+        else:
+            QMessageBox.critical(self, "가져오기 실패", "CSV 파일 처리 중 오류가 발생했습니다.")
 
     def _handle_csv_export(self):
         """ 현재 DB의 모든 단어를 CSV 파일로 내보냅니다. """
+        from PyQt5.QtWidgets import QFileDialog
+        from datetime import datetime
+
         default_name = f"smart_vocab_export_{datetime.now().strftime('%Y%m%d')}.csv"
         file_path, _ = QFileDialog.getSaveFileName(self, "CSV 파일로 저장", default_name, "CSV Files (*.csv)")
         if not file_path:
             return
             
         try:
-            # WordController를 통해 모든 단어를 가져와 FileHandler로 CSV 생성
-            all_words = self.controller.word_model.select_all_words(include_deleted=False)
-            if self.file_handler.export_words_to_csv(file_path, all_words):
-                QMessageBox.information(self, "내보내기 완료", f"총 {len(all_words)}개의 단어를\n{file_path}에 저장했습니다.")
+            # 커서 제너레이터를 FileHandler에 그대로 넘겨 스트리밍으로 CSV 생성
+            # (전체 단어를 리스트로 구체화하지 않음; 개수는 COUNT(*)로 별도 집계)
+            words_iter = self.controller.word_model.iter_all_words(include_deleted=False)
+            if self.file_handler.export_words_to_csv(file_path, words_iter):
+                total = self.controller.word_model.count_all_words(include_deleted=False)
+                QMessageBox.information(self, "내보내기 완료", f"총 {total}개의 단어를\n{file_path}에 저장했습니다.")
             else:
                 QMessageBox.critical(self, "내보내기 실패", "파일 저장 중 오류가 발생했습니다.")
         except Exception as e:
@@ -203,16 +320,17 @@ class SettingsView(QWidget):
             QMessageBox.critical(self, "오류", f"CSV 내보내기 중 오류가 발생했습니다: {str(e)}")
 
     def _handle_db_backup(self):
-        """ 현재 DB 파일을 백업합니다. """
-        try:
-            backup_path = self.file_handler.backup_database()
-            if backup_path:
-                QMessageBox.information(self, "백업 완료", f"데이터베이스 백업이 성공적으로 완료되었습니다.\n경로: {backup_path}")
-            else:
-                QMessageBox.critical(self, "백업 실패", "데이터베이스 백업에 실패했습니다.")
-        except Exception as e:
-            LOGGER.error(f"DB backup failed: {e}")
-            QMessageBox.critical(self, "오류", f"DB 백업 중 오류가 발생했습니다: {str(e)}")
+        """ 현재 DB 파일을 백업합니다. (워커 스레드에서 처리) """
+        self._run_file_op(
+            lambda progress_cb: self.file_handler.backup_database(),
+            "데이터베이스 백업 중...",
+            self._on_db_backup_done)
+
+    def _on_db_backup_done(self, backup_path):
+        if backup_path:
+            QMessageBox.information(self, "백업 완료", f"데이터베이스 백업이 성공적으로 완료되었습니다.\n경로: {backup_path}")
+        else:
+            QMessageBox.critical(self, "백업 실패", "데이터베이스 백업에 실패했습니다.")
 
     def _handle_db_restore(self):
         """ 백업 파일을 선택하여 DB를 복원합니다. """
@@ -222,19 +340,26 @@ class SettingsView(QWidget):
         if reply == QMessageBox.No:
             return
 
+        from PyQt5.QtWidgets import QFileDialog
+
         file_path, _ = QFileDialog.getOpenFileName(self, "백업 DB 파일 선택", "", "SQLite DB Files (*.db *.sqlite3);;All Files (*)")
         if not file_path:
             return
 
-        try:
-            if self.file_handler.restore_database(file_path):
-                QMessageBox.information(self, "복원 완료", "데이터베이스 복원이 완료되었습니다. 애플리케이션을 다시 시작해주세요.")
-                # 앱 종료를 유도하거나 메인 윈도우 재시작 시그널 발생 (여기서는 종료 유도)
-            else:
-                QMessageBox.critical(self, "복원 실패", "데이터베이스 복원에 실패했습니다. 파일이 유효한지 확인하세요.")
-        except Exception as e:
-            LOGGER.error(f"DB restore failed: {e}")
-            QMessageBox.critical(self, "오류", f"DB 복원 중 오류가 발생했습니다: {str(e)}")
+        self._run_file_op(
+            lambda progress_cb: self.file_handler.restore_database(file_path),
+            "데이터베이스 복원 중...",
+            self._on_db_restore_done)
+
+    def _on_db_restore_done(self, success):
+        if success:
+            # 복원은 컨트롤러를 거치지 않고 DB 내용을 통째로 바꾸므로 캐시 무효화
+            WordController.invalidate_read_caches()
+            self.data_changed.emit()
+            QMessageBox.information(self, "복원 완료", "데이터베이스 복원이 완료되었습니다. 애플리케이션을 다시 시작해주세요.")
+            # 앱 종료를 유도하거나 메인 윈도우 재시작 시그널 발생 (여기서는 종료 유도)
+        else:
+            QMessageBox.critical(self, "복원 실패", "데이터베이스 복원에 실패했습니다. 파일이 유효한지 확인하세요.")
 
     def _handle_db_reset(self):
         """ DB를 완전히 초기화하고 초기 데이터를 삽입합니다. """
@@ -243,13 +368,18 @@ class SettingsView(QWidget):
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            try:
-                # FileHandler.initialize_database를 통해 DB 초기화 (스키마 재생성 및 초기 데이터 삽입)
-                if self.file_handler.reset_all_data():
-                    QMessageBox.information(self, "초기화 완료", "모든 데이터가 성공적으로 초기화되었습니다. 애플리케이션을 다시 시작해주세요.")
-                    # 앱 종료 유도
-                else:
-                    QMessageBox.critical(self, "초기화 실패", "데이터 초기화에 실패했습니다.")
-            except Exception as e:
-                LOGGER.error(f"DB reset failed: {e}")
-                QMessageBox.critical(self, "오류", f"데이터 초기화 중 오류가 발생했습니다: {str(e)}")
\ No newline at end of file
+            # FileHandler.reset_all_data를 통해 DB 초기화 (스키마 재생성 및 초기 데이터 삽입)
+            self._run_file_op(
+                lambda progress_cb: self.file_handler.reset_all_data(),
+                "데이터 초기화 중...",
+                self._on_db_reset_done)
+
+    def _on_db_reset_done(self, success):
+        if success:
+            # 초기화도 컨트롤러를 거치지 않으므로 캐시 무효화
+            WordController.invalidate_read_caches()
+            self.data_changed.emit()
+            QMessageBox.information(self, "초기화 완료", "모든 데이터가 성공적으로 초기화되었습니다. 애플리케이션을 다시 시작해주세요.")
+            # 앱 종료 유도
+        else:
+            QMessageBox.critical(self, "초기화 실패", "데이터 초기화에 실패했습니다.")
\ No newline at end of file
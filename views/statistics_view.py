@@ -3,16 +3,10 @@ from PyQt5.QtWidgets import (
     QGridLayout, QSizePolicy
 )
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
 from controllers.learning_controller import LearningController
 from typing import Dict, Any, List, Tuple
 from utils.logger import setup_logger
-
-# Matplotlib를 PyQt5 위젯에 통합하기 위한 모듈
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
-import random
+from views.common import font as _font
 
 # 2025-10-20 - 스마트 단어장 - 통계 뷰
 # 파일 위치: views/statistics_view.py - v1
@@ -20,18 +14,47 @@ import random
 
 LOGGER = setup_logger()
 
-# Matplotlib 차트 위젯을 위한 기본 클래스
-class MplCanvas(FigureCanvas):
-    """ Matplotlib Figure를 포함하고 PyQt5에서 사용할 수 있는 캔버스 위젯입니다. """
-    def __init__(self, parent=None, width=5, height=4, dpi=100):
-        # 차트 스타일 설정 (다크 모드 대비)
-        plt.style.use('default') # 기본 스타일 사용
-        self.fig = Figure(figsize=(width, height), dpi=dpi, facecolor='none')
-        self.axes = self.fig.add_subplot(111)
-        super().__init__(self.fig)
-        self.setParent(parent)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.updateGeometry()
+# 지연 정의된 MplCanvas 클래스 캐시 (첫 차트 생성 시 1회 채워짐)
+_MPL_CANVAS_CLS = None
+
+# 파이 차트 상수 (매 렌더마다 리스트를 새로 만들지 않고 슬라이스로 재사용)
+_PIE_COLORS = ('#4CAF50', '#FFC107', '#F44336', '#1976D2', '#9C27B0')
+_PIE_EXPLODE = (0.05,) * len(_PIE_COLORS)
+
+
+def _get_canvas_cls():
+    """
+    Matplotlib 캔버스 클래스를 반환합니다. matplotlib 임포트(백엔드 + 폰트
+    캐시 초기화로 수백 ms)와 클래스 정의를 첫 캔버스 생성 시점까지 미루므로,
+    이 모듈 임포트 자체는 가볍게 유지됩니다.
+    """
+    global _MPL_CANVAS_CLS
+    if _MPL_CANVAS_CLS is not None:
+        return _MPL_CANVAS_CLS
+
+    # Matplotlib를 PyQt5 위젯에 통합하기 위한 모듈
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+    from matplotlib.figure import Figure
+    import matplotlib.pyplot as plt
+
+    # Matplotlib 차트 위젯을 위한 기본 클래스
+    class MplCanvas(FigureCanvas):
+        """ Matplotlib Figure를 포함하고 PyQt5에서 사용할 수 있는 캔버스 위젯입니다. """
+        def __init__(self, parent=None, width=5, height=4, dpi=100):
+            # 차트 스타일 설정 (다크 모드 대비)
+            plt.style.use('default') # 기본 스타일 사용
+            self.fig = Figure(figsize=(width, height), dpi=dpi, facecolor='none')
+            # 고정 여백을 1회 지정 - 매 렌더마다 tight_layout으로 모든 아티스트를
+            # 재측정하지 않아도 회전된 x축 라벨이 잘리지 않을 만큼 확보
+            self.fig.subplots_adjust(left=0.12, right=0.97, top=0.88, bottom=0.22)
+            self.axes = self.fig.add_subplot(111)
+            super().__init__(self.fig)
+            self.setParent(parent)
+            self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            self.updateGeometry()
+
+    _MPL_CANVAS_CLS = MplCanvas
+    return MplCanvas
 
 class StatisticsView(QWidget):
     """
@@ -42,7 +65,12 @@ class StatisticsView(QWidget):
     def __init__(self, controller: LearningController):
         super().__init__()
         self.controller = controller
-        
+
+        # 차트 증분 갱신용 캐시: 추이 라인 아티스트와 파이 데이터 키
+        # (매 표시마다 axes를 전부 지우고 다시 그리지 않도록 함)
+        self._trend_line = None
+        self._pie_cache_key = None
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -57,10 +85,12 @@ class StatisticsView(QWidget):
         chart_group = QGroupBox("학습 통계 시각화")
         chart_layout = QGridLayout(chart_group)
         
+        MplCanvas = _get_canvas_cls()  # 이 시점에 처음으로 matplotlib 로드
+
         # 2-1. 숙련도 분포 차트 (파이 차트)
         self.proficiency_canvas = MplCanvas(self, width=5, height=4)
         chart_layout.addWidget(self.proficiency_canvas, 0, 0)
-        
+
         # 2-2. 일간 정답률 추이 차트 (라인 차트)
         self.daily_trend_canvas = MplCanvas(self, width=5, height=4)
         chart_layout.addWidget(self.daily_trend_canvas, 0, 1)
@@ -86,10 +116,10 @@ class StatisticsView(QWidget):
         for key, title, default_value, color in data_points:
             v_layout = QVBoxLayout()
             title_label = QLabel(title)
-            title_label.setFont(QFont('Arial', 10))
-            
+            title_label.setFont(_font(10))
+
             value_label = QLabel(default_value)
-            value_label.setFont(QFont('Arial', 18, QFont.Bold))
+            value_label.setFont(_font(18, bold=True))
             value_label.setAlignment(Qt.AlignCenter)
             value_label.setStyleSheet(f"color: {color};")
             
@@ -114,8 +144,11 @@ class StatisticsView(QWidget):
     def _load_data_and_draw_charts(self):
         """ 컨트롤러에서 데이터를 가져와 대시보드와 차트를 업데이트합니다. """
         try:
+            # 통계 탭에 필요한 세 데이터를 단일 컨트롤러 호출로 묶어 조회
+            bundle = self.controller.get_statistics_bundle(days=7)
+
             # 1. 대시보드 요약 업데이트
-            summary_data = self.controller.get_dashboard_summary()
+            summary_data = bundle['summary']
             # self.summary_labels['total_words'].setText(f"{summary_data.get('total_words', 0)}개")
             # self.summary_labels['today_words'].setText(f"{summary_data.get('today_words', 0)}개")
             # self.summary_labels['today_time'].setText(f"{summary_data.get('today_time', 0)}분")
@@ -126,10 +159,10 @@ class StatisticsView(QWidget):
             self.summary_labels['today_time'].setText(f"{summary_data.get('today_learning_time_min', 0)}분")
             self.summary_labels['due_review'].setText(f"{summary_data.get('wrong_words_count', 0)}개")
             
-            # 2. 차트 데이터 가져오기
-            proficiency_data = self.controller.get_word_proficiency_distribution()
-            daily_trend_data = self.controller.get_daily_correct_rate_trend(days=7)
-            
+            # 2. 차트 데이터 (같은 번들에서 꺼냄)
+            proficiency_data = bundle['proficiency']
+            daily_trend_data = bundle['trend']
+
             # 3. 차트 그리기
             self._draw_proficiency_chart(proficiency_data)
             self._draw_daily_trend_chart(daily_trend_data)
@@ -138,49 +171,69 @@ class StatisticsView(QWidget):
             LOGGER.error(f"Failed to load statistics data: {e}")
 
     def _draw_proficiency_chart(self, data: Dict[str, int]):
-        """ 숙련도 분포를 파이 차트로 그립니다. """
-        canvas = self.proficiency_canvas
-        canvas.axes.clear() # 기존 차트 지우기
-        
+        """ 숙련도 분포를 파이 차트로 그립니다. (데이터가 바뀐 경우에만) """
         # 데이터 정제 (SRS 레벨별 단어 수 등)
         labels = list(data.keys())
         sizes = list(data.values())
-        
-        # 색상 및 라벨 설정
-        colors = ['#4CAF50', '#FFC107', '#F44336'] # Green, Yellow, Red 계열
-        explode = [0.05] * len(labels)
-        
+
+        # 데이터가 지난 렌더와 동일하면 파이 전체 재구성(웨지/텍스트 재생성)을 생략
+        cache_key = (tuple(labels), tuple(sizes))
+        if cache_key == self._pie_cache_key:
+            return
+        self._pie_cache_key = cache_key
+
+        canvas = self.proficiency_canvas
+        canvas.axes.clear() # 기존 차트 지우기
+
+        n = len(labels)
         if sum(sizes) == 0:
-             canvas.axes.text(0.5, 0.5, '데이터 부족', transform=canvas.axes.transAxes, 
+             canvas.axes.text(0.5, 0.5, '데이터 부족', transform=canvas.axes.transAxes,
                               ha='center', va='center', fontsize=16, color='gray')
         else:
-            canvas.axes.pie(sizes, labels=labels, autopct='%1.1f%%', 
-                             startangle=90, colors=colors[:len(labels)], 
-                             explode=explode[:len(labels)], shadow=True)
+            canvas.axes.pie(sizes, labels=labels, autopct='%1.1f%%',
+                             startangle=90, colors=_PIE_COLORS[:n],
+                             explode=_PIE_EXPLODE[:n], shadow=True)
             
         canvas.axes.set_title("단어 숙련도 분포")
-        canvas.draw()
+        canvas.draw_idle() # 페인트 병합 (연속 갱신 시 1회만 렌더)
 
     def _draw_daily_trend_chart(self, data: List[Tuple[str, float]]):
-        """ 최근 학습일의 정답률 추이를 라인 차트로 그립니다. """
+        """ 최근 학습일의 정답률 추이를 라인 차트로 그립니다.
+        첫 호출에서만 축/라인을 구성하고, 이후에는 라인 데이터만 교체하여
+        axes 전체 해체/재생성 비용을 피합니다. """
         canvas = self.daily_trend_canvas
-        canvas.axes.clear() # 기존 차트 지우기
 
         # 데이터 정제
         dates = [item.get('date') for item in data]
         rates = [item.get('rate') for item in data]
-        
+
         if not dates:
-             canvas.axes.text(0.5, 0.5, '데이터 부족', transform=canvas.axes.transAxes, 
-                              ha='center', va='center', fontsize=16, color='gray')
-        else:
-            canvas.axes.plot(dates, rates, marker='o', linestyle='-', color='#1976D2', label='정답률 (%)')
+            canvas.axes.clear()
+            canvas.axes.text(0.5, 0.5, '데이터 부족', transform=canvas.axes.transAxes,
+                             ha='center', va='center', fontsize=16, color='gray')
+            self._trend_line = None # 다음 데이터 도착 시 축을 새로 구성
+            canvas.draw_idle()
+            return
+
+        positions = range(len(dates))
+        if self._trend_line is None:
+            # 최초 1회: 축 구성 + 라인 아티스트 생성 후 보관
+            canvas.axes.clear()
+            (self._trend_line,) = canvas.axes.plot(
+                positions, rates, marker='o', linestyle='-', color='#1976D2', label='정답률 (%)')
             canvas.axes.set_ylim(0, 100) # 정답률은 0%에서 100% 사이
             canvas.axes.set_title("최근 7일 학습 정답률 추이")
             canvas.axes.set_xlabel("날짜")
             canvas.axes.set_ylabel("정답률 (%)")
             canvas.axes.grid(True, linestyle='--', alpha=0.6)
             canvas.axes.tick_params(axis='x', rotation=45) # x축 라벨 기울임
-            canvas.fig.tight_layout() # 레이아웃 조정
-            
-        canvas.draw()
\ No newline at end of file
+            # 여백은 캔버스 생성 시 subplots_adjust로 고정 (tight_layout 재측정 회피)
+        else:
+            # 이후 호출: 기존 아티스트의 데이터만 교체
+            self._trend_line.set_data(positions, rates)
+
+        canvas.axes.set_xticks(positions)
+        canvas.axes.set_xticklabels(dates, rotation=45)
+        canvas.axes.set_xlim(-0.5, len(dates) - 0.5 if len(dates) > 1 else 0.5)
+
+        canvas.draw_idle()
\ No newline at end of file
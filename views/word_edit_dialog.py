@@ -21,11 +21,23 @@ class WordEditDialog(QDialog):
     # 저장 완료 시 WordManagementView에 새로고침을 알리는 시그널
     word_saved = pyqtSignal()
 
-    def __init__(self, controller: WordController, word_id: Optional[int] = None, parent=None):
+    # 입력 폼 구성 명세: (속성명, 위젯 클래스, 라벨, 플레이스홀더)
+    # 위젯 클래스가 None인 항목은 카테고리 콤보 박스 (특수 처리)
+    FIELDS = (
+        ('word_input', QLineEdit, "단어 (Word) *", "단어를 입력하세요 (예: develop)"),
+        ('meaning_input', QLineEdit, "의미 (Meaning) *", "의미를 입력하세요 (예: 개발하다, 발전시키다)"),
+        ('category_combo', None, "카테고리 (Category) *", None),
+        ('memo_input', QTextEdit, "메모 (Memo)", "추가 설명이나 예문 등을 입력하세요."),
+    )
+
+    def __init__(self, controller: WordController, word_id: Optional[int] = None,
+                 prefetched: Optional[Dict[str, Any]] = None, parent=None):
         super().__init__(parent)
         self.controller = controller
         self.word_id = word_id
         self.is_edit_mode = word_id is not None
+        # 호출 측(목록 뷰)이 이미 들고 있는 행 dict - 있으면 DB 재조회를 생략
+        self._prefetched = prefetched
         
         self.setWindowTitle("단어 수정" if self.is_edit_mode else "새 단어 추가")
         self.setModal(True)
@@ -41,26 +53,18 @@ class WordEditDialog(QDialog):
         main_layout = QVBoxLayout(self)
         form_layout = QFormLayout()
         
-        # 1. 단어 입력 필드 (필수)
-        self.word_input = QLineEdit()
-        self.word_input.setPlaceholderText("단어를 입력하세요 (예: develop)")
-        form_layout.addRow(QLabel("단어 (Word) *"), self.word_input)
-        
-        # 2. 의미 입력 필드 (필수)
-        self.meaning_input = QLineEdit()
-        self.meaning_input.setPlaceholderText("의미를 입력하세요 (예: 개발하다, 발전시키다)")
-        form_layout.addRow(QLabel("의미 (Meaning) *"), self.meaning_input)
-
-        # 3. 카테고리 선택 (필수)
-        self.category_combo = QComboBox()
-        self.category_combo.setEditable(True) # 새 카테고리 직접 입력 허용
-        form_layout.addRow(QLabel("카테고리 (Category) *"), self.category_combo)
-
-        # 4. 메모 입력 필드 (선택)
-        self.memo_input = QTextEdit()
-        self.memo_input.setPlaceholderText("추가 설명이나 예문 등을 입력하세요.")
+        # 입력 필드는 FIELDS 명세를 따라 일괄 생성 (개별 생성 코드 반복 제거)
+        for attr, widget_cls, label, placeholder in self.FIELDS:
+            if widget_cls is None:
+                widget = QComboBox()
+                widget.setEditable(True) # 새 카테고리 직접 입력 허용
+            else:
+                widget = widget_cls()
+                widget.setPlaceholderText(placeholder)
+            setattr(self, attr, widget)
+            form_layout.addRow(QLabel(label), widget)
+
         self.memo_input.setMaximumHeight(80)
-        form_layout.addRow(QLabel("메모 (Memo)"), self.memo_input)
 
         main_layout.addLayout(form_layout)
         
@@ -80,26 +84,31 @@ class WordEditDialog(QDialog):
         
     def _load_categories(self):
         """ 기존 카테고리 목록을 불러와 콤보 박스에 채웁니다. """
-        self.category_combo.clear()
-        self.category_combo.addItem("기타") # 기본 카테고리
         categories = self.controller.get_all_categories()
-        for cat in categories:
-            # 중복 방지 (기타는 이미 추가됨)
-            if cat and cat not in ["기타"]:
-                self.category_combo.addItem(cat)
+        # 기본 '기타' + 중복 제거 후 일괄 삽입 (항목별 addItem 반복 회피)
+        items = ["기타"] + [cat for cat in categories if cat and cat != "기타"]
+
+        self.category_combo.blockSignals(True)
+        self.category_combo.clear()
+        self.category_combo.addItems(items)
+        self.category_combo.blockSignals(False)
+
+        # 텍스트 → 인덱스 매핑 (수정 모드에서 findText 선형 탐색 대신 O(1) 조회)
+        self._cat_index = {text: i for i, text in enumerate(items)}
                 
     def _load_word_data(self):
-        """ 수정 모드일 때 기존 단어 정보를 불러와 필드에 채웁니다. """
-        word_data = self.controller.get_word_by_id(self.word_id)
+        """ 수정 모드일 때 기존 단어 정보를 불러와 필드에 채웁니다.
+        호출 측이 전달한 행이 있으면 그대로 쓰고, 없을 때만 DB를 조회합니다. """
+        word_data = self._prefetched or self.controller.get_word_by_id(self.word_id)
         
         if word_data:
             self.word_input.setText(word_data.get('word_text', ''))
             self.meaning_input.setText(word_data.get('meaning_ko', ''))
             self.memo_input.setText(word_data.get('memo', ''))
             
-            # 카테고리 설정
+            # 카테고리 설정 (populate 시 만든 매핑에서 O(1) 조회)
             category = word_data.get('category', '기타')
-            index = self.category_combo.findText(category)
+            index = self._cat_index.get(category, -1)
             if index != -1:
                 self.category_combo.setCurrentIndex(index)
             else:
@@ -1,12 +1,16 @@
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, 
-    QLineEdit, QPushButton, QComboBox, QHeaderView, 
-    QAbstractItemView, QTableWidgetItem, QMessageBox, QLabel
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+    QLineEdit, QPushButton, QComboBox, QHeaderView,
+    QAbstractItemView, QMessageBox, QLabel
+)
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QTimer, QAbstractTableModel, QModelIndex,
+    QSortFilterProxyModel, QObject, QRunnable, QThreadPool
 )
-from PyQt5.QtCore import Qt, pyqtSignal
 from controllers.word_controller import WordController
 from utils.logger import setup_logger
 from typing import List, Dict, Any, Optional
+import re
 
 # 2025-10-20 - 스마트 단어장 - 단어 관리 뷰
 # 파일 위치: views/word_management_view.py - v1
@@ -14,6 +18,201 @@ from typing import List, Dict, Any, Optional
 
 LOGGER = setup_logger()
 
+
+class WordRow:
+    """
+    테이블 한 행의 단어 데이터입니다. dict 대신 __slots__ 클래스를 쓰면
+    행당 메모리 오버헤드가 수 배 줄고, 필터/표시 경로의 속성 접근이
+    dict 해시 조회보다 빠릅니다. (수만 행 목록을 상정)
+    """
+
+    __slots__ = ('word_id', 'word_text', 'meaning_ko', 'category',
+                 'memo', 'is_favorite', 'modified_date', 'modified_short')
+
+    def __init__(self, d: Dict[str, Any]):
+        self.word_id = d.get('word_id')
+        self.word_text = d.get('word_text') or ''
+        self.meaning_ko = d.get('meaning_ko') or ''
+        self.category = d.get('category') or ''
+        self.memo = d.get('memo') or ''
+        self.is_favorite = d.get('is_favorite', 0)
+        self.modified_date = d.get('modified_date') or ''
+        # 수정일 표시 문자열은 유입 시점에 1회만 잘라 둠
+        self.modified_short = self.modified_date[:10]
+
+    def get(self, key: str, default=None):
+        """ dict 스타일 접근 호환 (WordEditDialog의 prefetched 행 등). """
+        return getattr(self, key, default)
+
+
+class WordTableModel(QAbstractTableModel):
+    """
+    단어 목록(WordRow 리스트)을 그대로 노출하는 경량 테이블 모델입니다.
+    셀마다 QTableWidgetItem을 만들지 않으므로 목록 교체가 O(1)이고,
+    화면에 보이는 인덱스에 대해서만 data()로 값을 꺼내 그립니다.
+    즐겨찾기 별표와 수정일 슬라이스도 표시 시점에 지연 포맷합니다.
+
+    행은 canFetchMore/fetchMore로 PAGE_SIZE개씩 점진 노출되므로 첫 페인트
+    비용이 전체 단어 수와 무관하게 일정합니다. (스크롤 시 다음 페이지 삽입)
+    """
+
+    COLS = ('word_id', 'word_text', 'meaning_ko', 'category',
+            'memo', 'is_favorite', 'modified_date')
+    HEADERS = ("ID", "단어", "의미", "카테고리", "메모", "즐겨찾기", "수정일")
+
+    # 한 번에 노출하는 행 수 (화면 몇 장 분량이면 충분)
+    PAGE_SIZE = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[WordRow] = []          # 전체 백킹 데이터
+        self._loaded: int = 0                   # 뷰에 노출된 행 수
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        end = min(self._loaded + self.PAGE_SIZE, len(self._rows))
+        if end <= self._loaded:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, end - 1)
+        self._loaded = end
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.COLS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        # 어느 컬럼에서든 UserRole로 해당 행의 word_id(int)를 꺼낼 수 있음
+        # (숨겨진 ID 셀 텍스트를 다시 int로 파싱하지 않아도 됨)
+        if role == Qt.UserRole:
+            return self._rows[index.row()].word_id
+        # 즐겨찾기 별표는 셀 중앙 정렬 (행 객체 할당 없이 역할로만 제공)
+        if role == Qt.TextAlignmentRole:
+            if self.COLS[index.column()] == 'is_favorite':
+                return Qt.AlignCenter
+            return None
+        if role != Qt.DisplayRole:
+            return None
+        row = self._rows[index.row()]
+        col = self.COLS[index.column()]
+        if col == 'is_favorite':
+            return "★" if row.is_favorite == 1 else ""
+        if col == 'modified_date':
+            return row.modified_short
+        if col == 'word_id':
+            return str(row.word_id)
+        return getattr(row, col, '')
+
+    def set_rows(self, rows: List[Dict[str, Any]]):
+        """
+        표시할 행 목록을 통째로 교체합니다. (모델 리셋 1회)
+        리셋 직후 첫 페이지만 노출하고 나머지는 스크롤 시 fetchMore로 붙습니다.
+        """
+        self.beginResetModel()
+        # 컨트롤러가 내준 dict를 경량 __slots__ 행 객체로 1회 변환
+        self._rows = [WordRow(row) for row in rows]
+        self._loaded = min(self.PAGE_SIZE, len(rows))
+        self.endResetModel()
+
+    def row_at(self, row: int) -> Optional[WordRow]:
+        """ 지정한 행의 WordRow 객체를 반환합니다. (범위를 벗어나면 None) """
+        if 0 <= row < self._loaded:
+            return self._rows[row]
+        return None
+
+    def load_all(self):
+        """
+        남은 행을 한 번에 모두 노출합니다. 필터는 노출된 행만 대상으로
+        하므로, 검색/카테고리 필터를 걸기 전에 호출해 전체를 검사 대상에
+        포함시킵니다.
+        """
+        total = len(self._rows)
+        if self._loaded >= total:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, total - 1)
+        self._loaded = total
+        self.endInsertRows()
+
+
+class WordFilterProxy(QSortFilterProxyModel):
+    """
+    검색어/카테고리 필터를 Qt C++ 레이어에서 수행하는 프록시 모델입니다.
+    행을 다시 만들거나 DB를 재조회하지 않고 가시성만 바꾸므로
+    필터 전환이 즉각적입니다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pattern: Optional[re.Pattern] = None
+        self._category: str = ''
+
+    def set_keyword(self, keyword: str):
+        """ 검색어를 설정하고 필터를 재평가합니다. (대소문자 무시)
+        검색어가 바뀔 때 1회만 컴파일해 행마다 casefold 사본을 만들지 않습니다. """
+        keyword = keyword.strip()
+        self._pattern = re.compile(re.escape(keyword), re.IGNORECASE) if keyword else None
+        if self._pattern:
+            self.sourceModel().load_all()
+        self.invalidateFilter()
+
+    def set_category(self, category: str):
+        """ 카테고리를 설정하고 필터를 재평가합니다. (빈 문자열 = 전체) """
+        self._category = category
+        if self._category:
+            self.sourceModel().load_all()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._pattern is None and not self._category:
+            return True
+        word = self.sourceModel().row_at(source_row)
+        if word is None:
+            return False
+        if self._category and word.category != self._category:
+            return False
+        if self._pattern is not None:
+            search = self._pattern.search
+            return bool(search(word.word_text)
+                        or search(word.meaning_ko)
+                        or search(word.memo))
+        return True
+
+
+class _WordsWorkerSignals(QObject):
+    """ _WordsWorker의 결과 전달용 시그널 홀더. (QRunnable은 시그널 불가) """
+    finished = pyqtSignal(list)
+
+
+class _WordsWorker(QRunnable):
+    """ 전체 단어 목록 조회를 워커 스레드에서 수행하는 QRunnable. """
+
+    def __init__(self, controller):
+        super().__init__()
+        self.signals = _WordsWorkerSignals()
+        self._controller = controller
+
+    def run(self):
+        try:
+            words = self._controller.get_all_active_words()
+        except Exception as e:
+            LOGGER.error(f"Failed to load words in worker: {e}")
+            words = []
+        self.signals.finished.emit(words)
+
+
 class WordManagementView(QWidget):
     """
     '단어 관리' 탭의 내용을 구성하는 뷰입니다.
@@ -21,14 +220,16 @@ class WordManagementView(QWidget):
     MainWindow의 상태 바 업데이트를 위해 시그널을 방출합니다.
     """
     
-    # MainWindow에 단어 수가 변경되었음을 알리는 시그널
-    word_count_changed = pyqtSignal()
+    # MainWindow에 단어 수 변화량을 알리는 시그널 (예: {'total_words': -1})
+    # 상태 바가 전체 집계를 다시 조회하지 않고 증분만 반영할 수 있게 함
+    stats_delta = pyqtSignal(dict)
 
     def __init__(self, controller: WordController):
         super().__init__()
         # WordController 인스턴스 (BaseController에서 상속받은 모델 접근 가능)
-        self.controller = controller 
+        self.controller = controller
         self.current_words: List[Dict[str, Any]] = []
+        self._words_loading: bool = False # 목록 조회 워커 중복 기동 방지
         self._setup_ui()
         self._load_categories()
         self._load_words()
@@ -40,7 +241,7 @@ class WordManagementView(QWidget):
         control_panel = self._create_control_panel()
         main_layout.addWidget(control_panel)
         
-        # 2. 단어 목록 테이블 영역 (QTableWidget)
+        # 2. 단어 목록 테이블 영역 (QTableView + WordTableModel)
         self.word_table = self._create_word_table()
         main_layout.addWidget(self.word_table)
         
@@ -54,10 +255,16 @@ class WordManagementView(QWidget):
         h_layout = QHBoxLayout(control_widget)
         h_layout.setContentsMargins(0, 0, 0, 0)
 
-        # 검색 영역
+        # 검색 영역 (입력 디바운스 - 타이핑이 멈춘 뒤 1회만 DB 조회)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(250)
+        self._search_timer.timeout.connect(self._search_words)
+
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("검색 (단어, 의미, 메모)")
         self.search_input.returnPressed.connect(self._search_words)
+        self.search_input.textChanged.connect(self._schedule_search)
         h_layout.addWidget(self.search_input)
         
         self.search_button = QPushButton("검색")
@@ -75,32 +282,37 @@ class WordManagementView(QWidget):
         
         return control_widget
 
-    def _create_word_table(self) -> QTableWidget:
-        """ 단어 목록을 표시할 QTableWidget을 생성 및 설정합니다. """
-        table = QTableWidget()
-        
-        headers = ["ID", "단어", "의미", "카테고리", "메모", "즐겨찾기", "수정일"]
-        table.setColumnCount(len(headers))
-        table.setHorizontalHeaderLabels(headers)
-        
-        # QTableWidget 설정
+    def _create_word_table(self) -> QTableView:
+        """ 단어 목록을 표시할 QTableView를 생성 및 설정합니다. """
+        table = QTableView()
+
+        # 모델 기반 테이블 (행 데이터는 WordTableModel, 검색/필터는 프록시가 담당)
+        self.word_model = WordTableModel(self)
+        self.word_proxy = WordFilterProxy(self)
+        self.word_proxy.setSourceModel(self.word_model)
+        table.setModel(self.word_proxy)
+
+        # QTableView 설정
         table.setEditTriggers(QAbstractItemView.NoEditTriggers) # 편집 불가능
         table.setSelectionBehavior(QAbstractItemView.SelectRows) # 행 단위 선택
         table.setSelectionMode(QAbstractItemView.SingleSelection) # 단일 행 선택
-        
+
         # 컬럼 너비 조정
         header = table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents) 
-        header.setSectionResizeMode(1, QHeaderView.Stretch) 
-        header.setSectionResizeMode(2, QHeaderView.Stretch) 
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents) 
-        header.setSectionResizeMode(4, QHeaderView.Stretch) 
-        header.setSectionResizeMode(5, QHeaderView.ResizeToContents) 
-        header.setSectionResizeMode(6, QHeaderView.ResizeToContents) 
+        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.Stretch)
+        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(4, QHeaderView.Stretch)
+        header.setSectionResizeMode(5, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(6, QHeaderView.ResizeToContents)
+
+        # word_id 컬럼 숨김 (목록 갱신과 무관하게 1회만 설정)
+        table.setColumnHidden(0, True)
 
         # 테이블 더블 클릭 이벤트 연결 (단어 수정 다이얼로그 호출)
         table.doubleClicked.connect(self._handle_table_double_click)
-        
+
         return table
 
     def _create_crud_buttons(self) -> QHBoxLayout:
@@ -126,98 +338,120 @@ class WordManagementView(QWidget):
 
     def _load_categories(self):
         """ WordController를 통해 카테고리 목록을 불러와 콤보 박스에 채웁니다. """
+        categories = self.controller.get_all_categories()
+
         self.category_combo.blockSignals(True)
         self.category_combo.clear()
-        self.category_combo.addItem("전체 카테고리")
-        
-        categories = self.controller.get_all_categories()
-        for cat in categories:
-            self.category_combo.addItem(cat)
-            
+        # 항목별 addItem 대신 일괄 삽입 (모델 삽입/레이아웃 재계산 1회)
+        self.category_combo.addItems(["전체 카테고리", *categories])
         self.category_combo.blockSignals(False)
 
     def _load_words(self, word_list: Optional[List[Dict[str, Any]]] = None):
         """
         단어 목록을 불러와 테이블에 표시합니다.
+        전체 목록 조회(DB)는 워커 스레드에서 수행되어 GUI가 멈추지 않습니다.
         """
-        if word_list is None:
-            self.current_words = self.controller.get_all_active_words()
-        else:
-            self.current_words = word_list
-            
-        self.word_table.setRowCount(len(self.current_words))
-        
-        for row_idx, word in enumerate(self.current_words):
-            self.word_table.setItem(row_idx, 0, QTableWidgetItem(str(word.get('word_id', ''))))
-            self.word_table.setItem(row_idx, 1, QTableWidgetItem(word.get('word_text', '')))
-            self.word_table.setItem(row_idx, 2, QTableWidgetItem(word.get('meaning_ko', '')))
-            self.word_table.setItem(row_idx, 3, QTableWidgetItem(word.get('category', '')))
-            self.word_table.setItem(row_idx, 4, QTableWidgetItem(word.get('memo', '')))
-            fav_text = "★" if word.get('is_favorite', 0) == 1 else ""
-            self.word_table.setItem(row_idx, 5, QTableWidgetItem(fav_text))
-            self.word_table.setItem(row_idx, 6, QTableWidgetItem(word.get('modified_date', '')[:10]))
-
-        # word_id 컬럼 숨김
-        self.word_table.setColumnHidden(0, True)
-
-        # 상태 바 업데이트 시그널 방출 (MainWindow에서 연결되어 상태바를 업데이트할 예정)
-        self.word_count_changed.emit()
-        LOGGER.info(f"Loaded {len(self.current_words)} words into the table.")
+        if word_list is not None:
+            self._apply_words(word_list)
+            return
+
+        # 이미 조회 워커가 돌고 있으면 완료 시 반영되므로 중복 기동하지 않음
+        if self._words_loading:
+            return
+        self._words_loading = True
+
+        worker = _WordsWorker(self.controller)
+        worker.signals.finished.connect(self._on_words_loaded)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_words_loaded(self, words: List[Dict[str, Any]]):
+        """ 워커가 전달한 단어 목록을 테이블에 반영합니다. (메인 스레드) """
+        self._words_loading = False
+        self._apply_words(words)
+
+    def _apply_words(self, words: List[Dict[str, Any]]):
+        self.current_words = words
+        # 셀 아이템을 일일이 만들지 않고 모델 행 목록만 교체 (리셋 1회)
+        self.word_model.set_rows(words)
+
+        # 단순 재조회(검색/필터)는 단어 수를 바꾸지 않으므로 여기서는 시그널을
+        # 방출하지 않음 - 실제 변이 지점(_delete_word 등)에서 stats_delta를 방출
+        LOGGER.info(f"Loaded {len(words)} words into the table.")
 
     def _get_selected_word_id(self) -> Optional[int]:
         """ 테이블에서 선택된 행의 word_id를 반환합니다. """
-        selected_rows = self.word_table.selectedIndexes()
-        if not selected_rows:
+        # SingleSelection + SelectRows 설정이므로 selectedRows() 리스트를
+        # 만들 필요 없이 currentIndex() 하나면 충분
+        index = self.word_table.currentIndex()
+        if not index.isValid():
             QMessageBox.warning(self, "선택 오류", "먼저 목록에서 단어를 선택해주세요.")
             return None
-            
-        row = selected_rows[0].row()
-        word_id_item = self.word_table.item(row, 0)
-        
-        try:
-            return int(word_id_item.text())
-        except Exception:
-            return None
+
+        # 모델이 UserRole로 내주는 int를 그대로 사용 (텍스트 파싱 없음)
+        return index.data(Qt.UserRole)
+
+    def _schedule_search(self, _text: str):
+        """ 키 입력마다 쿼리하지 않고 디바운스 타이머를 재시작합니다. """
+        self._search_timer.start()
 
     def _search_words(self):
-        """ 검색 입력 값으로 단어를 검색하고 테이블을 업데이트합니다. """
-        keyword = self.search_input.text().strip()
-        
-        if keyword:
-            search_results = self.controller.search_words(keyword, search_by='all')
-            self._load_words(search_results)
-        else:
-            self._load_words() 
-            
-        # 검색 후 카테고리 필터를 '전체 카테고리'로 리셋
-        self.category_combo.setCurrentIndex(0) 
+        """ 검색 입력 값을 프록시 필터에 반영합니다. (DB 재조회 없음) """
+        self._search_timer.stop() # returnPressed 등 즉시 실행 시 예약된 중복 검색 취소
+        keyword = self.search_input.text()
+
+        # 검색 시 카테고리 필터는 '전체 카테고리'로 리셋 (시그널 차단 후 프록시에 직접 반영)
+        self.category_combo.blockSignals(True)
+        self.category_combo.setCurrentIndex(0)
+        self.category_combo.blockSignals(False)
+        self.word_proxy.set_category('')
+
+        self.word_proxy.set_keyword(keyword)
 
     def _filter_by_category(self, index: int):
-        """ 카테고리 콤보 박스 값 변경 시 단어 목록을 필터링합니다. """
+        """ 카테고리 콤보 박스 값 변경을 프록시 필터에 반영합니다. (DB 재조회 없음) """
         category = self.category_combo.currentText()
+        # 검색창 비우기가 디바운스 검색을 예약해 필터 결과를 덮지 않도록 차단
+        self.search_input.blockSignals(True)
         self.search_input.clear()
+        self.search_input.blockSignals(False)
+        self._search_timer.stop()
+
+        self.word_proxy.set_keyword('')
+        self.word_proxy.set_category('' if category == "전체 카테고리" else category)
 
-        if category == "전체 카테고리":
-            self._load_words()
-        else:
-            filtered_words = self.controller.get_words_by_category(category)
-            self._load_words(filtered_words)
+    # --- CRUD 버튼 액션 ---
 
-    # --- CRUD 버튼 액션 (다이얼로그 구현 전 임시) ---
+    def _on_word_saved(self):
+        """ 다이얼로그 저장 완료 시 목록/카테고리를 새로고침합니다. """
+        self._load_words()
+        self._load_categories()
 
     def _add_word_dialog(self):
         """ 단어 추가 다이얼로그를 열고 완료 후 목록을 새로고침합니다. """
-        # TODO: WordEditDialog 구현 후 연동
-        QMessageBox.information(self, "기능 예정", "단어 추가 다이얼로그가 곧 구현됩니다.")
+        # 다이얼로그 모듈은 첫 CRUD 액션 시점에 로드 (시작 시 임포트 비용 제거)
+        from views.word_edit_dialog import WordEditDialog
+
+        dlg = WordEditDialog(self.controller, parent=self)
+        dlg.word_saved.connect(self._on_word_saved)
+        if dlg.exec_() == dlg.Accepted:
+            self.stats_delta.emit({'total_words': 1}) # 상태 바 증분 반영
 
     def _update_word_dialog(self):
         """ 선택된 단어의 수정 다이얼로그를 엽니다. """
         word_id = self._get_selected_word_id()
         if word_id is None:
             return
-            
-        # TODO: WordEditDialog 구현 후 연동
-        QMessageBox.information(self, "기능 예정", f"단어 ID {word_id} 수정 다이얼로그가 곧 구현됩니다.")
+
+        from views.word_edit_dialog import WordEditDialog
+
+        # 테이블 모델이 이미 들고 있는 행을 전달해 DB 재조회를 생략
+        source_index = self.word_proxy.mapToSource(self.word_table.currentIndex())
+        prefetched = self.word_model.row_at(source_index.row())
+
+        dlg = WordEditDialog(self.controller, word_id=word_id,
+                             prefetched=prefetched, parent=self)
+        dlg.word_saved.connect(self._on_word_saved)
+        dlg.exec_()
             
     def _delete_word(self):
         """ 선택된 단어를 논리적으로 삭제합니다. """
@@ -234,6 +468,7 @@ class WordManagementView(QWidget):
                 QMessageBox.information(self, "삭제 완료", "단어가 성공적으로 삭제되었습니다.")
                 self._load_words() # 목록 새로고침
                 self._load_categories() # 카테고리 목록 새로고침
+                self.stats_delta.emit({'total_words': -1}) # 상태 바 증분 반영
             else:
                 QMessageBox.critical(self, "삭제 실패", "단어 삭제에 실패했습니다. 로그를 확인하세요.")
 